@@ -0,0 +1,176 @@
+"""
+Reproducible benchmarks of the profit maximizer: parsing, solving and end-to-end throughput.
+
+Usage (from the root of the repository, with the package installed):
+    $ python benchmarks/benchmark.py --output benchmark.json
+    $ python benchmarks/benchmark.py --quick
+
+Every workload is generated from the seed, so that the JSON outputs of two commits can be compared.
+"""
+from contextlib import redirect_stdout
+from profit_maximizer import CaseHandler
+from profit_maximizer.batch_profit_solver import BatchProfitSolver
+from profit_maximizer.case import Case
+from profit_maximizer.case_reader import CaseReader
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.li_chao_profit_solver import LiChaoProfitSolver
+from profit_maximizer.monotone_profit_solver import MonotoneProfitSolver
+from profit_maximizer.profit_solver import ProfitSolver
+from profit_maximizer.quadratic_profit_solver import QuadraticProfitSolver
+from profit_maximizer.recursive_profit_solver import RecursiveProfitSolver
+from profit_maximizer.workload_generator import DISTRIBUTIONS, generate_case, write_text
+
+import argparse
+import io
+import json
+import numpy as np
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+# Largest number of machines given to each solver, and keyword arguments of its solver() method
+SOLVERS = {
+    "ProfitSolver": (ProfitSolver, 10, {"maximum_number_of_acquisitions": 3}),
+    "RecursiveProfitSolver": (RecursiveProfitSolver, 10**4, {}),
+    "QuadraticProfitSolver": (QuadraticProfitSolver, 10**4, {}),
+    "HullProfitSolver": (HullProfitSolver, 10**5, {}),
+    "LiChaoProfitSolver": (LiChaoProfitSolver, 10**5, {}),
+    "MonotoneProfitSolver": (MonotoneProfitSolver, 10**5, {}),
+}
+MACHINE_SIZES = [10, 100, 1000, 10**4, 10**5]
+CASE_COUNTS = [1, 10, 100, 1000, 10**4]
+# Number of machines of each case of the multi-case workloads
+MACHINES_PER_CASE = 20
+
+def measure(function, repeat):
+    """
+    Times a function and measures its peak memory
+    inputs:
+        <function> :: Callable - function without arguments
+        <repeat> :: Int - number of timed runs, the fastest one is kept
+    outputs:
+        <out> :: Dict - best time in seconds and peak memory in bytes (from an extra traced run)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": min(timings), "peak_memory_bytes": peak_memory}
+
+def solve(solver, case, arguments):
+    """
+    Solves a case with a solver class
+    """
+    result = solver(case)
+    result.solver(**arguments)
+    return result.maximum_profit
+
+def run(seed=0, repeat=3, machine_sizes=MACHINE_SIZES, case_counts=CASE_COUNTS, distribution="uniform"):
+    """
+    Runs the benchmarks
+    inputs:
+        <seed> :: Int - seed of the workloads
+        <repeat> :: Int - number of timed runs per benchmark
+        <machine_sizes> :: List<Int> - numbers of machines of the single-case workloads
+        <case_counts> :: List<Int> - numbers of cases of the multi-case workloads
+        <distribution> :: String - distribution of the machines, see workload_generator.DISTRIBUTIONS
+    outputs:
+        <out> :: List<Dict> - one record per benchmark
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        # Single large cases: parser and each solver up to its size limit
+        for number_of_machines in machine_sizes:
+            generator = np.random.default_rng([seed, number_of_machines])
+            case_context, machines = generate_case(generator, number_of_machines, distribution, 10**9)
+            filename = os.path.join(directory, f"machines_{number_of_machines}.txt")
+            write_text(filename, [(case_context, machines)])
+            workload = {"machines": number_of_machines, "cases": 1, "distribution": distribution}
+            results.append({"benchmark": "parse", **workload, **measure(lambda: list(CaseReader(filename)), repeat)})
+            case = Case.from_values(case_context, machines.reshape(-1))
+            for name, (solver, maximum_size, arguments) in SOLVERS.items():
+                if number_of_machines <= maximum_size:
+                    results.append({
+                        "benchmark": "solve", "solver": name, **workload,
+                        **measure(lambda: solve(solver, case, arguments), repeat)
+                    })
+        # Many small cases: parser, batched solver and whole CaseHandler runs
+        for number_of_cases in case_counts:
+            generator = np.random.default_rng([seed, number_of_cases, MACHINES_PER_CASE])
+            cases = [generate_case(generator, MACHINES_PER_CASE, distribution, 10**9) for _ in range(number_of_cases)]
+            filename = os.path.join(directory, f"cases_{number_of_cases}.txt")
+            write_text(filename, cases)
+            workload = {"machines": MACHINES_PER_CASE, "cases": number_of_cases, "distribution": distribution}
+            results.append({"benchmark": "parse", **workload, **measure(lambda: list(CaseReader(filename)), repeat)})
+            parsed_cases = list(CaseReader(filename))
+            results.append({
+                "benchmark": "solve", "solver": "BatchProfitSolver", **workload,
+                **measure(lambda: BatchProfitSolver(parsed_cases).solver(), repeat)
+            })
+            results.append({
+                "benchmark": "solve", "solver": "HullProfitSolver", **workload,
+                **measure(lambda: [solve(HullProfitSolver, case, {}) for case in parsed_cases], repeat)
+            })
+            # Default CaseHandler, then without the pre-filter of the large cases
+            for prefilter in [True, False]:
+                handler = CaseHandler(filename, prefilter=prefilter)
+                with redirect_stdout(io.StringIO()):
+                    results.append({
+                        "benchmark": "end_to_end", "prefilter": prefilter, **workload,
+                        **measure(handler.content_handler, repeat)
+                    })
+    for result in results:
+        if "cases" in result:
+            result["cases_per_second"] = result["cases"]/result["seconds"] if result["seconds"] else None
+    return results
+
+def metadata(seed, repeat):
+    """
+    Describes the environment of a run
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "seed": seed,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of the profit maximizer")
+    parser.add_argument("--output", help="path of the JSON output (default: standard output)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--distribution", choices=list(DISTRIBUTIONS), default="uniform", help="distribution of the machines")
+    parser.add_argument("--quick", action="store_true", help="only the workloads up to 10**3 machines/cases")
+    arguments = parser.parse_args()
+    machine_sizes = [n for n in MACHINE_SIZES if not arguments.quick or n <= 1000]
+    case_counts = [n for n in CASE_COUNTS if not arguments.quick or n <= 1000]
+    report = {
+        "metadata": metadata(arguments.seed, arguments.repeat),
+        "results": run(arguments.seed, arguments.repeat, machine_sizes, case_counts, arguments.distribution),
+    }
+    if arguments.output:
+        with open(arguments.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
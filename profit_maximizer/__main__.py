@@ -0,0 +1,189 @@
+"""
+Command-line entry point: solves the cases of a file, or of the standard input, as they are read.
+
+Usage:
+    $ python -m profit_maximizer tests/inputs/input.txt
+    $ zcat cases.txt.gz | python -m profit_maximizer --jsonl > results.jsonl
+    $ profit_maximizer cases.txt.xz --workers 4 --output results.txt
+    $ profit_maximizer cases.txt --convert cases.bin && profit_maximizer cases.bin
+    $ profit_maximizer cases.txt --plan --jsonl
+
+Compressed inputs (gzip, bz2, xz) are recognized from their first bytes, whether read from a path or a pipe,
+and so are binary case files, which are memory-mapped from their path.
+"""
+from .binary_case_file import BinaryCaseFile
+from .case_reader import CaseReader
+from .instrumentation import tracing
+from .profit_maximizer import CaseHandler, records_plan
+from .solver_registry import AUTO, SOLVERS, resolve_solver
+from contextlib import nullcontext
+from importlib import import_module
+
+import argparse
+import io
+import sys
+
+# Size in bytes of the buffer the results are written through
+BUFFER_SIZE = 2**20
+# Leading bytes of the compressed formats, and the module decompressing them
+MAGIC_NUMBERS = ((b"\x1f\x8b", "gzip"), (b"BZh", "bz2"), (b"\xfd7zXZ\x00", "lzma"))
+
+def compression(head):
+    """
+    Recognizes the compression of an input from its first bytes
+    inputs:
+        <head> :: Bytes - first bytes of the input
+    outputs:
+        <out> :: String - name of the module decompressing the input, None if not compressed
+    """
+    for magic_number, module in MAGIC_NUMBERS:
+        if head.startswith(magic_number):
+            return module
+    return None
+
+def open_input(filename):
+    """
+    Opens the input of the cases, decompressing it if needed. The standard input is never closed.
+    inputs:
+        <filename> :: String - path of the input file, "-" for the standard input
+    outputs:
+        <out> :: ContextManager - binary file object
+    """
+    if filename == "-":
+        stream = sys.stdin.buffer
+        # Looks at the first bytes of the pipe without consuming them
+        peek = getattr(stream, "peek", None)
+        module = compression(peek(6)) if peek else None
+        if module is None:
+            return nullcontext(stream)
+        # Closing the decompressing file leaves the standard input open
+        return import_module(module).open(stream, "rb")
+    with open(filename, "rb") as f:
+        module = compression(f.read(6))
+    return open(filename, "rb") if module is None else import_module(module).open(filename, "rb")
+
+def open_output(filename):
+    """
+    Opens the output of the results with a large buffer. The standard output is never closed.
+    inputs:
+        <filename> :: String - path of the output file, None for the standard output
+    outputs:
+        <out> :: ContextManager - text file object
+    """
+    if filename is not None:
+        return open(filename, "w", buffering=BUFFER_SIZE)
+    sys.stdout.flush()
+    try:
+        return open(sys.stdout.fileno(), "w", buffering=BUFFER_SIZE, closefd=False)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # Standard output replaced by an object without file descriptor
+        return nullcontext(sys.stdout)
+
+def format_text(case_number, result, plan=None):
+    """
+    Formats the result of a case as a line of text
+    inputs:
+        <case_number> :: Int - number of the case, from 1
+        <result> :: Int (maximum profit) or String (error message)
+        <plan> :: List<List<Int>> - machines bought (D2, P, R, G) in order of acquisition, None if not recorded
+    outputs:
+        <out> :: String - "Case k: X" line, followed by ", plan: [...]" if the plan is given
+    """
+    if plan is None:
+        return f"Case {case_number}: {result}\n"
+    return f"Case {case_number}: {result}, plan: {plan}\n"
+
+def format_jsonl(case_number, result, plan=None):
+    """
+    Formats the result of a case as a JSON line
+    inputs:
+        <case_number> :: Int - number of the case, from 1
+        <result> :: Int (maximum profit) or String (error message)
+        <plan> :: List<List<Int>> - machines bought (D2, P, R, G) in order of acquisition, None if not recorded
+    outputs:
+        <out> :: String - {"case": k, "maximum_profit": X} or {"case": k, "error": ...} line, with
+        a "plan" key if the plan is given
+    """
+    import json
+    key = "error" if isinstance(result, str) else "maximum_profit"
+    record = {"case": case_number, key: result}
+    if plan is not None:
+        record["plan"] = plan
+    return json.dumps(record) + "\n"
+
+def parse_arguments(argv=None):
+    """
+    Parses the command-line arguments
+    inputs:
+        <argv> :: List<String> - arguments, defaults to sys.argv[1:]
+    outputs:
+        <out> :: argparse.Namespace
+    """
+    parser = argparse.ArgumentParser(
+        prog="profit_maximizer",
+        description="Solves the cases of the input and writes the maximum profit of each case"
+    )
+    parser.add_argument("input", nargs="?", default="-",
+                        help="path of the input file, possibly compressed (default: standard input)")
+    parser.add_argument("-o", "--output", help="path of the output file (default: standard output)")
+    parser.add_argument("--jsonl", action="store_true",
+                        help='writes one JSON object per case, {"case": k, "maximum_profit": X} or {"case": k, "error": ...}')
+    parser.add_argument("--workers", type=int, help="number of worker processes solving cases in parallel")
+    parser.add_argument("--solver", choices=[AUTO, *SOLVERS], default=AUTO,
+                        help="solver of every case (default: chosen case by case)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="solves the machines with the LiChaoProfitSolver while they are read")
+    parser.add_argument("--plan", action="store_true",
+                        help="also writes the machines bought in each case, in order of acquisition")
+    parser.add_argument("--stats", help="path of the JSON lines file receiving per-case statistics")
+    parser.add_argument("--cache", help="path of the result cache looked up before solving a case")
+    parser.add_argument("--convert", metavar="BINARY_FILE",
+                        help="converts the input into a binary case file instead of solving it")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Runs the command line
+    inputs:
+        <argv> :: List<String> - arguments, defaults to sys.argv[1:]
+    outputs:
+        <out> :: Int - exit status
+    """
+    arguments = parse_arguments(argv)
+    if arguments.plan and not records_plan(resolve_solver(arguments.solver)):
+        print(f"profit_maximizer: error: {arguments.solver} does not record plans", file=sys.stderr)
+        return 2
+    format_result = format_jsonl if arguments.jsonl else format_text
+    try:
+        with open_input(arguments.input) as f:
+            if arguments.convert is not None:
+                BinaryCaseFile.write(arguments.convert, CaseReader(f))
+                return 0
+            # Binary case files are memory-mapped instead of read through the stream
+            source = arguments.input if BinaryCaseFile.recognizes(arguments.input) else f
+            with open_output(arguments.output) as output:
+                handler = CaseHandler(
+                    source, instrument=arguments.stats is not None, cache=arguments.cache, solver=arguments.solver,
+                    plan=arguments.plan
+                )
+                # Memory allocations are traced for the whole run when statistics are collected
+                with tracing(handler.instrument):
+                    results = handler.solved_cases(streaming=arguments.streaming, workers=arguments.workers)
+                    for case_number, result in enumerate(results, 1):
+                        plan = handler.plans[case_number-1] if arguments.plan else None
+                        output.write(format_result(case_number, result, plan))
+        if arguments.stats is not None:
+            handler.export_stats(arguments.stats)
+        if handler.cache is not None:
+            handler.cache.close()
+    except BrokenPipeError:
+        # The reader of the output exited (e.g. "| head"): the remaining results are not needed
+        sys.stdout = None
+        return 1
+    except OSError as error:
+        print(f"profit_maximizer: error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import numpy as np
+
+class BatchProfitSolver:
+    """
+    Profit Solver running the quadratic DP of many small cases at once on padded 2-D arrays
+
+    Row b of each array holds the machines of case b sorted by day. For each column j, dp[b, j] is the
+    maximum of C and of the lines G_i*D_j + (R_i - P_i + dp_i - G_i*(D_i+1)) of the affordable machines
+    i of the row with D_i < D_j, computed for all rows with whole-array operations. Values stay below
+    ~3*10**18, so int64 arithmetic is exact within the bounds of the instructions.
+    """
+    def __init__(self, cases, group_size=256):
+        """
+        Initializes the BatchProfitSolver object
+        inputs:
+            <cases> :: List<Case> - cases to solve
+            <group_size> :: Int - number of cases of similar sizes padded together
+        outputs:
+            None
+        """
+        self.cases = cases
+        self.group_size = group_size
+        self.maximum_profits = np.array([case.cash_at_hand for case in cases], dtype=np.int64)
+        # Counter of the operations performed by the solver, set when the CaseHandler is instrumented
+        self.counters = None
+
+    def solve_group(self, cases):
+        """
+        Solves a group of cases padded to the size of the largest one
+        inputs:
+            <cases> :: List<Case> - cases to solve
+        outputs:
+            <out> :: np.ndarray<Int64> - maximum profit of each case
+        """
+        number_of_machines = max(len(case) for case in cases)
+        shape = (len(cases), number_of_machines)
+        if self.counters is not None:
+            self.counters["groups"] += 1
+            self.counters["padded_machines"] += len(cases)*number_of_machines
+        day, price, resell, profit = (np.zeros(shape, dtype=np.int64) for _ in range(4))
+        valid = np.zeros(shape, dtype=bool)
+        for b, case in enumerate(cases):
+            n = len(case)
+            day[b, :n], price[b, :n], resell[b, :n], profit[b, :n] = case.day, case.price, case.resell, case.profit
+            valid[b, :n] = True
+        cash_at_hand = np.array([case.cash_at_hand for case in cases], dtype=np.int64)
+        end_of_restructuring = np.array([case.number_of_restructuring_days+1 for case in cases], dtype=np.int64)
+        intercept = np.zeros(shape, dtype=np.int64)
+        affordable = np.zeros(shape, dtype=bool)
+        for j in range(number_of_machines):
+            dp = cash_at_hand
+            if j:
+                x = day[:, j:j+1]
+                lines = profit[:, :j]*x + intercept[:, :j]
+                usable = affordable[:, :j] & (day[:, :j] < x)
+                dp = np.maximum(dp, np.where(usable, lines, cash_at_hand[:, None]).max(axis=1))
+            affordable[:, j] = valid[:, j] & (dp >= price[:, j])
+            intercept[:, j] = dp - price[:, j] + resell[:, j] - profit[:, j]*(day[:, j]+1)
+        lines = profit*end_of_restructuring[:, None] + intercept
+        return np.maximum(cash_at_hand, np.where(affordable, lines, cash_at_hand[:, None]).max(axis=1))
+
+    def solver(self):
+        """
+        Solves the cases by groups of similar sizes
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: np.ndarray<Int64> - maximum profit of each case, in the order of the cases
+        """
+        order = sorted((i for i, case in enumerate(self.cases) if len(case)), key=lambda i: len(self.cases[i]))
+        for start in range(0, len(order), self.group_size):
+            group = order[start:start+self.group_size]
+            self.maximum_profits[group] = self.solve_group([self.cases[i] for i in group])
+        return self.maximum_profits
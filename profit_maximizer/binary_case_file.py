@@ -0,0 +1,130 @@
+from .case import Case
+from .case_reader import CaseReader
+from os import path
+
+import numpy as np
+
+class BinaryCaseFile:
+    """
+    Packed binary container of cases, memory-mapped so that each case is a set of views on the file.
+
+    Layout, made of little-endian int64 words:
+        - header (4 words): magic number b"ACMCASES", format version, number of cases, byte offset of the table
+        - machine records: per case, the D2 values of its machines, then their P, R and G values
+          (machines available during the restructuring only, sorted by day, as in a Case)
+        - offset table (5 words per case): N, C, D1, word offset of the records of the case and
+          number of machines recorded, -1 for a case that was not parsed
+
+    The table is written after the records, so that a text file can be converted in a single pass.
+    """
+    MAGIC_NUMBER = b"ACMCASES"
+    VERSION = 1
+    HEADER_WORDS = 4
+    TABLE_COLUMNS = 5
+
+    def __init__(self, filename):
+        """
+        Memory-maps a binary case file, reading only its header and table
+        inputs:
+            <filename> :: String - path of the binary case file
+        outputs:
+            None
+        """
+        self.filename = filename
+        data = np.memmap(filename, dtype="<i8", mode="r")
+        if len(data) < self.HEADER_WORDS or data[:1].tobytes() != self.MAGIC_NUMBER:
+            raise ValueError(f"{filename} is not a binary case file")
+        version, number_of_cases, table_offset = data[1:self.HEADER_WORDS].tolist()
+        if version != self.VERSION:
+            raise ValueError(f"{filename}: unsupported binary case format version {version}")
+        table_start = table_offset // 8
+        if table_start + number_of_cases*self.TABLE_COLUMNS != len(data):
+            raise ValueError(f"{filename}: truncated binary case file")
+        # Plain ndarray views on the mapped file
+        self.data = data.view(np.ndarray)
+        self.table = self.data[table_start:].reshape(number_of_cases, self.TABLE_COLUMNS)
+
+    @classmethod
+    def recognizes(cls, filename):
+        """
+        Checks whether a file is a binary case file from its magic number
+        inputs:
+            <filename> :: String - path of the file
+        outputs:
+            <out> :: Bool
+        """
+        if not isinstance(filename, str) or not path.isfile(filename):
+            return False
+        with open(filename, "rb") as f:
+            return f.read(len(cls.MAGIC_NUMBER)) == cls.MAGIC_NUMBER
+
+    @classmethod
+    def write(cls, filename, cases):
+        """
+        Writes cases to a binary case file, one case at a time
+        inputs:
+            <filename> :: String - path of the binary case file
+            <cases> :: Iterable<Case> - cases to write, None for a case that was not parsed
+        outputs:
+            <out> :: Int - number of cases written
+        """
+        table = []
+        position = cls.HEADER_WORDS
+        with open(filename, "wb") as f:
+            f.write(bytes(8*cls.HEADER_WORDS))
+            for case in cases:
+                if case is None:
+                    table.append((0, 0, 0, 0, -1))
+                    continue
+                records = np.stack((case.day, case.price, case.resell, case.profit)).astype("<i8")
+                f.write(records.tobytes())
+                table.append((*case.case_context, position, len(case)))
+                position += records.size
+            f.write(np.array(table, dtype="<i8").reshape(-1, cls.TABLE_COLUMNS).tobytes())
+            f.seek(0)
+            f.write(cls.MAGIC_NUMBER)
+            f.write(np.array([cls.VERSION, len(table), 8*position], dtype="<i8").tobytes())
+        return len(table)
+
+    @classmethod
+    def convert(cls, text_filename, binary_filename):
+        """
+        Converts an input file of the text format into a binary case file
+        inputs:
+            <text_filename> :: String - path of the text input file
+            <binary_filename> :: String - path of the binary case file
+        outputs:
+            <out> :: Int - number of cases converted
+        """
+        return cls.write(binary_filename, CaseReader(text_filename))
+
+    def __len__(self):
+        """
+        Number of cases of the file
+        """
+        return len(self.table)
+
+    def __getitem__(self, index):
+        """
+        Returns a case whose machine arrays are views on the mapped file (read-only)
+        inputs:
+            <index> :: Int - index of the case, from 0
+        outputs:
+            <out> :: Case - case, None if it was not parsed
+        """
+        number_of_machines, cash_at_hand, restructuring_days, offset, count = self.table[index].tolist()
+        if count < 0:
+            return None
+        day, price, resell, profit = self.data[offset:offset+4*count].reshape(4, count)
+        return Case([number_of_machines, cash_at_hand, restructuring_days], day, price, resell, profit)
+
+    def __iter__(self):
+        """
+        Iterates over the cases of the file
+        inputs:
+            None
+        outputs:
+            <out> :: Yields a Case - case, None if it was not parsed
+        """
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,111 @@
+import numpy as np
+
+class Case:
+    """
+    Compact structure-of-arrays representation of a case: the machines available during the
+    restructuring (D2 <= D1), sorted by day, as four int64 arrays
+    """
+    def __init__(self, case_context, day, price, resell, profit):
+        """
+        Initializes the Case object
+        inputs:
+            <case_context> :: List<Int> - context of case (N, C, D1)
+            <day> :: np.ndarray<Int64> - day of availability D2 of each machine, sorted
+            <price> :: np.ndarray<Int64> - acquisition price P of each machine
+            <resell> :: np.ndarray<Int64> - resell price R of each machine
+            <profit> :: np.ndarray<Int64> - daily profit G of each machine
+        N: number of machines, C: cash at hand, D1: days of restructuring
+        outputs:
+            None
+        """
+        self.number_of_machines = case_context[0]
+        self.cash_at_hand = case_context[1]
+        self.number_of_restructuring_days = case_context[2]
+        self.day = day
+        self.price = price
+        self.resell = resell
+        self.profit = profit
+
+    @classmethod
+    def from_values(cls, case_context, values):
+        """
+        Builds a Case from the flat values of the machine lines, keeping the machines available
+        during the restructuring and sorting them by day (ties keep the input order)
+        inputs:
+            <case_context> :: List<Int> - context of case (N, C, D1)
+            <values> :: np.ndarray<Int64> - D2, P, R, G of each machine, one after the other
+        outputs:
+            <out> :: Case
+        """
+        machines = np.asarray(values, dtype=np.int64).reshape(-1, 4)
+        machines = machines[machines[:, 0] <= case_context[2]]
+        machines = machines[np.argsort(machines[:, 0], kind="stable")]
+        # One contiguous row per characteristic
+        day, price, resell, profit = np.ascontiguousarray(machines.T)
+        return cls(case_context, day, price, resell, profit)
+
+    @classmethod
+    def from_machines(cls, case_context, machines):
+        """
+        Builds a Case from a list of machine descriptions
+        inputs:
+            <case_context> :: List<Int> - context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G)
+        outputs:
+            <out> :: Case
+        """
+        return cls.from_values(case_context, np.array(machines, dtype=np.int64).reshape(-1))
+
+    @classmethod
+    def build(cls, case_context, machines=None):
+        """
+        Returns the Case given to a solver either directly or as a context and a list of machines
+        inputs:
+            <case_context> :: Case or List<Int> - context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+        outputs:
+            <out> :: Case
+        """
+        if isinstance(case_context, cls):
+            return case_context
+        return cls.from_machines(case_context, machines if machines is not None else [])
+
+    @property
+    def case_context(self):
+        """
+        Context of case (N, C, D1)
+        """
+        return [self.number_of_machines, self.cash_at_hand, self.number_of_restructuring_days]
+
+    def dtype(self):
+        """
+        Chooses int64 when no cash amount of the case can reach 2**62, Python integers otherwise.
+        Besides the daily profits, every machine resold above its price can add R - P to the cash.
+        outputs:
+            <out> :: np.dtype - type of arrays holding exact cash amounts
+        """
+        if not len(self):
+            return np.dtype(np.int64)
+        bound = (
+            self.cash_at_hand + int(self.price.max()) + int(self.resell.max())
+            + 2*int(self.profit.max())*(self.number_of_restructuring_days+1)
+            + len(self)*max(int((self.resell - self.price).max()), 0)
+        )
+        return np.dtype(np.int64) if bound < 2**62 else np.dtype(object)
+
+    def machines(self):
+        """
+        Returns the machines as a list of machine descriptions
+        outputs:
+            <out> :: List<List<Int>> - List of machine descriptions (D2, P, R, G) sorted by day
+        """
+        return np.stack((self.day, self.price, self.resell, self.profit), axis=1).tolist()
+
+    def __len__(self):
+        """
+        Number of machines available during the restructuring
+        """
+        return len(self.day)
+
+    def __repr__(self):
+        return f"Case({self.case_context}, {self.machines()})"
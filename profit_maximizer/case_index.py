@@ -0,0 +1,232 @@
+from .case_reader import CaseReader
+
+import numpy as np
+import os
+
+class CaseIndex:
+    """
+    Sidecar index of a text input file, locating each case without reading the cases before it.
+
+    Built in a single scan that finds the line feeds of the file in bulk and parses the context
+    lines only, mirroring the CaseReader: each row holds the byte offset of the context line of a
+    case, its line number (from 1, as used by CaseHandler.case_caching) and the number of machine
+    lines of the case (-1 if the context line is not parsed, the case is then that line alone).
+    A last row holds the byte offset and line number where the cases end.
+
+    Saved next to the input as <filename>.idx, made of little-endian int64 words:
+        - header (5 words): magic number b"ACMINDEX", format version, size and modification time
+          (ns) of the input when indexed, number of rows
+        - rows (3 words per row)
+    An index whose size or modification time does not match the input is built again.
+    """
+    MAGIC_NUMBER = b"ACMINDEX"
+    VERSION = 1
+    HEADER_WORDS = 5
+    SUFFIX = ".idx"
+
+    def __init__(self, filename, rows, signature):
+        """
+        Initializes the CaseIndex object
+        inputs:
+            <filename> :: String - path of the text input file
+            <rows> :: np.ndarray<Int64> - rows (byte offset, line number, number of machines) of the
+            cases, then the end of the cases
+            <signature> :: Tuple(Int, Int) - size and modification time (ns) of the input when indexed
+        outputs:
+            None
+        """
+        self.filename = filename
+        self.rows = rows
+        self.signature = signature
+        self.offsets, self.lines, self.counts = rows.T
+
+    @classmethod
+    def open(cls, filename):
+        """
+        Loads the index of an input file, building and saving it if it is missing or out of date
+        inputs:
+            <filename> :: String - path of the text input file
+        outputs:
+            <out> :: CaseIndex
+        """
+        index = cls.load(filename)
+        if index is None:
+            index = cls.build(filename)
+            index.save()
+        return index
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Loads the saved index of an input file
+        inputs:
+            <filename> :: String - path of the text input file
+        outputs:
+            <out> :: CaseIndex - None if the index is missing, invalid or out of date
+        """
+        try:
+            words = np.fromfile(filename + cls.SUFFIX, dtype="<i8")
+        except (OSError, ValueError):
+            return None
+        if len(words) < cls.HEADER_WORDS or words[:1].tobytes() != cls.MAGIC_NUMBER:
+            return None
+        version, size, modification_time, number_of_rows = words[1:cls.HEADER_WORDS].tolist()
+        if version != cls.VERSION or len(words) != cls.HEADER_WORDS + 3*number_of_rows:
+            return None
+        index = cls(filename, words[cls.HEADER_WORDS:].reshape(number_of_rows, 3), (size, modification_time))
+        return index if index.is_current() else None
+
+    @staticmethod
+    def file_signature(filename):
+        """
+        Size and modification time (ns) of an input file, checked before using its index
+        """
+        status = os.stat(filename)
+        return status.st_size, status.st_mtime_ns
+
+    def is_current(self):
+        """
+        Checks the input file was not modified since it was indexed
+        """
+        return self.file_signature(self.filename) == self.signature
+
+    def save(self):
+        """
+        Writes the index next to its input file. An index that cannot be written is kept in memory only.
+        inputs:
+            None
+        outputs:
+            <out> :: Bool - True if the index was written
+        """
+        header = np.array([0, self.VERSION, *self.signature, len(self.rows)], dtype="<i8")
+        temporary_filename = f"{self.filename}{self.SUFFIX}.{os.getpid()}"
+        try:
+            with open(temporary_filename, "wb") as f:
+                f.write(self.MAGIC_NUMBER)
+                f.write(header[1:].tobytes())
+                f.write(self.rows.astype("<i8").tobytes())
+            # Concurrent runs never read a partial index
+            os.replace(temporary_filename, self.filename + self.SUFFIX)
+        except OSError:
+            if os.path.exists(temporary_filename):
+                os.remove(temporary_filename)
+            return False
+        return True
+
+    @classmethod
+    def build(cls, filename, chunk_size=2**24):
+        """
+        Scans an input file once to locate its cases
+        inputs:
+            <filename> :: String - path of the text input file
+            <chunk_size> :: Int - number of bytes searched for line feeds at once
+        outputs:
+            <out> :: CaseIndex
+        """
+        signature = cls.file_signature(filename)
+        size = signature[0]
+        data = np.memmap(filename, dtype=np.uint8, mode="r") if size else np.zeros(0, dtype=np.uint8)
+        rows = []
+        # Line number of the next context line, and its byte offset once its line feed is found
+        line, start = 1, 0
+        # Number of line feeds before the chunk
+        line_feeds = 0
+        finished = False
+        for chunk_start in range(0, max(size, 1), chunk_size):
+            positions = np.flatnonzero(data[chunk_start:chunk_start+chunk_size] == ord("\n")) + chunk_start
+            last_chunk = chunk_start + chunk_size >= size
+            while True:
+                if start is None:
+                    # The line starts after the (line-1)-th line feed of the file
+                    position = line - 1 - line_feeds
+                    if position > len(positions):
+                        break
+                    start = int(positions[position-1]) + 1
+                if start >= size:
+                    break
+                position = line - line_feeds
+                if position <= len(positions):
+                    end = int(positions[position-1])
+                elif last_chunk:
+                    end = size
+                else:
+                    break
+                context_line = data[start:end].tobytes()
+                if context_line.rstrip(b"\r") == b"0 0 0":
+                    finished = True
+                    break
+                case_context = CaseReader.parse_context(context_line)
+                count = -1 if case_context is None else case_context[0]
+                rows.append((start, line, count))
+                line += 1 + max(count, 0)
+                start = None
+            if finished:
+                break
+            line_feeds += len(positions)
+        # The cases end at the "0 0 0" line, or at the end of the file
+        rows.append((size if start is None else min(start, size), line, 0))
+        return cls(filename, np.array(rows, dtype=np.int64), signature)
+
+    def __len__(self):
+        """
+        Number of cases of the file
+        """
+        return len(self.rows) - 1
+
+    def byte_range(self, cases):
+        """
+        Bytes of the file holding consecutive cases, e.g. to split the file among workers
+        inputs:
+            <cases> :: range - indices of the cases, from 0, with a step of 1
+        outputs:
+            <out> :: Tuple(Int, Int) - byte offsets of the first case and after the last case
+        """
+        cases = range(len(self))[cases.start:cases.stop]
+        return int(self.offsets[cases.start]), int(self.offsets[cases.stop])
+
+    def split(self, parts):
+        """
+        Splits the cases into consecutive ranges holding about the same number of bytes
+        inputs:
+            <parts> :: Int - number of ranges
+        outputs:
+            <out> :: List<range> - indices of the cases of each range, from 0
+        """
+        targets = np.linspace(self.offsets[0], self.offsets[-1], parts+1)[1:-1]
+        bounds = [0, *np.searchsorted(self.offsets[:-1], targets).tolist(), len(self)]
+        return [range(start, stop) for start, stop in zip(bounds, bounds[1:])]
+
+    def cases(self, indices):
+        """
+        Reads cases from the file, seeking to each of them
+        inputs:
+            <indices> :: Iterable<Int> - indices of the cases, from 0
+        outputs:
+            <out> :: Yields a Case - machines with D2 <= D1 sorted by day, None if the case is not parsed
+        """
+        with open(self.filename, "rb") as f:
+            for index in indices:
+                if not -len(self) <= index < len(self):
+                    raise IndexError(f"case index {index} out of range ({len(self)} cases)")
+                index %= len(self)
+                start, stop = int(self.offsets[index]), int(self.offsets[index+1])
+                f.seek(start)
+                lines = f.read(stop - start).split(b"\n")
+                # Drops the empty piece after the last line feed
+                if len(lines) > 1 and not lines[-1]:
+                    lines.pop()
+                case_context = CaseReader.parse_context(lines[0])
+                if case_context is None:
+                    yield None
+                    continue
+                yield CaseReader.parse_machines(case_context, lines[1:1+case_context[0]])
+
+    def __getitem__(self, index):
+        """
+        Reads a case from the file
+        inputs:
+            <index> :: Int - index of the case, from 0
+        outputs:
+            <out> :: Case - machines with D2 <= D1 sorted by day, None if the case is not parsed
+        """
+        return next(self.cases([index]))
@@ -0,0 +1,131 @@
+from .case import Case
+from bisect import bisect_left
+from collections import Counter
+
+import numpy as np
+
+class CasePrefilter:
+    """
+    Pre-filter stage between parsing and solving, removing the machines no best strategy needs:
+        - unaffordable: machines costing more than any cash ACM can hold on their day. The cash on
+          day x is at most C, plus the resale margins R - P > 0 of the machines of earlier days, plus
+          for each day t < x the largest G of the machines bought before t. Machines found unaffordable
+          no longer count in the bound, which is computed again while it removes a noticeable share of machines.
+        - dominated: machines for which another machine of the same day is not more expensive, has
+          a resale margin R - P and a daily profit G at least as high (duplicates keep one copy).
+          Buying the other machine instead always leaves at least as much cash.
+    """
+    # Largest number of passes of the affordability bound, and smallest share of the machines a pass
+    # has to remove for the next pass to run (every pass gives a valid bound)
+    MAXIMUM_PASSES = 8
+    MINIMUM_REMOVED_SHARE = 1/64
+
+    def __init__(self):
+        """
+        Initializes the CasePrefilter object
+        """
+        # Number of machines removed by each rule, over all the cases filtered
+        self.removed = Counter()
+
+    @staticmethod
+    def affordable_machines(case):
+        """
+        Bounds the cash at hand of each day to find the machines ACM can afford
+        inputs:
+            <case> :: Case - case with at least one machine
+        outputs:
+            <out> :: np.ndarray<Bool> - mask of the machines kept
+        """
+        dtype = case.dtype()
+        price, resell, profit = (a.astype(dtype) for a in (case.price, case.resell, case.profit))
+        # First index of each day, its day, and the group of each machine
+        starts = np.flatnonzero(np.diff(case.day, prepend=case.day[0]-1))
+        days = case.day[starts].astype(dtype)
+        groups = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(case))))
+        margin = np.maximum(resell - price, 0)
+        # Resale margins are all zero within the bounds of the instructions (R < P)
+        has_margin = bool(margin.any())
+        keep = np.ones(len(case), dtype=bool)
+        kept = len(case)
+        zero = np.zeros(1, dtype=dtype)
+        for _ in range(CasePrefilter.MAXIMUM_PASSES):
+            # Largest G bought up to each day
+            largest_profit = np.maximum.accumulate(np.maximum.reduceat(np.where(keep, profit, 0), starts))
+            # Profits of the days strictly between the first day and each day
+            accumulated = np.concatenate((zero, np.cumsum(np.diff(days)*largest_profit[:-1]) - largest_profit[:-1]))
+            bound = case.cash_at_hand + accumulated
+            if has_margin:
+                # Resale margins gained on the earlier days
+                margins = np.add.reduceat(np.where(keep, margin, 0), starts)
+                bound += np.concatenate((zero, np.cumsum(margins)[:-1]))
+            keep &= price <= bound[groups]
+            removed, kept = kept - int(keep.sum()), int(keep.sum())
+            if removed <= CasePrefilter.MINIMUM_REMOVED_SHARE*kept:
+                break
+        return keep
+
+    @staticmethod
+    def undominated_machines(case, keep):
+        """
+        Finds the machines that are not dominated by another machine of the same day
+        inputs:
+            <case> :: Case - case with at least one machine
+            <keep> :: np.ndarray<Bool> - mask of the machines considered, updated
+        outputs:
+            <out> :: np.ndarray<Bool> - mask of the machines kept
+        """
+        candidates = np.flatnonzero(keep)
+        day = case.day[candidates]
+        # Only the days with several machines can hold dominated machines
+        shared = np.zeros(len(candidates), dtype=bool)
+        shared[1:] |= day[1:] == day[:-1]
+        shared[:-1] |= day[1:] == day[:-1]
+        candidates = candidates[shared]
+        if not len(candidates):
+            return keep
+        margin = case.resell[candidates] - case.price[candidates]
+        # By day, then cheapest first, ties broken by the largest margin then the largest G
+        order = np.lexsort((-case.profit[candidates], -margin, case.price[candidates], case.day[candidates]))
+        current_day = None
+        for machine, day, margin, profit in zip(
+            candidates[order].tolist(), case.day[candidates][order].tolist(),
+            margin[order].tolist(), case.profit[candidates][order].tolist()
+        ):
+            if day != current_day:
+                # Staircase of the cheaper machines of the day not dominated: margins increasing, G decreasing
+                current_day, margins, profits = day, [], []
+            position = bisect_left(margins, margin)
+            # Among the machines with a margin at least as high, the first one has the largest G
+            if position < len(margins) and profits[position] >= profit:
+                keep[machine] = False
+                continue
+            # Replaces the steps the machine dominates: the same margin, or a lower margin and a lower G
+            first, last = position, position
+            if last < len(margins) and margins[last] == margin:
+                last += 1
+            while first > 0 and profits[first-1] <= profit:
+                first -= 1
+            margins[first:last] = [margin]
+            profits[first:last] = [profit]
+        return keep
+
+    def filter(self, case):
+        """
+        Removes the unaffordable and the dominated machines of a case
+        inputs:
+            <case> :: Case - case to filter
+        outputs:
+            <out> :: Tuple(<0>, <1>)
+                <0> :: Case - case keeping the machines that can be part of a best strategy
+                <1> :: Dict - number of machines removed by each rule
+        """
+        if not len(case):
+            return case, {"unaffordable": 0, "dominated": 0}
+        keep = self.affordable_machines(case)
+        affordable = int(keep.sum())
+        keep = self.undominated_machines(case, keep)
+        removed = {"unaffordable": len(case) - affordable, "dominated": affordable - int(keep.sum())}
+        self.removed.update(removed)
+        if affordable == len(case) and not removed["dominated"]:
+            return case, removed
+        return Case(case.case_context, case.day[keep], case.price[keep], case.resell[keep], case.profit[keep]), removed
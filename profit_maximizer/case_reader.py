@@ -0,0 +1,156 @@
+from .case import Case
+from contextlib import nullcontext
+from os import PathLike
+
+import numpy as np
+
+INT64_MAX = np.iinfo(np.int64).max
+
+class CaseReader:
+    """
+    Single-pass reader of an input file, iterating over its cases.
+
+    The file is read in large binary chunks split into lines, and the machine lines of a case are
+    validated and converted to integers in bulk, so that memory stays bounded by the largest case.
+    Mirrors the behaviour of CaseHandler.case_caching and CaseHandler.line_parser:
+        - a context line that does not hold 3 non-negative integers is skipped alone
+        - a case with a machine line that does not hold 4 non-negative integers is skipped whole
+        - reading stops at the end of the file or on a "0 0 0" line
+    """
+
+    def __init__(self, filename, chunk_size=2**20):
+        """
+        Initializes the CaseReader object
+        inputs:
+            <filename> :: String - relative path to file from current folder, or binary file object
+            (e.g. sys.stdin.buffer, gzip.open(...)) read up to its end and left open
+            <chunk_size> :: Int - number of bytes read from the file at once
+        outputs:
+            None
+        """
+        self.filename = filename
+        self.chunk_size = chunk_size
+
+    def open(self):
+        """
+        Opens the input file, or wraps the file object given so that it is not closed after reading
+        inputs:
+            None
+        outputs:
+            <out> :: ContextManager - binary file object
+        """
+        if isinstance(self.filename, (str, bytes, PathLike)):
+            return open(self.filename, "rb")
+        return nullcontext(self.filename)
+
+    def line_blocks(self):
+        """
+        Generator of lists of lines, receiving the number of lines wanted through send()
+        Yields fewer lines than requested only at the end of the file
+        inputs:
+            None
+        outputs:
+            <out> :: Yields a List<Bytes> - lines without their line feed
+        """
+        lines, position, carry = [], 0, b""
+        number_of_lines = yield None
+        with self.open() as f:
+            # read1 returns the bytes available without waiting for a full chunk, so that the cases
+            # coming from a pipe are yielded as soon as they are complete
+            read = getattr(f, "read1", f.read)
+            while True:
+                # Reads chunks until the block of lines is complete or the file is exhausted
+                while len(lines) - position < number_of_lines:
+                    chunk = read(self.chunk_size)
+                    if not chunk:
+                        if carry:
+                            lines.append(carry)
+                            carry = b""
+                        break
+                    lines = lines[position:]
+                    position = 0
+                    lines.extend((carry + chunk).split(b"\n"))
+                    carry = lines.pop()
+                block = lines[position:position+number_of_lines]
+                position += len(block)
+                number_of_lines = yield block
+
+    def __iter__(self):
+        """
+        Iterates over the cases of the input file
+        inputs:
+            None
+        outputs:
+            <out> :: Yields a Case - machines with D2 <= D1 sorted by day, None if the case is not parsed
+        """
+        blocks = self.line_blocks()
+        next(blocks)
+        while True:
+            first_line = blocks.send(1)
+            if first_line == [] or first_line[0].rstrip(b"\r") == b"0 0 0":
+                return
+            case_context = self.parse_context(first_line[0])
+            if case_context is None:
+                yield None
+                continue
+            yield self.parse_machines(case_context, blocks.send(case_context[0]))
+
+    @staticmethod
+    def parse_context(line):
+        """
+        Parses the context line of a case
+        inputs:
+            <line> :: Bytes - line without its line feed
+        outputs:
+            <out> :: List<Int> - context of case (N, C, D1), None if the line does not hold 3 non-negative integers
+        """
+        case_context = line.split()
+        if b"-" in line or len(case_context) != 3:
+            return None
+        try:
+            return list(map(int, case_context))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_machine(line):
+        """
+        Parses a single machine line, for the readers handling the machines one at a time
+        inputs:
+            <line> :: Bytes - line without its line feed
+        outputs:
+            <out> :: List<Int> - machine description (D2, P, R, G), None if the line does not hold
+            4 non-negative integers within the int64 range
+        """
+        values = line.split()
+        if b"-" in line or len(values) != 4:
+            return None
+        try:
+            machine = list(map(int, values))
+        except ValueError:
+            return None
+        return machine if max(machine) < INT64_MAX else None
+
+    @staticmethod
+    def parse_machines(case_context, machine_lines):
+        """
+        Parses the machine lines of a case
+        inputs:
+            <case_context> :: List<Int> - context of case (N, C, D1)
+            <machine_lines> :: List<Bytes> - lines read after the context line, fewer than N at the end of the file
+        outputs:
+            <out> :: Case - machines with D2 <= D1 sorted by day, None if a line does not hold 4 non-negative integers
+        """
+        # Every line must hold 4 values, then the whole block is converted at once
+        block = b" ".join(machine_lines)
+        if (len(machine_lines) != case_context[0] or b"-" in block
+                or set(map(len, map(bytes.split, machine_lines))) - {4}):
+            return None
+        try:
+            values = np.fromstring(block, dtype=np.int64, sep=" ")
+        except ValueError:
+            return None
+        # Values beyond the int64 range are saturated by the conversion
+        if len(values) and values.max() == INT64_MAX:
+            return None
+        return Case.from_values(case_context, values)
@@ -0,0 +1,293 @@
+"""
+Differential verification: solves seeded random cases with every solver and a brute-force oracle,
+shrinks any disagreement to a minimal failing case and reports the speed of each solver.
+
+Usage:
+    $ python -m profit_maximizer.differential --cases 5000 --seed 0
+    $ python -m profit_maximizer.differential --machines 10 --output fuzz.json
+
+The exit status is 1 when a solver disagrees with the oracle.
+"""
+from .batch_profit_solver import BatchProfitSolver
+from .case import Case
+from .case_prefilter import CasePrefilter
+from .hull_profit_solver import HullProfitSolver
+from .incremental_profit_solver import IncrementalProfitSolver
+from .li_chao_profit_solver import LiChaoProfitSolver
+from .machine_market import MachineMarket
+from .monotone_profit_solver import MonotoneProfitSolver
+from .profit_solver import ProfitSolver
+from .quadratic_profit_solver import QuadraticProfitSolver
+from .recursive_profit_solver import RecursiveProfitSolver
+from collections import Counter
+
+import argparse
+import json
+import numpy as np
+import time
+
+def brute_force(case):
+    """
+    Oracle: explores every sequence of machines bought on strictly increasing days, in O(2**N) time
+    inputs:
+        <case> :: Case - case to solve
+    outputs:
+        <out> :: Int - maximum profit of the case
+    """
+    machines = case.machines()
+    restructuring_days = case.number_of_restructuring_days
+    best = case.cash_at_hand
+    # Machine owned and the cash at hand after buying it
+    stack = [(machine, case.cash_at_hand - machine[1]) for machine in machines if machine[1] <= case.cash_at_hand]
+    while stack:
+        (day, _, resell, profit), cash_at_hand = stack.pop()
+        best = max(best, cash_at_hand + resell + (restructuring_days-day)*profit)
+        for machine in machines:
+            if machine[0] > day:
+                cash_on_day = cash_at_hand + resell + (machine[0]-day-1)*profit
+                if cash_on_day >= machine[1]:
+                    stack.append((machine, cash_on_day - machine[1]))
+    return best
+
+def solve_with(solver):
+    """
+    Wraps a solver class into a function of a case returning its maximum profit
+    """
+    def solve(case):
+        result = solver(case)
+        result.solver()
+        return result.maximum_profit
+    solve.__name__ = solver.__name__
+    return solve
+
+def prefiltered_solve(case):
+    """
+    Solves a case with the HullProfitSolver after the CasePrefilter
+    """
+    return solve_with(HullProfitSolver)(CasePrefilter().filter(case)[0])
+
+def incremental_solve(case):
+    """
+    Solves a case with the IncrementalProfitSolver, inserting its machines from the latest day to the
+    earliest one, then removing and inserting again the first machine
+    """
+    solver = IncrementalProfitSolver([0, case.cash_at_hand, case.number_of_restructuring_days])
+    machines = case.machines()
+    for machine in reversed(machines):
+        solver.insert(machine)
+    if machines:
+        solver.remove(machines[0])
+        solver.insert(machines[0])
+    return solver.maximum_profit
+
+# Engines compared to the oracle: functions of a Case returning its maximum profit
+ENGINES = {
+    "ProfitSolver": solve_with(ProfitSolver),
+    "RecursiveProfitSolver": solve_with(RecursiveProfitSolver),
+    "QuadraticProfitSolver": solve_with(QuadraticProfitSolver),
+    "HullProfitSolver": solve_with(HullProfitSolver),
+    "LiChaoProfitSolver": solve_with(LiChaoProfitSolver),
+    "MonotoneProfitSolver": solve_with(MonotoneProfitSolver),
+    "BatchProfitSolver": lambda case: int(BatchProfitSolver([case]).solver()[0]),
+    "MachineMarket": lambda case: MachineMarket(case.machines()).query([(case.cash_at_hand, case.number_of_restructuring_days)])[0],
+    "CasePrefilter": prefiltered_solve,
+    "IncrementalProfitSolver": incremental_solve,
+}
+
+class DifferentialFuzzer:
+    """
+    Seeded fuzzing harness comparing solvers with the brute-force oracle on small random cases.
+
+    Cases mix uniform values with values on the boundaries of the instructions: machines available
+    on the first or the last day of the restructuring, on the same day, costing exactly the cash at
+    hand, reselling for P - 1, and cases without machines.
+    """
+    def __init__(self, engines=None, seed=0, maximum_machines=8, maximum_value=30):
+        """
+        Initializes the DifferentialFuzzer object
+        inputs:
+            <engines> :: Dict<String, Callable> - engines compared, functions of a Case returning its
+            maximum profit (default: ENGINES)
+            <seed> :: Int - seed of the random cases
+            <maximum_machines> :: Int - largest number of machines of a case (the oracle is exponential)
+            <maximum_value> :: Int - upper bound of D1, C, P and G
+        outputs:
+            None
+        """
+        self.engines = dict(ENGINES if engines is None else engines)
+        self.seed = seed
+        self.maximum_machines = maximum_machines
+        self.maximum_value = maximum_value
+        # Seconds spent and cases solved by each engine and by the oracle
+        self.seconds = Counter()
+        self.solved = Counter()
+
+    def generate_case(self, generator):
+        """
+        Generates a small case following the constraints of the instructions
+        inputs:
+            <generator> :: np.random.Generator - seeded random generator
+        outputs:
+            <out> :: Tuple(List<Int>, List<List<Int>>) - context of case (N, C, D1) and machines (D2, P, R, G)
+        """
+        maximum_value = self.maximum_value
+        number_of_machines = int(generator.integers(0, self.maximum_machines, endpoint=True))
+        restructuring_days = int(generator.integers(1, maximum_value, endpoint=True))
+        cash_at_hand = int(generator.integers(1, maximum_value, endpoint=True))
+        machines = []
+        for _ in range(number_of_machines):
+            # Days on the boundaries of the restructuring, or shared with the previous machine
+            day = int(generator.choice([
+                generator.integers(1, restructuring_days+1, endpoint=True), 1, restructuring_days,
+                restructuring_days+1, machines[-1][0] if machines else 1,
+            ], p=[0.6, 0.1, 0.1, 0.05, 0.15]))
+            # Prices at the cash at hand, or just above it
+            price = int(generator.choice([
+                generator.integers(2, 2*maximum_value, endpoint=True), max(cash_at_hand, 2), cash_at_hand+1,
+            ], p=[0.7, 0.2, 0.1]))
+            resell = int(price-1 if generator.random() < 0.2 else generator.integers(1, price))
+            profit = int(generator.integers(1, maximum_value, endpoint=True))
+            machines.append([day, price, resell, profit])
+        return [number_of_machines, cash_at_hand, restructuring_days], machines
+
+    def solve(self, name, case):
+        """
+        Solves a case with an engine (or the oracle), timing it. Errors are returned as their representation.
+        inputs:
+            <name> :: String - name of the engine, "oracle" for brute_force
+            <case> :: Case - case to solve
+        outputs:
+            <out> :: Int (maximum profit) or String (error raised)
+        """
+        engine = brute_force if name == "oracle" else self.engines[name]
+        start = time.perf_counter()
+        try:
+            result = engine(case)
+        except Exception as error:
+            result = repr(error)
+        self.seconds[name] += time.perf_counter() - start
+        self.solved[name] += 1
+        return result
+
+    def mismatches(self, case_context, machines, names=None):
+        """
+        Compares engines with the oracle on a case
+        inputs:
+            <case_context> :: List<Int> - context of case (N, C, D1)
+            <machines> :: List<List<Int>> - machines (D2, P, R, G)
+            <names> :: Iterable<String> - names of the engines compared (default: all)
+        outputs:
+            <out> :: Dict<String, Tuple(Int, Int or String)> - expected and found results of the engines disagreeing
+        """
+        case = Case.from_machines(case_context, machines)
+        expected = self.solve("oracle", case)
+        found = {}
+        for name in self.engines if names is None else names:
+            result = self.solve(name, Case.from_machines(case_context, machines))
+            if result != expected:
+                found[name] = (expected, result)
+        return found
+
+    def shrink(self, case_context, machines, name):
+        """
+        Shrinks a case on which an engine disagrees with the oracle: removes machines, then lowers the
+        days and values, as long as the engine still disagrees
+        inputs:
+            <case_context> :: List<Int> - context of case (N, C, D1)
+            <machines> :: List<List<Int>> - machines (D2, P, R, G)
+            <name> :: String - name of the engine
+        outputs:
+            <out> :: Tuple(List<Int>, List<List<Int>>) - minimal context of case and machines found
+        """
+        def fails(case_context, machines):
+            return name in self.mismatches([len(machines), *case_context[1:]], machines, [name])
+
+        # Lowest values of C, D1 and of D2, P, R, G, and the constraints a shrunk machine keeps (R < P, D2 <= D1)
+        def candidates(case_context, machines):
+            for i in range(len(machines)):
+                yield case_context, machines[:i] + machines[i+1:]
+            for position, lowest in ((1, 1), (2, 1)):
+                value = case_context[position]
+                for smaller in sorted({lowest, (value+lowest)//2, value-1}):
+                    if lowest <= smaller < value:
+                        shrunk = list(case_context)
+                        shrunk[position] = smaller
+                        yield shrunk, [machine for machine in machines if machine[0] <= shrunk[2]]
+            for i, machine in enumerate(machines):
+                for position, lowest in ((0, 1), (1, 2), (2, 1), (3, 1)):
+                    value = machine[position]
+                    for smaller in sorted({lowest, (value+lowest)//2, value-1}):
+                        shrunk = list(machine)
+                        shrunk[position] = smaller
+                        if lowest <= smaller < value and 1 <= shrunk[2] < shrunk[1]:
+                            yield case_context, machines[:i] + [shrunk] + machines[i+1:]
+
+        case_context = [len(machines), *case_context[1:]]
+        progress = True
+        while progress:
+            progress = False
+            for smaller_context, smaller_machines in candidates(case_context, machines):
+                if fails(smaller_context, smaller_machines):
+                    case_context, machines = [len(smaller_machines), *smaller_context[1:]], smaller_machines
+                    progress = True
+                    break
+        return case_context, machines
+
+    def run(self, number_of_cases=1000, shrink=True):
+        """
+        Compares the engines with the oracle on seeded random cases
+        inputs:
+            <number_of_cases> :: Int - number of cases generated
+            <shrink> :: Bool - shrinks the first failing case of each engine
+        outputs:
+            <out> :: Dict - numbers of cases and of mismatches per engine, the (shrunk) failing cases,
+            and the speed of each engine in cases per second
+        """
+        generator = np.random.default_rng(self.seed)
+        failures = {}
+        mismatches = Counter()
+        for _ in range(number_of_cases):
+            case_context, machines = self.generate_case(generator)
+            for name, (expected, result) in self.mismatches(case_context, machines).items():
+                mismatches[name] += 1
+                if name in failures:
+                    continue
+                if shrink:
+                    # The solves of the shrinking are left out of the speed of the engines
+                    seconds, solved = Counter(self.seconds), Counter(self.solved)
+                    case_context, machines = self.shrink(case_context, machines, name)
+                    expected, result = self.mismatches(case_context, machines, [name])[name]
+                    self.seconds, self.solved = seconds, solved
+                failures[name] = {
+                    "case_context": case_context, "machines": machines, "expected": expected, "result": result,
+                }
+        return {
+            "seed": self.seed,
+            "cases": number_of_cases,
+            "mismatches": dict(mismatches),
+            "failures": failures,
+            "cases_per_second": {
+                name: self.solved[name]/self.seconds[name] if self.seconds[name] else None
+                for name in ["oracle", *self.engines]
+            },
+        }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="profit_maximizer.differential", description="Differential verification of the solvers")
+    parser.add_argument("--cases", type=int, default=1000, help="number of random cases")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--machines", type=int, default=8, help="largest number of machines of a case")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), help="engines compared (default: all)")
+    parser.add_argument("--output", help="path of the JSON report (default: standard output)")
+    arguments = parser.parse_args(argv)
+    engines = None if arguments.engines is None else {name: ENGINES[name] for name in arguments.engines}
+    report = DifferentialFuzzer(engines, arguments.seed, arguments.machines).run(arguments.cases)
+    if arguments.output:
+        with open(arguments.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    return 1 if report["mismatches"] else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,163 @@
+from .case import Case
+from .plan import new_parents, rebuild_plan
+
+class HullProfitSolver:
+    """
+    Profit Solver using a divide-and-conquer (CDQ) over the days and upper convex hulls of lines
+
+    Let dp_j be the best cash ACM can hold on day D_j before buying machine j (machines sorted by day).
+    Buying machine i (if dp_i >= P_i) and reselling it on day x yields:
+        dp_i - P_i + R_i + G_i*(x-D_i-1) = G_i*x + (R_i - P_i + dp_i - G_i*(D_i+1))
+    i.e. a line of slope G_i evaluated at x. Each dp_j is the maximum of C and of the lines of the
+    affordable machines available strictly before D_j, evaluated at x = D_j. The maximum profit is
+    the same maximum evaluated at x = D+1.
+
+    When recording the plan, each line keeps the index of its machine: the machine whose line sets
+    dp_j is the parent of machine j, and the line of the maximum at x = D+1 is the last machine owned.
+    """
+    def __init__(self, case_context, machines=None, record_plan=False):
+        """
+        Initializes the HullProfitSolver object
+        inputs:
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+        N: number of machines, C: cash at hand, D1: days of restructuring
+        D2: day of availability, P: acquisition price, R: resell price, G: daily profit
+            <record_plan> :: Bool - records the parent of each machine during the solve, see plan()
+        outputs:
+            None
+        """
+        self.case = Case.build(case_context, machines)
+        self.cash_at_hand = self.case.cash_at_hand
+        self.number_of_restructuring_days = self.case.number_of_restructuring_days
+        self.maximum_profit = self.case.cash_at_hand
+        # Counter of the operations performed by the solver, set when the CaseHandler is instrumented
+        self.counters = None
+        # Index (in day order) of the machine owned before buying each machine, and of the machine
+        # owned at the end of the restructuring (-1 for none), when recording the plan
+        self.parents = new_parents(len(self.case)) if record_plan else None
+        self.last_machine = -1
+
+    @staticmethod
+    def upper_hull(lines):
+        """
+        Builds the upper envelope of a list of lines sorted by increasing slope
+        input:
+            <lines> :: List<Tuple(Int, Int, Int)> - (slope, intercept, machine) of each line, sorted by slope
+        output:
+            <out> :: List<Tuple(Int, Int, Int)> - lines of the upper envelope, by increasing slope
+        """
+        hull = []
+        for line in lines:
+            slope, intercept, _ = line
+            # Equal slopes: only the highest intercept can be part of the envelope
+            if hull and hull[-1][0] == slope:
+                if hull[-1][1] >= intercept:
+                    continue
+                hull.pop()
+            # Pops the last line while it is never above both of its neighbours
+            while len(hull) >= 2:
+                slope_1, intercept_1, _ = hull[-2]
+                slope_2, intercept_2, _ = hull[-1]
+                if (intercept - intercept_1)*(slope_2 - slope_1) >= (intercept_2 - intercept_1)*(slope - slope_1):
+                    hull.pop()
+                else:
+                    break
+            hull.append(line)
+        return hull
+
+    def solver(self):
+        """
+        Computes dp_j for each machine then the maximum profit at the end of the restructuring.
+        Machines bought on the same day cannot follow each other, hence the divide-and-conquer splits
+        the machines on day boundaries: lines of the left half are all strictly earlier than the
+        queries of the right half, which are visited by increasing day with a monotone pointer.
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: None
+        """
+        if not len(self.case):
+            return
+        # Python integers keep the arithmetic exact beyond the int64 range
+        days = self.case.day.tolist()
+        prices = self.case.price.tolist()
+        resells = self.case.resell.tolist()
+        profits = self.case.profit.tolist()
+        dp = [self.cash_at_hand]*len(days)
+        # Indices where a new day starts (plus the end of the list)
+        bounds = [0] + [i for i in range(1, len(days)) if days[i] != days[i-1]] + [len(days)]
+        upper_hull = self.upper_hull
+        counters = self.counters
+        parents = self.parents
+
+        def divide_and_conquer(first_group, last_group):
+            """
+            Finalizes dp over the day groups [first_group, last_group)
+            output:
+                <out> :: List<Tuple(Int, Int, Int)> - upper envelope of the lines of the affordable machines
+                of the range. Lines below the envelope of a range stay below it for any larger range.
+            """
+            start, end = bounds[first_group], bounds[last_group]
+            if last_group - first_group == 1:
+                lines = []
+                for i in range(start, end):
+                    if dp[i] >= prices[i]:
+                        lines.append((profits[i], dp[i] - prices[i] + resells[i] - profits[i]*(days[i]+1), i))
+                if len(lines) > 1:
+                    if counters is not None:
+                        counters["hull_lines"] += len(lines)
+                    lines.sort()
+                    lines = upper_hull(lines)
+                return lines
+            middle_group = (first_group + last_group)//2
+            middle = bounds[middle_group]
+            hull = divide_and_conquer(first_group, middle_group)
+            if hull:
+                if counters is not None:
+                    counters["queries"] += end - middle
+                pointer, last = 0, len(hull) - 1
+                slope, intercept, machine = hull[0]
+                for j in range(middle, end):
+                    x = days[j]
+                    value = slope*x + intercept
+                    while pointer < last:
+                        next_slope, next_intercept, next_machine = hull[pointer+1]
+                        next_value = next_slope*x + next_intercept
+                        if next_value < value:
+                            break
+                        slope, intercept, machine, value = next_slope, next_intercept, next_machine, next_value
+                        pointer += 1
+                    if value > dp[j]:
+                        dp[j] = value
+                        if parents is not None:
+                            parents[j] = machine
+            right_hull = divide_and_conquer(middle_group, last_group)
+            if not hull or not right_hull:
+                return hull or right_hull
+            # Both envelopes are sorted by slope: timsort merges the two runs in linear time
+            lines = hull + right_hull
+            if counters is not None:
+                counters["hull_lines"] += len(lines)
+            lines.sort()
+            return upper_hull(lines)
+
+        end_of_restructuring = self.number_of_restructuring_days + 1
+        for slope, intercept, machine in divide_and_conquer(0, len(bounds) - 1):
+            value = slope*end_of_restructuring + intercept
+            if value > self.maximum_profit:
+                self.maximum_profit, self.last_machine = value, machine
+
+    def plan(self):
+        """
+        Rebuilds the best strategy from the parents recorded during the solve
+        inputs:
+            None
+        outputs:
+            <out> :: List<List<Int>> - machine descriptions (D2, P, R, G) bought, in order of acquisition,
+            each resold on the day the next one is bought; None if the plan was not recorded
+        """
+        if self.parents is None:
+            return None
+        machines = self.case.machines()
+        return [machines[machine] for machine in rebuild_plan(self.parents, self.last_machine)]
@@ -0,0 +1,181 @@
+from .li_chao_profit_solver import LiChaoProfitSolver
+from bisect import bisect_left, bisect_right
+
+class IncrementalProfitSolver(LiChaoProfitSolver):
+    """
+    Solved case kept up to date as machines are inserted or removed one at a time
+
+    The machines are pushed in day order into the Li Chao tree of the LiChaoProfitSolver, whose
+    changes are recorded in a journal. A checkpoint is taken at each day boundary: the length of the
+    journal and the state of the solver before the first machine of the day. Inserting or removing a
+    machine undoes the journal back to the checkpoint of its day, then pushes again the machines of
+    that day onward only: an update on a late day costs a small fraction of a full solve.
+    """
+    def __init__(self, case_context, machines=None):
+        """
+        Initializes the IncrementalProfitSolver object and solves the case
+        inputs:
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+        N: number of machines, C: cash at hand, D1: days of restructuring
+        D2: day of availability, P: acquisition price, R: resell price, G: daily profit
+        outputs:
+            None
+        """
+        super().__init__(case_context, machines)
+        # Machines available during the restructuring, sorted by day, and their days
+        self.machines = [tuple(machine) for machine in self.case.machines()]
+        self.days = [machine[0] for machine in self.machines]
+        # Changes of the Li Chao tree, undone back to a checkpoint:
+        #   (0, node, slope, intercept) - line of a node replaced
+        #   (1, children, node) - child of a node created
+        #   (2,) - node appended
+        self.journal = []
+        # Checkpoints by day: day, position of its first machine, length of the journal, and the
+        # maximum profit, current day and pending lines of the solver before its first machine
+        self.checkpoint_days = []
+        self.checkpoints = []
+        self.resume(0)
+
+    def insert_line(self, slope, intercept, machine=-1):
+        """
+        Inserts a line in the Li Chao tree (see LiChaoProfitSolver.insert_line), recording its changes
+        inputs:
+            <slope> :: Int - daily profit of the machine
+            <intercept> :: Int - value of the line at day 0
+            <machine> :: Int - unused: the plan is not recorded by the IncrementalProfitSolver
+        outputs:
+            <out> :: None
+        """
+        if self.counters is not None:
+            self.counters["tree_inserts"] += 1
+        slopes, intercepts, journal = self.slopes, self.intercepts, self.journal
+        if not slopes:
+            self.new_node(slope, intercept)
+            return
+        node, low, high = 0, 1, self.number_of_restructuring_days + 1
+        while True:
+            middle = (low + high)//2
+            if slope*middle + intercept > slopes[node]*middle + intercepts[node]:
+                journal.append((0, node, slopes[node], intercepts[node]))
+                slope, slopes[node] = slopes[node], slope
+                intercept, intercepts[node] = intercepts[node], intercept
+            if low == high:
+                return
+            if slope*low + intercept > slopes[node]*low + intercepts[node]:
+                children, high = self.left_children, middle
+            elif slope*high + intercept > slopes[node]*high + intercepts[node]:
+                children, low = self.right_children, middle + 1
+            else:
+                return
+            if children[node] == -1:
+                children[node] = self.new_node(slope, intercept)
+                journal.append((1, children, node))
+                return
+            node = children[node]
+
+    def new_node(self, slope, intercept):
+        """
+        Appends a childless node holding a line to the Li Chao tree, recording it
+        inputs:
+            <slope> :: Int - daily profit of the machine
+            <intercept> :: Int - value of the line at day 0
+        outputs:
+            <out> :: Int - index of the new node
+        """
+        self.journal.append((2,))
+        return super().new_node(slope, intercept)
+
+    def rollback(self, day):
+        """
+        Restores the solver to the checkpoint of the first day not earlier than <day>
+        inputs:
+            <day> :: Int - earliest day whose machines changed
+        outputs:
+            <out> :: Int - position of the first machine to push again
+        """
+        index = bisect_left(self.checkpoint_days, day)
+        # Every machine pushed is earlier: the machines of <day> onward were never pushed
+        if index == len(self.checkpoints):
+            return bisect_left(self.days, day)
+        position, journal_length, self.maximum_profit, self.current_day, pending_lines = self.checkpoints[index]
+        self.pending_lines = list(pending_lines)
+        del self.checkpoint_days[index:], self.checkpoints[index:]
+        journal = self.journal
+        if self.counters is not None:
+            self.counters["undone"] += len(journal) - journal_length
+        while len(journal) > journal_length:
+            change = journal.pop()
+            if change[0] == 0:
+                _, node, self.slopes[node], self.intercepts[node] = change
+            elif change[0] == 1:
+                change[1][change[2]] = -1
+            else:
+                for values in (self.slopes, self.intercepts, self.left_children, self.right_children):
+                    values.pop()
+        return position
+
+    def resume(self, position):
+        """
+        Pushes the machines from a position on, taking a checkpoint at each day boundary
+        inputs:
+            <position> :: Int - position of the first machine to push, the first of its day
+        outputs:
+            <out> :: None
+        """
+        for position in range(position, len(self.machines)):
+            machine = self.machines[position]
+            if not self.checkpoint_days or self.checkpoint_days[-1] != machine[0]:
+                self.checkpoint_days.append(machine[0])
+                self.checkpoints.append((
+                    position, len(self.journal), self.maximum_profit, self.current_day, tuple(self.pending_lines)
+                ))
+            self.push(*machine)
+
+    def insert(self, machine):
+        """
+        Adds a machine to the case, after the machines of the same day
+        inputs:
+            <machine> :: List<Int> - machine description (D2, P, R, G)
+        outputs:
+            <out> :: Int - maximum profit of the updated case
+        """
+        machine = tuple(machine)
+        # Machines available after the restructuring are ignored
+        if machine[0] > self.number_of_restructuring_days:
+            return self.maximum_profit
+        position = bisect_right(self.days, machine[0])
+        self.machines.insert(position, machine)
+        self.days.insert(position, machine[0])
+        self.resume(self.rollback(machine[0]))
+        return self.maximum_profit
+
+    def remove(self, machine):
+        """
+        Removes a machine from the case (the first one of its day with the same description)
+        inputs:
+            <machine> :: List<Int> - machine description (D2, P, R, G)
+        outputs:
+            <out> :: Int - maximum profit of the updated case
+        """
+        machine = tuple(machine)
+        # Machines available after the restructuring were ignored on insertion
+        if machine[0] > self.number_of_restructuring_days:
+            return self.maximum_profit
+        start, end = bisect_left(self.days, machine[0]), bisect_right(self.days, machine[0])
+        try:
+            position = self.machines.index(machine, start, end)
+        except ValueError:
+            raise ValueError(f"machine {list(machine)} not in the case") from None
+        del self.machines[position], self.days[position]
+        self.resume(self.rollback(machine[0]))
+        return self.maximum_profit
+
+    def solver(self):
+        """
+        The case is solved at initialization and kept up to date by insert() and remove()
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: None
+        """
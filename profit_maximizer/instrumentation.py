@@ -0,0 +1,122 @@
+from contextlib import contextmanager
+
+import json
+import time
+import tracemalloc
+
+def measure(function, *arguments):
+    """
+    Runs a function, timing it and measuring its peak memory if tracemalloc is tracing
+    inputs:
+        <function> :: Callable - function to run
+        <arguments> :: Any - arguments of the function
+    outputs:
+        <out> :: Tuple(<0>, <1>, <2>)
+            <0> :: Any - result of the function
+            <1> :: Float - run time in seconds
+            <2> :: Int - peak memory allocated during the run in bytes, None if not tracing
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        memory_at_start = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = function(*arguments)
+    seconds = time.perf_counter() - start
+    peak_memory = tracemalloc.get_traced_memory()[1] - memory_at_start if tracing else None
+    return result, seconds, peak_memory
+
+@contextmanager
+def tracing(enabled=True):
+    """
+    Traces the memory allocations of a whole run, so that measure() reports peak memories. Tracing
+    slows every allocation down: it is stopped at the end of the run, unless it was already on.
+    inputs:
+        <enabled> :: Bool - traces the allocations when True, does nothing otherwise
+    outputs:
+        <out> :: ContextManager
+    """
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+class CaseStatistics:
+    """
+    Per-case statistics collected by an instrumented CaseHandler, one record (dict) per case:
+        - case: case number
+        - parse_seconds, parse_peak_memory_bytes: reading of the case by the CaseReader
+        - machines: number of machines left after the D2 <= D1 filter (None if the case is not parsed)
+        - prefilter_seconds, removed_machines: machines removed by each rule of the CasePrefilter, if the case went through it
+        - solver, solve_seconds, solve_peak_memory_bytes: solving of the case (time shared evenly by
+          the cases of a batch, whose size is recorded as batch_size)
+        - counters: operations counted by the solver (on the first case of a batch for the whole batch)
+    """
+    def __init__(self):
+        """
+        Initializes the CaseStatistics object
+        """
+        self.records = []
+
+    def new_record(self, parse_seconds, parse_peak_memory, case):
+        """
+        Records the parsing of the next case
+        inputs:
+            <parse_seconds> :: Float - time spent reading the case
+            <parse_peak_memory> :: Int - peak memory allocated while reading the case
+            <case> :: Case - case read, None if not parsed
+        outputs:
+            <out> :: Dict - record of the case, completed when the case is solved
+        """
+        record = {
+            "case": len(self.records) + 1,
+            "parse_seconds": parse_seconds,
+            "parse_peak_memory_bytes": parse_peak_memory,
+            "machines": None if case is None else len(case),
+        }
+        self.records.append(record)
+        return record
+
+    def totals(self):
+        """
+        Sums the times and counters over all the cases
+        outputs:
+            <out> :: Dict - number of cases, total parse and solve times, peak memory and summed counters
+        """
+        counters = {}
+        for record in self.records:
+            for name, count in record.get("counters", {}).items():
+                counters[name] = counters.get(name, 0) + count
+        peak_memories = [
+            record.get(key) or 0 for record in self.records
+            for key in ("parse_peak_memory_bytes", "solve_peak_memory_bytes")
+        ]
+        return {
+            "cases": len(self.records),
+            "parse_seconds": sum(record["parse_seconds"] for record in self.records),
+            "solve_seconds": sum(record.get("solve_seconds", 0) for record in self.records),
+            "peak_memory_bytes": max(peak_memories, default=0),
+            "counters": counters,
+        }
+
+    def export_jsonl(self, filename):
+        """
+        Writes one JSON record per line
+        inputs:
+            <filename> :: String - path of the output file
+        outputs:
+            <out> :: None
+        """
+        with open(filename, "w") as f:
+            for record in self.records:
+                f.write(json.dumps(record) + "\n")
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, index):
+        return self.records[index]
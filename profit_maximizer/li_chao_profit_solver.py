@@ -0,0 +1,216 @@
+from .case import Case
+from .plan import rebuild_plan
+from array import array
+
+class LiChaoProfitSolver:
+    """
+    Online Profit Solver fed with machines in day order, backed by a Li Chao segment tree
+
+    As in the HullProfitSolver, a machine i bought with dp_i >= P_i and resold on day x is the line
+    G_i*x + (R_i - P_i + dp_i - G_i*(D_i+1)). The Li Chao tree stores these lines over the days
+    [1, D+1] and answers the maximum at a given day in O(log D). Nodes are only created when a line
+    needs one, so the tree never holds more nodes than machines pushed.
+
+    When recording the plan, each node also keeps the index of the machine of its line: the best
+    line on the day of a machine gives its parent.
+    """
+    def __init__(self, case_context, machines=None, record_plan=False):
+        """
+        Initializes the LiChaoProfitSolver object
+        inputs:
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case,
+            optional when machines are pushed one at a time
+        N: number of machines, C: cash at hand, D1: days of restructuring
+        D2: day of availability, P: acquisition price, R: resell price, G: daily profit
+            <record_plan> :: Bool - records the parent of each machine pushed, see plan()
+        outputs:
+            None
+        """
+        self.case = Case.build(case_context, machines)
+        self.cash_at_hand = self.case.cash_at_hand
+        self.number_of_restructuring_days = self.case.number_of_restructuring_days
+        self.maximum_profit = self.case.cash_at_hand
+        # Counter of the operations performed by the solver, set when the CaseHandler is instrumented
+        self.counters = None
+        # Day of the last machine pushed, and lines (slope, intercept, machine) of the machines pushed
+        # on that day which cannot be used before the next day
+        self.current_day = 0
+        self.pending_lines = []
+        # Li Chao tree: one entry per node in each list, -1 for a missing child
+        self.slopes = []
+        self.intercepts = []
+        self.left_children = []
+        self.right_children = []
+        # When recording the plan: machines pushed during the restructuring, the index of the machine
+        # owned before buying each of them and of the machine owned at the end of the restructuring
+        # (-1 for none), and the machine of the line of each node
+        self.pushed_machines = [] if record_plan else None
+        self.parents = array("i") if record_plan else None
+        self.last_machine = -1
+        self.line_machines = [] if record_plan else None
+
+    def insert_line(self, slope, intercept, machine=-1):
+        """
+        Inserts a line in the Li Chao tree, keeping in each node the line that is the highest at
+        the middle of its range and pushing the other one down to the only half where it can win
+        inputs:
+            <slope> :: Int - daily profit of the machine
+            <intercept> :: Int - value of the line at day 0
+            <machine> :: Int - index of the machine, kept when recording the plan
+        outputs:
+            <out> :: None
+        """
+        if self.counters is not None:
+            self.counters["tree_inserts"] += 1
+        slopes, intercepts, line_machines = self.slopes, self.intercepts, self.line_machines
+        if not slopes:
+            self.new_node(slope, intercept, machine)
+            return
+        node, low, high = 0, 1, self.number_of_restructuring_days + 1
+        while True:
+            middle = (low + high)//2
+            if slope*middle + intercept > slopes[node]*middle + intercepts[node]:
+                slope, slopes[node] = slopes[node], slope
+                intercept, intercepts[node] = intercepts[node], intercept
+                if line_machines is not None:
+                    machine, line_machines[node] = line_machines[node], machine
+            if low == high:
+                return
+            if slope*low + intercept > slopes[node]*low + intercepts[node]:
+                children, high = self.left_children, middle
+            elif slope*high + intercept > slopes[node]*high + intercepts[node]:
+                children, low = self.right_children, middle + 1
+            else:
+                return
+            if children[node] == -1:
+                children[node] = self.new_node(slope, intercept, machine)
+                return
+            node = children[node]
+
+    def new_node(self, slope, intercept, machine=-1):
+        """
+        Appends a childless node holding a line to the Li Chao tree
+        inputs:
+            <slope> :: Int - daily profit of the machine
+            <intercept> :: Int - value of the line at day 0
+            <machine> :: Int - index of the machine, kept when recording the plan
+        outputs:
+            <out> :: Int - index of the new node
+        """
+        if self.counters is not None:
+            self.counters["tree_nodes"] += 1
+        self.slopes.append(slope)
+        self.intercepts.append(intercept)
+        self.left_children.append(-1)
+        self.right_children.append(-1)
+        if self.line_machines is not None:
+            self.line_machines.append(machine)
+        return len(self.slopes) - 1
+
+    def current_best(self, day):
+        """
+        Returns the largest cash ACM can hold on <day> before buying a machine of that day
+        input:
+            <day> :: Int - day between the day of the last machine pushed and D+1
+        output:
+            <out> :: Int - best cash at hand
+        """
+        return self.best_line(day)[0]
+
+    def best_line(self, day):
+        """
+        Returns the largest cash ACM can hold on <day> before buying a machine of that day, and the
+        machine owned to get it
+        input:
+            <day> :: Int - day between the day of the last machine pushed and D+1
+        output:
+            <out> :: Tuple(Int, Int) - best cash at hand, and the index of the machine of the best line
+            (-1 for the cash at hand, or if the plan is not recorded)
+        """
+        if day < self.current_day:
+            raise ValueError(f"day {day} queried after a machine of day {self.current_day} was pushed")
+        best, best_machine = self.cash_at_hand, -1
+        if day > self.current_day:
+            for slope, intercept, machine in self.pending_lines:
+                value = slope*day + intercept
+                if value > best:
+                    best, best_machine = value, machine
+        slopes, intercepts, line_machines = self.slopes, self.intercepts, self.line_machines
+        node, low, high = (0 if slopes else -1), 1, self.number_of_restructuring_days + 1
+        while node != -1:
+            value = slopes[node]*day + intercepts[node]
+            if value > best:
+                best = value
+                if line_machines is not None:
+                    best_machine = line_machines[node]
+            middle = (low + high)//2
+            if day <= middle:
+                node, high = self.left_children[node], middle
+            else:
+                node, low = self.right_children[node], middle + 1
+        return best, best_machine
+
+    def push(self, day, price, resell, profit):
+        """
+        Adds the next machine of the feed, in O(log D)
+        inputs:
+            <day> :: Int - day of availability, not earlier than the day of the last machine pushed
+            <price> :: Int - acquisition price
+            <resell> :: Int - resell price
+            <profit> :: Int - daily profit
+        outputs:
+            <out> :: Int - best cash at hand on <day> before buying the machine
+        """
+        if day < self.current_day:
+            raise ValueError(f"machine of day {day} pushed after a machine of day {self.current_day}")
+        if self.counters is not None:
+            self.counters["pushes"] += 1
+        # Machines available after the restructuring are ignored
+        if day > self.number_of_restructuring_days:
+            return self.current_best(self.number_of_restructuring_days+1)
+        if day > self.current_day:
+            # Machines of the previous day can now be followed by the machines of the feed
+            for line in self.pending_lines:
+                self.insert_line(*line)
+            self.pending_lines = []
+            self.current_day = day
+        cash_at_hand, parent = self.best_line(day)
+        machine = -1
+        if self.parents is not None:
+            machine = len(self.parents)
+            self.parents.append(parent)
+            self.pushed_machines.append([day, price, resell, profit])
+        # Machines that are not affordable never start a line
+        if cash_at_hand >= price:
+            intercept = cash_at_hand - price + resell - profit*(day+1)
+            self.pending_lines.append((profit, intercept, machine))
+            value = profit*(self.number_of_restructuring_days+1) + intercept
+            if value > self.maximum_profit:
+                self.maximum_profit, self.last_machine = value, machine
+        return cash_at_hand
+
+    def solver(self):
+        """
+        Pushes the machines of the case given at initialization in day order
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: None
+        """
+        case = self.case
+        for machine in zip(case.day.tolist(), case.price.tolist(), case.resell.tolist(), case.profit.tolist()):
+            self.push(*machine)
+
+    def plan(self):
+        """
+        Rebuilds the best strategy from the parents recorded while the machines were pushed
+        inputs:
+            None
+        outputs:
+            <out> :: List<List<Int>> - machine descriptions (D2, P, R, G) bought, in order of acquisition,
+            each resold on the day the next one is bought; None if the plan was not recorded
+        """
+        if self.parents is None:
+            return None
+        return [self.pushed_machines[machine] for machine in rebuild_plan(self.parents, self.last_machine)]
@@ -0,0 +1,131 @@
+from .case import Case
+from .li_chao_profit_solver import LiChaoProfitSolver
+
+import numpy as np
+
+class MachineMarket:
+    """
+    Machines shared by many scenarios (C, D1), sorted by day once, answering the scenarios in batch
+
+    The best cash dp_i before buying machine i does not depend on D1, and with a fixed set of affordable
+    machines every dp_i and every maximum profit is C plus a constant: when C grows by d, dp_i grows
+    by d as well, so the affordable machines stay affordable and a machine short of P_i - dp_i only
+    becomes affordable once d reaches that deficit. The cash axis is thus cut into segments
+    [C, C + smallest deficit) over which the maximum profit is C + gain(D1). One pass over the
+    machines at the first cash of a segment gives gain(D1) for every D1 queried, and each scenario
+    whose cash falls in the segment is then answered in O(1).
+    """
+    def __init__(self, machines):
+        """
+        Initializes the MachineMarket object
+        inputs:
+            <machines> :: List<List<Int>> or np.ndarray<Int64> - machine descriptions (D2, P, R, G)
+        D2: day of availability, P: acquisition price, R: resell price, G: daily profit
+        outputs:
+            None
+        """
+        values = np.asarray(machines, dtype=np.int64).reshape(-1)
+        last_day = int(values[0::4].max()) if len(values) else 0
+        # Every machine is kept: the day filter depends on the D1 of each scenario
+        self.case = Case.from_values([len(values)//4, 0, last_day], values)
+        self.days = self.case.day.tolist()
+        self.machines = list(zip(self.days, self.case.price.tolist(), self.case.resell.tolist(), self.case.profit.tolist()))
+        # Counter of the passes over the machines and of the scenarios answered, set by the caller to follow them
+        self.counters = None
+
+    def solve_pass(self, cash_at_hand, restructuring_days):
+        """
+        Runs the DP over the machines available before the last day queried, for one cash at hand
+        inputs:
+            <cash_at_hand> :: Int - cash ACM starts with
+            <restructuring_days> :: List<Int> - days of restructuring queried, sorted
+        outputs:
+            <out> :: Tuple(<0>, <1>)
+                <0> :: List<Int> - maximum profit minus <cash_at_hand> for each day of restructuring queried
+                <1> :: Int - smallest cash missing to buy a machine not affordable, None if all are affordable
+        """
+        if self.counters is not None:
+            self.counters["passes"] += 1
+        solver = LiChaoProfitSolver([0, cash_at_hand, restructuring_days[-1]])
+        gains, deficit = [], None
+        position, number_of_machines = 0, len(self.machines)
+        for day in restructuring_days:
+            while position < number_of_machines and self.days[position] <= day:
+                price = self.machines[position][1]
+                cash = solver.push(*self.machines[position])
+                if cash < price and (deficit is None or price - cash < deficit):
+                    deficit = price - cash
+                position += 1
+            gains.append(solver.current_best(day+1) - cash_at_hand)
+        return gains, deficit
+
+    def query(self, scenarios):
+        """
+        Answers scenarios in batch, with one pass over the machines per segment of the cash axis
+        holding scenarios
+        inputs:
+            <scenarios> :: List<Tuple(Int, Int)> - cash at hand C and days of restructuring D1 of each scenario
+        outputs:
+            <out> :: List<Int> - maximum profit of each scenario
+        """
+        scenarios = [(int(cash_at_hand), int(day)) for cash_at_hand, day in scenarios]
+        restructuring_days = sorted({day for _, day in scenarios})
+        day_indices = {day: index for index, day in enumerate(restructuring_days)}
+        results = [None]*len(scenarios)
+        gains, segment_end = None, None
+        for index in sorted(range(len(scenarios)), key=lambda index: scenarios[index][0]):
+            cash_at_hand, day = scenarios[index]
+            if gains is None or (segment_end is not None and cash_at_hand >= segment_end):
+                gains, deficit = self.solve_pass(cash_at_hand, restructuring_days)
+                segment_end = None if deficit is None else cash_at_hand + deficit
+            results[index] = cash_at_hand + gains[day_indices[day]]
+        if self.counters is not None:
+            self.counters["queries"] += len(scenarios)
+        return results
+
+    def profit_curve(self, restructuring_days, minimum_cash=0, maximum_cash=None):
+        """
+        Computes the maximum profit as a function of the cash at hand: C + gains[k] for C in [starts[k], starts[k+1]),
+        the last segment extending to <maximum_cash> (or without bound)
+        inputs:
+            <restructuring_days> :: Int - days of restructuring D1
+            <minimum_cash> :: Int - smallest cash at hand of the curve
+            <maximum_cash> :: Int - largest cash at hand of the curve, None to go on until every machine is affordable
+        outputs:
+            <out> :: Tuple(List<Int>, List<Int>) - starts and gains of the segments, gains increasing
+        """
+        starts, gains = [], []
+        cash_at_hand = minimum_cash
+        while maximum_cash is None or cash_at_hand <= maximum_cash:
+            (gain,), deficit = self.solve_pass(cash_at_hand, [restructuring_days])
+            # A machine made affordable does not always improve the maximum profit
+            if not gains or gain != gains[-1]:
+                starts.append(cash_at_hand)
+                gains.append(gain)
+            if deficit is None:
+                break
+            cash_at_hand += deficit
+        return starts, gains
+
+    def sweep(self, cash_values, restructuring_days):
+        """
+        Evaluates the maximum profit for an array of cash at hand values, from the profit curve
+        inputs:
+            <cash_values> :: np.ndarray<Int64> - cash at hand C of each scenario
+            <restructuring_days> :: Int - days of restructuring D1 shared by the scenarios
+        outputs:
+            <out> :: np.ndarray - maximum profit of each scenario (int64, or Python integers beyond 2**62)
+        """
+        cash_values = np.asarray(cash_values, dtype=np.int64)
+        if not len(cash_values):
+            return cash_values.copy()
+        starts, gains = self.profit_curve(restructuring_days, int(cash_values.min()), int(cash_values.max()))
+        dtype = np.int64 if int(cash_values.max()) + gains[-1] < 2**62 else object
+        segments = np.searchsorted(np.array(starts, dtype=np.int64), cash_values, side="right") - 1
+        return cash_values.astype(dtype) + np.array(gains, dtype=dtype)[segments]
+
+    def __len__(self):
+        """
+        Number of machines of the market
+        """
+        return len(self.machines)
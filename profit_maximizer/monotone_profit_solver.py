@@ -0,0 +1,135 @@
+from .hull_profit_solver import HullProfitSolver
+
+import numpy as np
+
+class MonotoneProfitSolver(HullProfitSolver):
+    """
+    Profit Solver in linear time (after sorting) for the cases whose daily profits never decrease with the day
+
+    The lines of the HullProfitSolver are G_i*x + (R_i - P_i + dp_i - G_i*(D_i+1)). When no machine
+    has a smaller daily profit than a machine of an earlier day, the lines arrive by increasing slope
+    and the queries by increasing day: the upper envelope is a deque, extended at the back with the
+    new lines and trimmed at the front once a line is overtaken by the next one, in amortized O(1).
+    The other cases are solved by the HullProfitSolver.
+    """
+    def __init__(self, case_context, machines=None, record_plan=False):
+        """
+        Initializes the MonotoneProfitSolver object
+        inputs:
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+        N: number of machines, C: cash at hand, D1: days of restructuring
+        D2: day of availability, P: acquisition price, R: resell price, G: daily profit
+            <record_plan> :: Bool - records the parent of each machine during the solve, see plan()
+        outputs:
+            None
+        """
+        super().__init__(case_context, machines, record_plan)
+        # Whether the daily profits never decrease with the day, set by the solver
+        self.monotone = None
+
+    def is_monotone(self):
+        """
+        Checks in one pass over the machines sorted by day that each daily profit is at least the
+        largest daily profit of the earlier days (machines of the same day can come in any order)
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: Bool
+        """
+        day, profit = self.case.day, self.case.profit
+        # First machine of the day of each machine, and the largest profit of the machines before it
+        first = np.searchsorted(day, day, side="left")
+        later = first > 0
+        largest_profits = np.maximum.accumulate(profit)
+        return bool(np.all(profit[later] >= largest_profits[first[later] - 1]))
+
+    def solver(self):
+        """
+        Solves the case with the deque of lines if it is monotone, with the HullProfitSolver otherwise.
+        Machines bought on the same day cannot follow each other: every machine of a day gets the
+        best cash at hand of the lines of the earlier days, then their lines join the deque.
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: None
+        """
+        if not len(self.case):
+            return
+        self.monotone = self.is_monotone()
+        if not self.monotone:
+            super().solver()
+            return
+        # Machines of a day by increasing daily profit, Python integers for exact arithmetic
+        order = np.lexsort((self.case.profit, self.case.day))
+        days = self.case.day[order].tolist()
+        prices = self.case.price[order].tolist()
+        resells = self.case.resell[order].tolist()
+        profits = self.case.profit[order].tolist()
+        # Index of each machine in day order, the order of the parents
+        positions = order.tolist()
+        cash_at_hand = self.cash_at_hand
+        counters = self.counters
+        parents = self.parents
+        # Deque of the upper envelope: lines[head:] by increasing slope, and the index of their machines
+        slopes, intercepts, machines, head = [], [], [], 0
+
+        def best(x):
+            """
+            Drops the lines overtaken at day <x> from the front and returns the best cash at hand on
+            that day, with the index of the machine of the best line (-1 for the cash at hand)
+            """
+            nonlocal head
+            last = len(slopes) - 1
+            if head > last:
+                return cash_at_hand, -1
+            value = slopes[head]*x + intercepts[head]
+            while head < last:
+                next_value = slopes[head+1]*x + intercepts[head+1]
+                if next_value < value:
+                    break
+                value = next_value
+                head += 1
+            return (value, machines[head]) if value > cash_at_hand else (cash_at_hand, -1)
+
+        start, number_of_machines = 0, len(days)
+        while start < number_of_machines:
+            day = days[start]
+            end = start + 1
+            while end < number_of_machines and days[end] == day:
+                end += 1
+            dp, parent = best(day)
+            if counters is not None:
+                counters["queries"] += 1
+            for i in range(start, end):
+                if dp < prices[i]:
+                    continue
+                slope, intercept = profits[i], dp - prices[i] + resells[i] - profits[i]*(day+1)
+                # Equal slopes: only the highest intercept can be part of the envelope
+                if len(slopes) > head and slopes[-1] == slope:
+                    if intercepts[-1] >= intercept:
+                        continue
+                    slopes.pop()
+                    intercepts.pop()
+                    machines.pop()
+                # Pops the last line while it is never above both of its neighbours
+                while len(slopes) - head >= 2:
+                    slope_1, intercept_1 = slopes[-2], intercepts[-2]
+                    slope_2, intercept_2 = slopes[-1], intercepts[-1]
+                    if (intercept - intercept_1)*(slope_2 - slope_1) >= (intercept_2 - intercept_1)*(slope - slope_1):
+                        slopes.pop()
+                        intercepts.pop()
+                        machines.pop()
+                    else:
+                        break
+                slopes.append(slope)
+                intercepts.append(intercept)
+                machines.append(positions[i])
+                if parents is not None:
+                    parents[positions[i]] = parent
+                if counters is not None:
+                    counters["hull_lines"] += 1
+            start = end
+        value, machine = best(self.number_of_restructuring_days + 1)
+        if value > self.maximum_profit:
+            self.maximum_profit, self.last_machine = value, machine
@@ -0,0 +1,29 @@
+import numpy as np
+
+def new_parents(number_of_machines):
+    """
+    Allocates the parent-index array recorded by a solver during its solve
+    inputs:
+        <number_of_machines> :: Int - number of machines of the case
+    outputs:
+        <out> :: np.ndarray<Int32> - -1 for each machine (no machine owned before buying it)
+    """
+    return np.full(number_of_machines, -1, dtype=np.int32)
+
+def rebuild_plan(parents, last_machine):
+    """
+    Follows the parents back from the machine owned at the end of the restructuring, in O(length of the plan)
+    inputs:
+        <parents> :: np.ndarray<Int32> - index of the machine owned before buying each machine, -1 for none
+        <last_machine> :: Int - index of the machine owned at the end of the restructuring, -1 for none
+    outputs:
+        <out> :: List<Int> - indices of the machines bought, in order of acquisition. Each machine is
+        resold on the day the next one is bought, the last one at the end of the restructuring
+    """
+    plan = []
+    machine = last_machine
+    while machine != -1:
+        plan.append(machine)
+        machine = int(parents[machine])
+    plan.reverse()
+    return plan
@@ -1,25 +1,226 @@
+from .batch_profit_solver import BatchProfitSolver
+from .binary_case_file import BinaryCaseFile
+from .case import Case
+from .case_index import CaseIndex
+from .case_prefilter import CasePrefilter
+from .case_reader import CaseReader
+from .hull_profit_solver import HullProfitSolver
+from .instrumentation import CaseStatistics, measure, tracing
+from .li_chao_profit_solver import LiChaoProfitSolver
 from .profit_solver import ProfitSolver
-from .recursive_profit_solver import RecursiveProfitSolver
+from .result_cache import ResultCache
+from .solver_registry import AUTO, choose_solver, resolve_solver
+from array import array
+from collections import Counter, deque
+from inspect import signature
 from os import path, getcwd
 
 import linecache
+import numpy as np
+import time
+import tracemalloc
+
+PARSING_ERROR = "Error in the case found while parsing the machine descriptions"
+SOLVING_ERROR = "Error in the case found while solving: {}"
+
+def build_solver(case, solver=AUTO, options=None, record_plan=False):
+    """
+    Builds the solver of a case
+    inputs:
+        <case> :: Case - case to solve
+        <solver> :: String or Class - name or class of a solver of the registry, or "auto" to choose
+        it from the case (see solver_registry.choose_solver)
+        <options> :: Dict - keyword arguments of its solver() method, e.g. the maximum_number_of_acquisitions
+        of the exhaustive ProfitSolver
+        <record_plan> :: Bool - builds the solver recording the plan of the case (see records_plan)
+    outputs:
+        <out> :: Tuple(<0>, <1>)
+            <0> :: Object - solver of the case
+            <1> :: Dict - keyword arguments of its solver() method
+    """
+    solver = resolve_solver(solver)
+    if solver == AUTO:
+        solver = choose_solver(case)
+    return (solver(case, record_plan=True) if record_plan else solver(case)), dict(options or {})
+
+def records_plan(solver):
+    """
+    Checks whether a solver can record the plan of a case: the solvers chosen by the auto policy
+    do, and so do the ProfitSolver and the RecursiveProfitSolver
+    inputs:
+        <solver> :: String or Class - solver class, or "auto"
+    outputs:
+        <out> :: Bool
+    """
+    return solver == AUTO or "record_plan" in signature(solver).parameters
+
+def solve_case(case, solver=AUTO, options=None, instrument=False, record_plan=False):
+    """
+    Solves a single case (module-level so that worker processes can unpickle it)
+    inputs:
+        <case> :: Case - case to solve
+        <solver> :: String or Class - see build_solver
+        <options> :: Dict - see build_solver
+        <instrument> :: Bool - also returns the statistics of the solve (peak memory if the run is traced,
+        see instrumentation.tracing)
+        <record_plan> :: Bool - also returns the plan of the case
+    outputs:
+        <out> :: Int - maximum profit of the case
+        <out> :: Tuple(Int, Dict) - maximum profit, and statistics of the solve if <instrument> and the
+        plan (under "plan") if <record_plan>
+    """
+    result, options = build_solver(case, solver, options, record_plan)
+    if not instrument and not record_plan:
+        result.solver(**options)
+        return result.maximum_profit
+    details = {}
+    if instrument:
+        result.counters = Counter()
+        _, seconds, peak_memory = measure(lambda: result.solver(**options))
+        details.update({
+            "solver": type(result).__name__,
+            "solve_seconds": seconds,
+            "solve_peak_memory_bytes": peak_memory,
+            "counters": dict(result.counters),
+        })
+    else:
+        result.solver(**options)
+    if record_plan:
+        details["plan"] = result.plan()
+    return result.maximum_profit, details
+
+def batchable(case, maximum_machines):
+    """
+    Checks whether a case is solved with the BatchProfitSolver by the auto policy: small enough,
+    and with cash amounts fitting its int64 arithmetic
+    inputs:
+        <case> :: Case - case to solve
+        <maximum_machines> :: Int - largest number of machines of the cases solved together
+    outputs:
+        <out> :: Bool
+    """
+    return len(case) <= maximum_machines and case.dtype() == np.int64
+
+def solve_batch(cases, instrument=False):
+    """
+    Solves small cases together with the BatchProfitSolver, sharing the solve time of the batch among
+    its cases when instrumented
+    inputs:
+        <cases> :: List<Case> - cases to solve, whose cash amounts fit int64
+        <instrument> :: Bool - also returns the statistics of the cases
+    outputs:
+        <out> :: Tuple(<0>, <1>)
+            <0> :: List<Int> - maximum profit of each case
+            <1> :: List<Dict> - statistics of each case (counters of the batch on the first one), None if not <instrument>
+    """
+    solver = BatchProfitSolver(cases)
+    if not instrument:
+        return solver.solver().tolist(), None
+    solver.counters = Counter()
+    results, seconds, peak_memory = measure(solver.solver)
+    statistics = [{
+        "solver": "BatchProfitSolver",
+        "solve_seconds": seconds/len(cases),
+        "solve_peak_memory_bytes": peak_memory,
+        "batch_size": len(cases),
+        "counters": {},
+    } for _ in cases]
+    statistics[0]["counters"] = dict(solver.counters)
+    return results.tolist(), statistics
+
+def solve_chunk(cases, solvers, options=None, instrument=False, record_plan=False):
+    """
+    Solves a chunk of cases in a worker process (module-level so that worker processes can unpickle it):
+    the cases without solver together with the BatchProfitSolver, the others one at a time.
+    An error raised while solving a case is the result of that case only.
+    inputs:
+        <cases> :: List<Case> - cases to solve, None if not parsed
+        <solvers> :: List<Class> - solver of each case, None for the cases solved together
+        <options> :: Dict - see build_solver
+        <instrument> :: Bool - also returns the statistics of the solves
+        <record_plan> :: Bool - also returns the plans of the cases solved one at a time
+    outputs:
+        <out> :: List<Tuple(<0>, <1>)> - per case:
+            <0> :: Int (maximum profit) or String (error message)
+            <1> :: Dict - statistics of the solve and plan of the case (see solve_case), None if not
+            <instrument> nor <record_plan>, or not solved
+    """
+    results = [(PARSING_ERROR, None)]*len(cases)
+    batch = [i for i, (case, solver) in enumerate(zip(cases, solvers)) if case is not None and solver is None]
+    # Worker processes trace the memory allocations of instrumented chunks only
+    with tracing(instrument):
+        if batch:
+            try:
+                profits, statistics = solve_batch([cases[i] for i in batch], instrument)
+                for n, i in enumerate(batch):
+                    results[i] = (profits[n], None if statistics is None else statistics[n])
+            except Exception as error:
+                for i in batch:
+                    results[i] = (SOLVING_ERROR.format(repr(error)), None)
+        for i, (case, solver) in enumerate(zip(cases, solvers)):
+            if case is None or solver is None:
+                continue
+            try:
+                if instrument or record_plan:
+                    results[i] = solve_case(case, solver, options, instrument, record_plan)
+                else:
+                    results[i] = (solve_case(case, solver, options), None)
+            except Exception as error:
+                results[i] = (SOLVING_ERROR.format(repr(error)), None)
+    return results
 
 class CaseHandler:
     """
     Class object that handles the content of the input file and 
-    feeds cases to the ProfitSolver
+    feeds cases to the solvers of the registry
     """
-    def __init__(self, filename, print_descriptions = False):
+    # Cases with at most BATCH_MACHINES machines are solved together by groups of BATCH_SIZE cases
+    BATCH_MACHINES = 64
+    BATCH_SIZE = 1024
+    # Cases with at most PREFILTER_MACHINES machines skip the pre-filter, which costs more than it saves on them
+    PREFILTER_MACHINES = 64
+    # Worker processes receive chunks of at most CHUNK_SIZE cases, or CHUNK_MACHINES machines
+    CHUNK_SIZE = 256
+    CHUNK_MACHINES = 2**16
+
+    def __init__(self, filename, print_descriptions = False, instrument = False, cache = None, prefilter = True,
+                 solver = AUTO, solver_options = None, plan = False):
         """
         Initializes the CaseHandler object
         inputs:
             <filename> :: String - relative path to file from current folder
             <print_description> :: Boolean - checker function prints results when True
+            <instrument> :: Boolean - collects per-case statistics in <stats> when True
+            <cache> :: ResultCache or String - cache (or path of the cache) of the results looked up
+            before solving a case with the exact solvers
+            <prefilter> :: Boolean - removes the unaffordable and dominated machines of each case of more than
+            PREFILTER_MACHINES machines before solving it
+            <solver> :: String or Class - name or class of the solver of every case (see solver_registry.SOLVERS),
+            or "auto" to solve the small cases together and choose the solver of the others case by case
+            <solver_options> :: Dict - keyword arguments of the solver() method of the solver
+            <plan> :: Boolean - records the plan of each case in <plans> (the small cases are then solved
+            one at a time, and the result cache is not used)
         outputs:
             None
         """
         self.filename = filename
         self.print_descriptions = print_descriptions
+        self.instrument = instrument
+        self.cache = ResultCache(cache) if isinstance(cache, str) else cache
+        # Counts the machines removed by each rule over the cases read
+        self.prefilter = CasePrefilter() if prefilter else None
+        self.stats = CaseStatistics()
+        # Random access to the cases, opened on first use by solve_case and iter_cases
+        self.index = None
+        self.solver = resolve_solver(solver)
+        self.solver_options = dict(solver_options or {})
+        # Number of cases given to each solver
+        self.choices = Counter()
+        if plan and not records_plan(self.solver):
+            raise ValueError(f"{self.solver.__name__} does not record plans")
+        self.record_plan = plan
+        # Plan of each case solved, in case order (None if not solved), when recording the plans
+        self.plans = []
 
     def line_parser(self, input_line):
         """
@@ -45,6 +246,7 @@ class CaseHandler:
     def case_caching(self, location_in_input):
         """
         Extracts from the input the list of elements that build a single case.
+        Line-by-line access to the input: content_handler reads the whole file with the CaseReader.
         input:
             <location_in_input> :: Int - current line where the cacher starts in the input file
         output:
@@ -86,11 +288,432 @@ class CaseHandler:
 
         return True, (location_in_input+number_of_machines+1), case_context, machines
 
-    def content_handler(self, maximum_number_of_acquisitions=None):
+    def case_reader(self):
+        """
+        Chooses the reader of the input file from its content
+        inputs:
+            None
+        outputs:
+            <out> :: BinaryCaseFile (memory-mapped binary case file) or CaseReader (text input)
+        """
+        if BinaryCaseFile.recognizes(self.filename):
+            return BinaryCaseFile(self.filename)
+        return CaseReader(self.filename)
+
+    def case_index(self):
+        """
+        Gives random access to the cases of the input file: the binary case file itself, or the
+        sidecar index of a text file (built by a single scan of the file if missing or out of date)
+        inputs:
+            None
+        outputs:
+            <out> :: BinaryCaseFile or CaseIndex
+        """
+        if BinaryCaseFile.recognizes(self.filename):
+            if not isinstance(self.index, BinaryCaseFile):
+                self.index = BinaryCaseFile(self.filename)
+        elif not isinstance(self.index, CaseIndex) or not self.index.is_current():
+            self.index = CaseIndex.open(self.filename)
+        return self.index
+
+    def read_cases(self, cases=None):
+        """
+        Reads the cases of the input file and pre-filters their machines, recording their parsing when instrumented
+        inputs:
+            <cases> :: Iterable<Case> - cases read instead of the whole input file (None if not parsed)
+        outputs:
+            <out> :: Yields a Tuple(<0>, <1>)
+                <0> :: Dict - statistics record of the case, None if not instrumented
+                <1> :: Case - case read, None if not parsed
+        """
+        if cases is None:
+            cases = self.case_reader()
+        if not self.instrument:
+            for case in cases:
+                if self.prefiltered(case):
+                    case, _ = self.prefilter.filter(case)
+                yield None, case
+            return
+        cases = iter(cases)
+        while True:
+            case, seconds, peak_memory = measure(next, cases, StopIteration)
+            if case is StopIteration:
+                return
+            record = self.stats.new_record(seconds, peak_memory, case)
+            if self.prefiltered(case):
+                (case, removed), seconds, _ = measure(self.prefilter.filter, case)
+                record.update({"prefilter_seconds": seconds, "removed_machines": removed})
+            yield record, case
+
+    def prefiltered(self, case):
+        """
+        Checks whether a case read goes through the pre-filter: only the cases of more than
+        PREFILTER_MACHINES machines do, if the pre-filter is enabled
+        inputs:
+            <case> :: Case - case read, None if not parsed
+        outputs:
+            <out> :: Bool
+        """
+        return case is not None and self.prefilter is not None and len(case) > self.PREFILTER_MACHINES
+
+    def solver_arguments(self, maximum_number_of_acquisitions=None, streaming=False):
+        """
+        Solver and options of a run: the solver of the CaseHandler, unless the run asks for another one
+        inputs:
+            <maximum_number_of_acquisitions> :: Int - for testing, solves with the exhaustive ProfitSolver
+            restricted to permutations of at most this length
+            <streaming> :: Bool - solves the machines one at a time with the LiChaoProfitSolver (for the
+            cases of a text input, while they are read: see streamed_cases)
+        outputs:
+            <out> :: Tuple(String or Class, Dict) - solver (or "auto") and keyword arguments of its solver() method
+        """
+        if streaming:
+            return LiChaoProfitSolver, {}
+        if maximum_number_of_acquisitions is not None:
+            return ProfitSolver, {"maximum_number_of_acquisitions": maximum_number_of_acquisitions}
+        return self.solver, self.solver_options
+
+    def choose(self, case, solver):
+        """
+        Chooses the solver of a case with the auto policy if needed, and counts the choice
+        inputs:
+            <case> :: Case - case to solve
+            <solver> :: String or Class - solver class, or "auto"
+        outputs:
+            <out> :: Class - solver of the case
+        """
+        if solver == AUTO:
+            solver = choose_solver(case)
+        self.choices[solver.__name__] += 1
+        return solver
+
+    def solve(self, record, case, solver, options):
+        """
+        Solves a case in this process, completing its statistics record when instrumented
+        inputs:
+            <record> :: Dict - statistics record of the case, None if not instrumented
+            <case> :: Case - case to solve, None if not parsed
+            <solver> :: String or Class - solver class, or "auto"
+            <options> :: Dict - keyword arguments of its solver() method
+        outputs:
+            <out> :: Int (maximum profit) or String (error message)
+        """
+        if case is None:
+            if self.record_plan:
+                self.plans.append(None)
+            return PARSING_ERROR
+        solver = self.choose(case, solver)
+        if record is None and not self.record_plan:
+            return solve_case(case, solver, options)
+        result, details = solve_case(case, solver, options, record is not None, self.record_plan)
+        if self.record_plan:
+            self.plans.append(details.pop("plan"))
+        if record is not None:
+            record.update(details)
+        return result
+
+    def streamed_cases(self):
+        """
+        Reads the cases of a text input and pushes each machine to a LiChaoProfitSolver as soon as its
+        line is parsed: the result of a case is known when its last line is read, without building the
+        case. A case whose machines are not sorted by day is solved by the HullProfitSolver instead,
+        from the values of the machines read (kept in a compact array until the case is solved).
+        The CasePrefilter and the result cache need whole cases: they are not used.
+        inputs:
+            None
+        outputs:
+            <out> :: Yields Int (maximum profit) or String (error message) per case
+        """
+        reader = CaseReader(self.filename)
+        blocks = reader.line_blocks()
+        next(blocks)
+        while True:
+            traced = self.instrument and tracemalloc.is_tracing()
+            if traced:
+                tracemalloc.reset_peak()
+                memory_at_start = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            first_line = blocks.send(1)
+            if first_line == [] or first_line[0].rstrip(b"\r") == b"0 0 0":
+                return
+            case_context = reader.parse_context(first_line[0])
+            solver, values = (None, None) if case_context is None else self.stream_case(reader, blocks, case_context)
+            if self.instrument:
+                record = self.stats.new_record(
+                    0.0, tracemalloc.get_traced_memory()[1] - memory_at_start if traced else None, None
+                )
+                if solver is not None:
+                    # Reading the case is timed with its solve
+                    record.update({
+                        "machines": sum(day <= case_context[2] for day in values[::4]),
+                        "solver": type(solver).__name__,
+                        "solve_seconds": time.perf_counter() - start,
+                        "counters": dict(solver.counters),
+                    })
+            if self.record_plan:
+                self.plans.append(None if solver is None else solver.plan())
+            if solver is None:
+                yield PARSING_ERROR
+                continue
+            self.choices[type(solver).__name__] += 1
+            yield solver.maximum_profit
+
+    def stream_case(self, reader, blocks, case_context):
+        """
+        Reads the machine lines of a case one at a time, pushing them to a LiChaoProfitSolver, see streamed_cases
+        inputs:
+            <reader> :: CaseReader - reader of the input
+            <blocks> :: Generator - line blocks of the reader, positioned after the context line of the case
+            <case_context> :: List<Int> - context of case (N, C, D1)
+        outputs:
+            <out> :: Tuple(<0>, <1>)
+                <0> :: LiChaoProfitSolver or HullProfitSolver - solver holding the maximum profit of the case,
+                None if a machine line is not parsed
+                <1> :: array<Int64> - values D2, P, R, G of the machines read, one machine after the other
+        """
+        solver = LiChaoProfitSolver(case_context, record_plan=self.record_plan)
+        if self.instrument:
+            solver.counters = Counter()
+        # Values D2, P, R, G of the machines read, one machine after the other
+        values = array("q")
+        number_of_machines = case_context[0]
+        for position in range(number_of_machines):
+            line = blocks.send(1)
+            machine = reader.parse_machine(line[0]) if line else None
+            if machine is None:
+                # The case is skipped whole: its other lines are read and dropped
+                blocks.send(number_of_machines - position - 1)
+                return None, values
+            values.extend(machine)
+            if solver is None:
+                continue
+            if machine[0] < solver.current_day:
+                # Machines out of day order: the whole case is needed before solving
+                solver = None
+                continue
+            solver.push(*machine)
+        if solver is not None:
+            return solver, values
+        solver = HullProfitSolver(
+            Case.from_values(case_context, np.frombuffer(values, dtype=np.int64)), record_plan=self.record_plan
+        )
+        if self.instrument:
+            solver.counters = Counter()
+        solver.solver()
+        return solver, values
+
+    def solved_cases(self, maximum_number_of_acquisitions=None, streaming=False, workers=None, cases=None):
+        """
+        Reads the cases of the input file and yields their results in case order, taking the results
+        of the exact solvers from the result cache when the CaseHandler has one
+        inputs:
+            <maximum_number_of_acquisitions> :: Int - see solver_arguments
+            <streaming> :: Bool - see solver_arguments
+            <workers> :: Int - number of worker processes solving cases in parallel (None: in this process)
+            <cases> :: Iterable<Case> - see read_cases
+        outputs:
+            <out> :: Yields Int (maximum profit) or String (error message) per case
+        """
+        # Text inputs read whole are streamed; cases given or memory-mapped are already built
+        if streaming and cases is None and not BinaryCaseFile.recognizes(self.filename):
+            yield from self.streamed_cases()
+            return
+        solver, options = self.solver_arguments(maximum_number_of_acquisitions, streaming)
+        # Options only restrict the search of the exhaustive ProfitSolver: its results are not exact and not cached.
+        # Cached results have no plan.
+        if self.cache is None or options or self.record_plan:
+            yield from self.solve_cases(self.read_cases(cases), solver, options, workers)
+            return
+        # Keys of the cases read and not yielded yet, with their cached result (None: to be solved)
+        pending = deque()
+        def missed_cases():
+            for record, case in self.read_cases(cases):
+                key = None if case is None else self.cache.key(case)
+                result = None if key is None else self.cache.get(key)
+                pending.append((key, result))
+                if result is None:
+                    yield record, case
+                elif record is not None:
+                    record.update({"solver": "ResultCache", "solve_seconds": 0.0, "counters": {}})
+        try:
+            for result in self.solve_cases(missed_cases(), solver, options, workers):
+                # Cached results of the cases read before the case solved
+                while pending[0][1] is not None:
+                    yield pending.popleft()[1]
+                key, _ = pending.popleft()
+                if key is not None and not isinstance(result, str):
+                    self.cache.put(key, result)
+                yield result
+            while pending:
+                yield pending.popleft()[1]
+        finally:
+            self.cache.flush()
+
+    def solve_cases(self, cases, solver=AUTO, options=None, workers=None):
+        """
+        Solves cases and yields their results in case order
+        inputs:
+            <cases> :: Iterable<Tuple(Dict, Case)> - statistics records (None if not instrumented) and cases
+            <solver> :: String or Class - solver class, or "auto" to solve the small cases together
+            <options> :: Dict - keyword arguments of its solver() method
+            <workers> :: Int - number of worker processes solving cases in parallel (None: in this process)
+        outputs:
+            <out> :: Yields Int (maximum profit) or String (error message) per case
+        """
+        options = dict(options or {})
+        # The BatchProfitSolver does not record plans
+        batching = solver == AUTO and not self.record_plan
+        if workers is None and batching and not options:
+            yield from self.batched_cases(cases)
+            return
+        if workers is None:
+            for record, case in cases:
+                yield self.solve(record, case, solver, options)
+            return
+        # Imported on first use, to keep the import of the package light for short sequential runs
+        from concurrent.futures import ProcessPoolExecutor
+        arguments = (options, self.instrument, self.record_plan)
+        # Chunks submitted and not yielded yet: at most <2*workers> chunks are held in memory
+        pending = deque()
+        records, chunk, solvers, machines = [], [], [], 0
+        executor = ProcessPoolExecutor(workers)
+        try:
+            for record, case in cases:
+                records.append(record)
+                chunk.append(case)
+                # Solvers are chosen in this process, so that every choice is counted
+                if case is None:
+                    solvers.append(None)
+                    continue
+                if batching and self.batchable(case):
+                    self.choices["BatchProfitSolver"] += 1
+                    solvers.append(None)
+                else:
+                    solvers.append(self.choose(case, solver))
+                machines += len(case)
+                if len(chunk) >= self.CHUNK_SIZE or machines >= self.CHUNK_MACHINES:
+                    pending.append((records, chunk, solvers, executor.submit(solve_chunk, chunk, solvers, *arguments)))
+                    records, chunk, solvers, machines = [], [], [], 0
+                    if len(pending) >= 2*workers:
+                        results, executor = self.collect_results(pending, executor, workers, arguments)
+                        yield from results
+            if chunk:
+                pending.append((records, chunk, solvers, executor.submit(solve_chunk, chunk, solvers, *arguments)))
+            while pending:
+                results, executor = self.collect_results(pending, executor, workers, arguments)
+                yield from results
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def batchable(self, case):
+        """
+        Checks whether a case is solved with the BatchProfitSolver by the auto policy, see batchable
+        inputs:
+            <case> :: Case - case to solve
+        outputs:
+            <out> :: Bool
+        """
+        return batchable(case, self.BATCH_MACHINES)
+
+    def batched_cases(self, cases):
+        """
+        Yields the results of cases in case order, solving the consecutive small cases together
+        with the BatchProfitSolver (if their cash amounts fit its int64 arithmetic), and the other
+        cases with the solver chosen by the auto policy
+        inputs:
+            <cases> :: Iterable<Tuple(Dict, Case)> - statistics records (None if not instrumented) and cases
+        outputs:
+            <out> :: Yields Int (maximum profit) or String (error message) per case
+        """
+        batch, records = [], []
+        for record, case in cases:
+            if case is not None and self.batchable(case):
+                batch.append(case)
+                records.append(record)
+                if len(batch) == self.BATCH_SIZE:
+                    yield from self.solve_batch(batch, records)
+                    batch, records = [], []
+            else:
+                # Results of the small cases read before come first
+                if batch:
+                    yield from self.solve_batch(batch, records)
+                    batch, records = [], []
+                yield self.solve(record, case, AUTO, {})
+        if batch:
+            yield from self.solve_batch(batch, records)
+
+    def solve_batch(self, batch, records):
+        """
+        Solves small cases together, sharing the solve time of the batch among their records when instrumented
+        inputs:
+            <batch> :: List<Case> - cases to solve
+            <records> :: List<Dict> - statistics records of the cases (None if not instrumented)
+        outputs:
+            <out> :: List<Int> - maximum profit of each case
+        """
+        self.choices["BatchProfitSolver"] += len(batch)
+        results, statistics = solve_batch(batch, self.instrument)
+        if statistics is not None:
+            for record, case_statistics in zip(records, statistics):
+                record.update(case_statistics)
+        return results
+
+    def collect_results(self, pending, executor, workers, arguments):
+        """
+        Waits for the results of the oldest pending chunk. Errors are reported as the result of their case.
+        If a worker process dies, the pool is restarted and the cases of the chunk are solved again one
+        at a time to find out which one is the cause, before the other pending chunks are resubmitted.
+        inputs:
+            <pending> :: Deque<Tuple(List<Dict>, List<Case>, List<Class>, Future)> - statistics records,
+            cases, their solvers (see solve_chunk) and the future of their results, in case order
+            <executor> :: ProcessPoolExecutor - pool solving the pending chunks
+            <workers> :: Int - number of worker processes
+            <arguments> :: Tuple - arguments given to solve_chunk after the cases and their solvers
+        outputs:
+            <out> :: Tuple(<0>, <1>)
+                <0> :: List<Int (maximum profit) or String (error message)> - results of the oldest chunk
+                <1> :: ProcessPoolExecutor - pool to use for the next chunks
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        records, cases, solvers, future = pending.popleft()
+        try:
+            results = future.result()
+        except BrokenProcessPool:
+            executor.shutdown(cancel_futures=True)
+            executor = ProcessPoolExecutor(workers)
+            results = []
+            for case, solver in zip(cases, solvers):
+                try:
+                    results.extend(executor.submit(solve_chunk, [case], [solver], *arguments).result())
+                except BrokenProcessPool:
+                    executor.shutdown(cancel_futures=True)
+                    executor = ProcessPoolExecutor(workers)
+                    results.append((SOLVING_ERROR.format("worker process died"), None))
+                except Exception as error:
+                    results.append((SOLVING_ERROR.format(repr(error)), None))
+            for i, (other_records, other_cases, other_solvers, _) in enumerate(pending):
+                pending[i] = (
+                    other_records, other_cases, other_solvers,
+                    executor.submit(solve_chunk, other_cases, other_solvers, *arguments)
+                )
+        except Exception as error:
+            results = [(SOLVING_ERROR.format(repr(error)), None)]*len(cases)
+        for record, (_, details) in zip(records, results):
+            if self.record_plan:
+                self.plans.append(None if details is None else details.pop("plan"))
+            if record is not None and details is not None:
+                record.update(details)
+        return [result for result, _ in results], executor
+
+    def content_handler(self, maximum_number_of_acquisitions=None, streaming=False, workers=None):
         """
         Processes the input file and print the result (maximum profit) of each complete case found
         input:
-            <maximum_number_of_acquisitions> :: Int - for testing, allows to reduce the number of permutations
+            <maximum_number_of_acquisitions> :: Int - for testing, solves with the exhaustive ProfitSolver
+            restricted to permutations of at most this length (defaults to the solver of the CaseHandler)
+            <streaming> :: Bool - solves the machines one at a time with the LiChaoProfitSolver while they are read
+            <workers> :: Int - number of worker processes solving cases in parallel (None: in this process)
         output:
             <out> :: List<Int> - List of maximum profit per case found
         """ 
@@ -98,39 +721,73 @@ class CaseHandler:
             # Checks whether the given to the object is avaiable/accessible
             assert(self.check_file_exists()), "File not found/usable"
             assert(self.check_file_nonempty()), "File is empty"
-            # Initializes counters for the current case, and current location in the input file 
-            # /!\ the linechart.getline method starts at 1
+            # Initializes the counter for the current case, and the statistics of the cases when instrumented
             current_case = 1
-            current_line = 1
+            self.stats = CaseStatistics()
+            self.choices = Counter()
+            self.plans = []
             # Initializes the list of profits to be returned
             profits = []
-            # Runs as long at the case_cashing method outputs a True value in the first member of its output
-            while True:
-                go_to_next_case, current_line, case_context, machines = self.case_caching(current_line)
-                if case_context == []: # parsing error
-                    if machines == []:
-                        result = "Error in the case found while parsing the machine descriptions"
-                    else:
-                        result = "Error in the case found while parsing the context of the case"
-                else:
-                    # result = RecursiveProfitSolver(case_context, machines)
-                    # result.solver() # Max recursion depth reached on tests_runtime
-                    result = ProfitSolver(case_context, machines)
-                    result.solver(maximum_number_of_acquisitions) # Solves the case in exponential time /!\
-                    result = result.maximum_profit
-                if go_to_next_case:
+            # Runs over the cases read in a single pass by the CaseReader until its end (EOF or "0 0 0")
+            with tracing(self.instrument):
+                for result in self.solved_cases(maximum_number_of_acquisitions, streaming, workers):
                     profits.append(result)
                     print(f"Case {current_case}: {result}")
                     current_case += 1
-                else:
-                    break
             return profits
         except AssertionError:
             print("Wrong initialization of the object")
 
+    def iter_cases(self, case_numbers, maximum_number_of_acquisitions=None, streaming=False, workers=None):
+        """
+        Solves some cases of the input file, seeking to each of them through the case index instead
+        of reading the cases before them
+        inputs:
+            <case_numbers> :: Iterable<Int> - numbers of the cases, from 1 as printed by content_handler
+            (e.g. range(48213, 48313))
+            <maximum_number_of_acquisitions> :: Int - see solver_arguments
+            <streaming> :: Bool - see solver_arguments
+            <workers> :: Int - see solved_cases
+        outputs:
+            <out> :: Yields Int (maximum profit) or String (error message) per case, in the order given
+        """
+        index = self.case_index()
+        # Read once: the numbers are checked before any case is solved, then sought
+        case_numbers = list(case_numbers)
+        for case_number in case_numbers:
+            if not 1 <= case_number <= len(index):
+                raise IndexError(f"case {case_number} not found ({len(index)} cases in {self.filename})")
+        if isinstance(index, CaseIndex):
+            cases = index.cases(case_number-1 for case_number in case_numbers)
+        else:
+            cases = (index[case_number-1] for case_number in case_numbers)
+        yield from self.solved_cases(maximum_number_of_acquisitions, streaming, workers, cases)
+
+    def solve_case(self, case_number, maximum_number_of_acquisitions=None, streaming=False):
+        """
+        Solves a single case of the input file, see iter_cases
+        inputs:
+            <case_number> :: Int - number of the case, from 1 as printed by content_handler
+            <maximum_number_of_acquisitions> :: Int - see solver_arguments
+            <streaming> :: Bool - see solver_arguments
+        outputs:
+            <out> :: Int (maximum profit) or String (error message)
+        """
+        return next(self.iter_cases([case_number], maximum_number_of_acquisitions, streaming))
+
+    def export_stats(self, filename):
+        """
+        Writes the statistics of the cases of the last run as JSON lines
+        input:
+            <filename> :: String - path of the output file
+        output:
+            <out> :: None
+        """
+        self.stats.export_jsonl(filename)
+
     def check_filename(self):
         """
-        Checks whether the input filename is a textfile
+        Checks whether the input filename is a textfile or a binary case file
         """
         if self.filename == None:
             if self.print_descriptions:
@@ -140,13 +797,13 @@ class CaseHandler:
             if self.print_descriptions: 
                 print("filename check: provided filename not receivable") 
             return False
-        elif self.filename.endswith(".txt"): 
+        elif self.filename.endswith(".txt") or BinaryCaseFile.recognizes(self.filename):
             if self.print_descriptions: 
                 print("filename check: right format ")
             return True
         else:
             if self.print_descriptions: 
-                print("filename check: wrong file format (need .txt)")
+                print("filename check: wrong file format (need .txt or binary case file)")
             return False
 
     def check_file_exists(self):
@@ -1,29 +1,107 @@
-import itertools
+from .case import Case
+from .plan import new_parents, rebuild_plan
+from .strategy_trie import StrategyTrie
+from bisect import bisect_left
+
+import time
 
 class ProfitSolver:
-    def __init__(self, case_context, machines):
+    def __init__(self, case_context, machines=None, record_plan=False, max_cached_states=10**6):
         """
         Initializes the ProfitSolver object
         inputs:
-            <case_context> :: List<Int> - context of case (N, C, D1)
-            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G)
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+            <record_plan> :: Bool - records the parent of each machine during the solve, see plan()
+            <max_cached_states> :: Int - largest number of strategy states cached during the solve (None: no limit),
+            the nodes of the strategies left open and of their prefixes are kept whatever the limit
         N: number of machines, C: cash at hand, D1: days of restructuring
         D2: day of availability, P: acquisition price, R: resell price, G: daily profit
         outputs:
             None
         """
-        self.starting_cash = case_context[1]
-        self.maximum_profit = case_context[1]
-        self.length_of_restructuring = case_context[2]
-        self.machines = machines
-        self.memory = {}
+        case = Case.build(case_context, machines)
+        self.starting_cash = case.cash_at_hand
+        self.maximum_profit = case.cash_at_hand
+        self.length_of_restructuring = case.number_of_restructuring_days
+        self.machines = case.machines()
+        # Prefix trie of the strategies explored, set by sorted_perms
+        self.max_cached_states = max_cached_states
+        self.memory = None
+        # Counter of the operations performed by the solver, set when the CaseHandler is instrumented
+        self.counters = None
+        # Machine owned before buying each machine in the best strategy reaching it, cash at hand after
+        # buying it in that strategy, and machine owned at the end of the best strategy (-1: none)
+        self.parents = new_parents(len(self.machines)) if record_plan else None
+        self.best_cash = [None]*len(self.machines) if record_plan else None
+        self.last_machine = -1
+        # Days of the machines, then the largest G and the sum of the positive resale margins R - P
+        # of the machines from each index on, bounding the cash of the strategies extending a state
+        self.days = [machine[0] for machine in self.machines]
+        self.largest_profits, self.margins = [0]*(len(self.machines)+1), [0]*(len(self.machines)+1)
+        for i in range(len(self.machines)-1, -1, -1):
+            day, price, resell, profit = self.machines[i]
+            self.largest_profits[i] = max(self.largest_profits[i+1], profit)
+            self.margins[i] = self.margins[i+1] + max(resell-price, 0)
+        # Upper bound of the maximum profit, and whether the maximum profit found is proven optimal
+        self.upper_bound = None
+        self.optimal = False
+        # Largest optimistic bound of the strategies of the previous and the current lengths that can
+        # still be extended into a better strategy
+        self.open_bounds = [None, None]
+
+    def record_strategy(self, machine, parent, end_state):
+        """
+        Records the strategy as the best one reaching its last machine if it ends with more cash at hand
+        inputs:
+            <machine> :: Int - index of the last machine of the strategy
+            <parent> :: Int - index of the machine owned before it, -1 for none
+            <end_state> :: List<Int> - end state of the strategy
+        outputs:
+            <out> :: None
+        """
+        if self.best_cash[machine] is None or end_state[2] > self.best_cash[machine]:
+            self.best_cash[machine] = end_state[2]
+            self.parents[machine] = parent
+
+    def step(self, state, machine):
+        """
+        Buys a machine, reselling the machine owned: the acquisition is valid if it breaks-even or profits
+        inputs:
+            <state> :: List<Int> - state (day, resell price, cash at hand, profit) of ACM before the acquisition
+            <machine> :: Int - index of the machine bought
+        outputs:
+            <out> :: List<Int> - state after the acquisition, None if ACM cannot afford the machine
+        """
+        day, price, resell, profit = self.machines[machine]
+        cash_at_hand = state[1] + state[2] - price + max(day-state[0]-1, 0)*state[3]
+        if cash_at_hand < 0:
+            return None
+        return [day, resell, cash_at_hand, profit]
+
+    def optimistic_bound(self, state):
+        """
+        Bounds the cash at the end of the restructuring of every strategy extending a state: each
+        acquisition loses P - R (unless R > P), and no machine from the day of the state on earns more
+        than the largest G of these machines
+        inputs:
+            <state> :: List<Int> - state (day, resell price, cash at hand, profit) of ACM after an acquisition
+        outputs:
+            <out> :: Int - upper bound of the maximum profit reachable from the state
+        """
+        day, resell, cash_at_hand, profit = state
+        first_machine = bisect_left(self.days, day)
+        largest_profit = max(profit, self.largest_profits[first_machine])
+        return cash_at_hand + resell + (self.length_of_restructuring-day)*largest_profit + self.margins[first_machine]
 
     def sorted_perms(self, machines, n=None):
         """
         Generates all sorted permutations of <machines> of max length <n>, creating "strategies"
-        Checks if the first elements of the strategy are stored in memory and reuse an attached state
-        Checks if the strategy breaks-even or profits (giving an end state), reusing the memory if available
-        Records the strategy and its attached end state in memory
+        Strategies are extended one machine at a time, by length, from the states cached in a prefix
+        trie (see StrategyTrie): a strategy is extended by the machines of its last day or later
+        Dead ends (an acquisition that does not break-even) are not extended
+        Prunes the strategies whose optimistic bound does not beat the maximum profit found when their
+        end state is consumed, and again before extending them: they are not extended either
         Yields the end state of the strategy when the last machine of a strategy is acquired:
             - The end state represents ACM's finances at the end of the strategy
         
@@ -36,64 +114,65 @@ class ProfitSolver:
             <machines> :: List<List<Int>> - List of machine descriptions (D, P, R, G)
             <n> :: Int - Maximum length of permutations authorized (used for testing)
         output:
-            <out> :: Yields a machine description (D, P, R, G) -- the end state of the strategy
+            <out> :: Yields a Tuple(List<Int>, Bool) -- the end state of the strategy (None for a dead end),
+            and a token to indicate to the solver() to try update the maximum_profit
         """
-
-        def is_strategy_valid(initial_state, strategy, strategy_string):
-            """
-            Iterates each step of the strategy (after memory if available):
-                - Memorizes the end state for the whole strategy if iteration finishes
-                - None if it fails at a step (i.e. it didn't break-even)
-            inputs:
-                <initial_state> :: List<Int> - State of ACM's finances at start of <strategy>
-                <strategy> :: List<List<Int>> - List of machine descriptions (D, P, R, G)
-                <strategy_string> :: String - string representation of the strategy
-            outputs:
-                <out> :: (List<Int>, Bool) - returns the end state if any, and a token to indicate to the solver()
-                to try update the maximum_profit global variable
-            """
-            # Checks if each step of the strategy breaks-even or profits
-            for step in strategy:
-                cash_after_resell_buy = initial_state[1]+initial_state[2]-step[1]
-                accumulated_profit = (max(step[0]-initial_state[0]-1,0))*initial_state[3]
-                is_acquisition_valid = cash_after_resell_buy+accumulated_profit
-                # if sound: update the initial state to an intermediary one
-                if is_acquisition_valid >= 0:
-                    initial_state = [step[0], step[2], is_acquisition_valid, step[3]]
-                # if unsound: exit and memorizes the dead end
-                else:
-                    self.memory[strategy_string]=None
-                    return None, False
-            # Memorized the end state of the whole strategy
-            self.memory[strategy_string]=initial_state
-            return initial_state, True
-
+        counters = self.counters
         # Checks if the provided max length of permutation is acceptable, and defaults if not
         if (n==None or type(n)!=int) or (n>(self.length_of_restructuring+1)//2 or n<0):
             n = min(len(machines), (self.length_of_restructuring+1)//2)
         # Declares ACM's start state at day 0
         state_ACM_at_day_zero = [0,0,self.starting_cash,0] 
+        self.memory = StrategyTrie(state_ACM_at_day_zero, self.max_cached_states)
+        self.open_bounds = [None, self.optimistic_bound(state_ACM_at_day_zero)]
+        # Nodes of the strategies of the previous length left open
+        frontier = [StrategyTrie.ROOT]
         # for each length of permutation do:
         for r in range(1, n+1):
-            # clears memory of superfluous entries (length r-2). Permutations are iterated in order and end
-            # states are carrried from one length of permutation to the next
-            self.memory = {k: v for k, v in self.memory.items() if len(eval(k)) <= r-2}
-            for strategy in itertools.permutations(machines, r):
-                strategy_string = str(strategy)
-                # if permutations are singletons
-                if r == 1:
-                    yield is_strategy_valid(state_ACM_at_day_zero, strategy, strategy_string)
-                # Checks if the dates of the last two elements are ordered with 1 day between them
-                elif strategy[-2][0] < strategy[-1][0]+1:
-                    first_elements = str(strategy[:-1])
-                    # Checks if the first elements of the permutation are absent from memory
-                    if  first_elements not in self.memory.keys(): 
-                        # Checks if the first elements of the permutation are sorted
-                        if(all(((strategy[i][0] < (strategy[i + 1][0]+1) 
-                                 for i in range(len(strategy)-1))))):   
-                            yield is_strategy_valid(state_ACM_at_day_zero, strategy, strategy_string)
-                    else:
-                        yield is_strategy_valid(self.memory[first_elements], [strategy[-1]], strategy_string)
+            # Stops when every strategy of the previous length was pruned or is a dead end
+            if self.open_bounds[1] is None:
+                return
+            self.open_bounds = [self.open_bounds[1], None]
+            next_frontier = []
+            for node in frontier:
+                state, cached = self.memory.state(node, self.step)
+                if counters is not None:
+                    counters["memory_hits" if cached else "recomputed_states"] += 1
+                # The maximum profit may have improved since the strategy was left open
+                if node != StrategyTrie.ROOT and self.optimistic_bound(state) <= self.maximum_profit:
+                    if counters is not None:
+                        counters["pruned"] += 1
+                    continue
+                last_machine = self.memory.machines[node]
+                # Machines of the same day already bought by the strategy
+                same_day = set()
+                ancestor = node
+                while ancestor != StrategyTrie.ROOT and self.days[self.memory.machines[ancestor]] == state[0]:
+                    same_day.add(self.memory.machines[ancestor])
+                    ancestor = self.memory.parents[ancestor]
+                for machine in range(bisect_left(self.days, state[0]), len(machines)):
+                    if machine in same_day:
+                        continue
+                    end_state = self.step(state, machine)
+                    if end_state is None:
+                        yield None, False
+                        continue
+                    if self.parents is not None:
+                        self.record_strategy(machine, last_machine, end_state)
+                    yield end_state, True
+                    # The maximum profit includes the strategy once its end state is consumed
+                    bound = self.optimistic_bound(end_state)
+                    if bound <= self.maximum_profit:
+                        if counters is not None:
+                            counters["pruned"] += 1
+                        continue
+                    if self.open_bounds[1] is None or bound > self.open_bounds[1]:
+                        self.open_bounds[1] = bound
+                    # Strategies of the last length are not extended
+                    if r < n:
+                        next_frontier.append(self.memory.add(node, machine, end_state))
+            # Strategies closed at this length are dropped from the trie
+            frontier = self.memory.compact(next_frontier)
 
     def profit_till_end(self, cash_at_hand, days_to_end, resell, profit):
         """
@@ -108,15 +187,29 @@ class ProfitSolver:
         """
         return cash_at_hand + resell + days_to_end*profit
 
-    def solver(self, maximum_number_of_acquisitions=None):
+    def solver(self, maximum_number_of_acquisitions=None, time_budget=None, max_states=None):
         """
         Starts the solver and consumes the result of each generated permutation of possible strategies.
+        Anytime mode: with a time budget or a maximum number of states, the search stops early and
+        keeps the best profit found so far, with an upper bound of the maximum profit.
         inputs:
             <maximum_number_of_acquisitions> :: Int - Maximum length of permutations authorized
+            <time_budget> :: Float - seconds after which the search stops
+            <max_states> :: Int - number of strategies evaluated after which the search stops
         outputs:
-            <out> :: None
+            <out> :: Tuple(<0>, <1>, <2>)
+                <0> :: Int - maximum profit found (also in <maximum_profit>)
+                <1> :: Int - upper bound of the maximum profit (also in <upper_bound>)
+                <2> :: Bool - True if the maximum profit found is proven optimal (also in <optimal>)
         """
-        for case, update in self.sorted_perms(self.machines, maximum_number_of_acquisitions):
+        counters = self.counters
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        states = 0
+        strategies = self.sorted_perms(self.machines, maximum_number_of_acquisitions)
+        stopped = False
+        for case, update in strategies:
+            if counters is not None:
+                counters["strategies"] += 1
             if update:
                 self.maximum_profit = max(
                     self.maximum_profit,
@@ -126,3 +219,49 @@ class ProfitSolver:
                         case[2],
                         case[3])
                 )
+            states += 1
+            if (max_states is not None and states >= max_states) or (deadline is not None and time.perf_counter() >= deadline):
+                stopped = True
+                break
+        strategies.close()
+        if self.parents is not None:
+            self.last_machine = self.best_last_machine()
+        # Strategies not explored extend the strategies of the previous length left open (all of them
+        # if the search stopped), or of the last length explored
+        n = maximum_number_of_acquisitions
+        exhaustive = n is None or type(n) != int or n < 0 or n >= min(len(self.machines), (self.length_of_restructuring+1)//2)
+        open_bound = self.open_bounds[0] if stopped else self.open_bounds[1]
+        self.optimal = open_bound is None or (not stopped and exhaustive)
+        self.upper_bound = self.maximum_profit if self.optimal else max(self.maximum_profit, open_bound)
+        return self.maximum_profit, self.upper_bound, self.optimal
+
+    def best_last_machine(self):
+        """
+        Finds the machine owned at the end of the best strategy recorded
+        inputs:
+            None
+        outputs:
+            <out> :: Int - index of the machine, -1 if keeping the starting cash is best
+        """
+        last_machine, maximum_profit = -1, self.starting_cash
+        for machine, cash_at_hand in enumerate(self.best_cash):
+            if cash_at_hand is not None:
+                day, _, resell, profit = self.machines[machine]
+                end_profit = self.profit_till_end(cash_at_hand, self.length_of_restructuring-day, resell, profit)
+                if end_profit > maximum_profit:
+                    last_machine, maximum_profit = machine, end_profit
+        return last_machine
+
+    def plan(self):
+        """
+        Rebuilds the best strategy from the parents recorded during the solve. With a binding maximum
+        number of acquisitions, the plan can be longer and more profitable than the strategies solved.
+        inputs:
+            None
+        outputs:
+            <out> :: List<List<Int>> - machine descriptions (D2, P, R, G) bought, in order of acquisition,
+            each resold on the day the next one is bought; None if the plan was not recorded
+        """
+        if self.parents is None:
+            return None
+        return [self.machines[machine] for machine in rebuild_plan(self.parents, self.last_machine)]
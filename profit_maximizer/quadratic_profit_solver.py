@@ -0,0 +1,67 @@
+from .case import Case
+
+import numpy as np
+
+class QuadraticProfitSolver:
+    """
+    Reference Profit Solver running the plain O(N**2) DP over the machines sorted by day
+
+    dp_j is the maximum of C and of the lines G_i*D_j + (R_i - P_i + dp_i - G_i*(D_i+1)) of the
+    affordable machines i of earlier days. All the machines of a day share the same dp, so each day
+    costs one vectorized evaluation of the lines of the earlier days, in O(N) memory.
+    """
+    def __init__(self, case_context, machines=None):
+        """
+        Initializes the QuadraticProfitSolver object
+        inputs:
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+        N: number of machines, C: cash at hand, D1: days of restructuring
+        D2: day of availability, P: acquisition price, R: resell price, G: daily profit
+        outputs:
+            None
+        """
+        self.case = Case.build(case_context, machines)
+        self.cash_at_hand = self.case.cash_at_hand
+        self.number_of_restructuring_days = self.case.number_of_restructuring_days
+        self.maximum_profit = self.case.cash_at_hand
+        # Counter of the operations performed by the solver, set when the CaseHandler is instrumented
+        self.counters = None
+
+    def solver(self):
+        """
+        Computes dp_j for each machine, one day at a time, then the maximum profit at the end of the restructuring
+        inputs:
+            <int> :: None
+        outputs:
+            <out> :: None
+        """
+        case = self.case
+        if not len(case):
+            return
+        dtype = case.dtype()
+        day, price, resell, profit = (a.astype(dtype) for a in (case.day, case.price, case.resell, case.profit))
+        # Lines of the affordable machines of the days already solved
+        slopes = np.empty(len(case), dtype=dtype)
+        intercepts = np.empty(len(case), dtype=dtype)
+        number_of_lines = 0
+        # First index of each day
+        starts = np.flatnonzero(np.diff(case.day, prepend=case.day[0]-1)).tolist() + [len(case)]
+        for start, end in zip(starts, starts[1:]):
+            dp = self.cash_at_hand
+            if number_of_lines:
+                if self.counters is not None:
+                    self.counters["line_evaluations"] += number_of_lines
+                values = slopes[:number_of_lines]*day[start] + intercepts[:number_of_lines]
+                dp = max(dp, values.max())
+            affordable = np.flatnonzero(price[start:end] <= dp) + start
+            new_lines = number_of_lines + len(affordable)
+            slopes[number_of_lines:new_lines] = profit[affordable]
+            intercepts[number_of_lines:new_lines] = (
+                dp - price[affordable] + resell[affordable] - profit[affordable]*(day[affordable]+1)
+            )
+            number_of_lines = new_lines
+        if number_of_lines:
+            end_of_restructuring = self.number_of_restructuring_days + 1
+            values = slopes[:number_of_lines]*end_of_restructuring + intercepts[:number_of_lines]
+            self.maximum_profit = max(self.maximum_profit, int(values.max()))
@@ -1,22 +1,42 @@
+from .case import Case
+from .plan import new_parents, rebuild_plan
+from bisect import bisect_right
+
+import heapq
+import numpy as np
+
 class RecursiveProfitSolver:
     """
-    Profit Solver using a recursive function
+    Profit Solver exploring the machine switches with an explicit work list instead of recursion
+
+    The work list holds the machines reached by a switch. Machines are sorted by day, so popping the
+    smallest index first visits every machine after all of its possible predecessors: the best cash
+    at hand reached for a machine is then final, and states with less cash on the same machine are dropped.
     """
-    def __init__(self, case_context, machines):
+    def __init__(self, case_context, machines=None, record_plan=False):
         """
         Initializes the RecursiveProfitSolver object
         inputs:
-            <case_context> :: List<Int> - context of case (N, C, D1)
-            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G)
+            <case_context> :: Case or List<Int> - case, or context of case (N, C, D1)
+            <machines> :: List<List<Int>> - List of machine descriptions (D2, P, R, G), if not a Case
+            <record_plan> :: Bool - records the parent of each machine during the solve, see plan()
         N: number of machines, C: cash at hand, D1: days of restructuring
         D2: day of availability, P: acquisition price, R: resell price, G: daily profit
         outputs:
             None
         """
-        self.cash_at_hand = case_context[1]
-        self.number_of_restructuring_days = case_context[2]
-        self.machines = sorted(machines, key=lambda x: x[0])
-        self.maximum_profit = case_context[1]
+        case = Case.build(case_context, machines)
+        self.case = case
+        self.cash_at_hand = case.cash_at_hand
+        self.number_of_restructuring_days = case.number_of_restructuring_days
+        self.machines = case.machines()
+        self.maximum_profit = case.cash_at_hand
+        # Counter of the operations performed by the solver, set when the CaseHandler is instrumented
+        self.counters = None
+        # Machine owned before buying each machine in the best strategy reaching it, and machine owned
+        # at the end of the best strategy (-1: none)
+        self.parents = new_parents(len(case)) if record_plan else None
+        self.last_machine = -1
 
     def profit_till_end(self, cash_at_hand, days_to_end, resell, profit):
         """
@@ -31,45 +51,65 @@ class RecursiveProfitSolver:
         """
         return cash_at_hand + resell + days_to_end*profit
 
-    def recursive_solver(self, current_day, cash_at_hand, resell, daily_profit):
+    def iterative_solver(self, current_day, cash_at_hand, resell, daily_profit):
         """
-        Recursively over the available machines at a specific time
+        Explores the machine switches available from a state, then from each machine reached
+        (the state is the one of the machine owned, -1 for the starting state, when recording the plan)
         input:
+            <current_day> :: Int - Day the currently owned machine was bought
             <cash_at_hand> :: Int - Cash ACM currently holds
-            <days_to_end> :: Int - Days to go till the end of restructuring
             <resell> :: Int - Resell price of the machine currently owned
-            <profit> :: Int - Profit the machine currently owned produces daily
+            <daily_profit> :: Int - Profit the machine currently owned produces daily
         output:
-            <out> :: Int - Accumulated profit till the end of restructuring
+            <out> :: None
         """
-        # lambda function to check if two days separate the currently owned machine 
-        # from to currently available machine
-        check_day = lambda m: m[0] > current_day+1
-        # lambda function to check if switching to the available machine is a breaking-even
-        # or profitable move
-        solvable = lambda m: (m[0]-current_day-1)*daily_profit+cash_at_hand
-        # Finds all available moves
-        available_moves = list(filter(lambda m: check_day(m) and solvable(m)>=m[1], self.machines))
-        # Updates the maximum profit possible if no machine switch is performed till the end
-        self.maximum_profit = max(
-            self.maximum_profit,
-            self.profit_till_end(
-                cash_at_hand, 
-                self.number_of_restructuring_days-current_day, 
-                resell,daily_profit
-                )
-        )
-        # For each possible move, recurse with updating the current cash at hand
-        for machine in available_moves:
-            new_cash_at_hand = cash_at_hand - machine[1] + resell + daily_profit*(machine[0]-current_day-1)
-            self.recursive_solver(machine[0], new_cash_at_hand, machine[2], machine[3])
-
+        case = self.case
+        days = case.day.tolist()
+        dtype = case.dtype()
+        day, price = case.day.astype(dtype), case.price.astype(dtype)
+        # Best cash at hand after buying each machine (-1: not reached)
+        best = np.full(len(days), -1, dtype=dtype)
+        reached = np.zeros(len(days), dtype=bool)
+        work_list = []
+        parents = self.parents
+        current_machine = -1
+        state = (current_day, cash_at_hand, resell, daily_profit)
+        while True:
+            current_day, cash_at_hand, resell, daily_profit = state
+            # Updates the maximum profit possible if no machine switch is performed till the end
+            profit = self.profit_till_end(
+                cash_at_hand,
+                self.number_of_restructuring_days-current_day,
+                resell, daily_profit
+            )
+            if profit > self.maximum_profit:
+                self.maximum_profit = profit
+                self.last_machine = current_machine
+            # Machines separated by at least two days from the currently owned machine, found by bisection
+            first = bisect_right(days, current_day+1)
+            if self.counters is not None:
+                self.counters["states_expanded"] += 1
+                self.counters["switches_evaluated"] += len(days) - first
+            # Switches that break-even, and improve on the best cash at hand reached for the machine
+            new_cash_at_hand = (cash_at_hand + resell - daily_profit*(current_day+1)) + daily_profit*day[first:] - price[first:]
+            improved = (new_cash_at_hand >= 0) & (new_cash_at_hand > best[first:])
+            best[first:][improved] = new_cash_at_hand[improved]
+            if parents is not None:
+                parents[first:][improved] = current_machine
+            for machine in (np.flatnonzero(improved & ~reached[first:]) + first).tolist():
+                reached[machine] = True
+                heapq.heappush(work_list, machine)
+            if not work_list:
+                return
+            current_machine = heapq.heappop(work_list)
+            machine = self.machines[current_machine]
+            state = (days[current_machine], int(best[current_machine]), machine[2], machine[3])
 
     def solver(self):
         """
-        Starts the solver and begins a recursion for each of the choices available to ACM with its starting cash.
+        Starts the solver from the choices available to ACM with its starting cash.
 
-        ACM's starting state (Number of machines, Cash at hand, Days of restructuring) can be 
+        ACM's starting state (Number of machines, Cash at hand, Days of restructuring) can be
         expressed as a machine state:
             - [Day, Cash-at-hand, Resell Price, Profit]
             - [0, cash at hand, 0, 0] ACM 'owns' a 0-value machine that earns 0 with resell price 0 at day 0
@@ -80,7 +120,19 @@ class RecursiveProfitSolver:
             <out> :: None
         """
         # initial_case = [-1, self.cash_at_hand, 0, 0]
-        # -1 for the first element because the lambda function check_day in the
-        # recursive function checks machines separated by at least 2 days (including)
-        # but machines are available from day 1
-        self.recursive_solver(-1, self.cash_at_hand, 0, 0)
\ No newline at end of file
+        # -1 for the first element because the iterative solver checks machines
+        # separated by at least 2 days (including) but machines are available from day 1
+        self.iterative_solver(-1, self.cash_at_hand, 0, 0)
+
+    def plan(self):
+        """
+        Rebuilds the best strategy from the parents recorded during the solve
+        inputs:
+            None
+        outputs:
+            <out> :: List<List<Int>> - machine descriptions (D2, P, R, G) bought, in order of acquisition,
+            each resold on the day the next one is bought; None if the plan was not recorded
+        """
+        if self.parents is None:
+            return None
+        return [self.machines[machine] for machine in rebuild_plan(self.parents, self.last_machine)]
@@ -0,0 +1,155 @@
+from hashlib import blake2b
+
+import numpy as np
+import sqlite3
+import time
+
+class ResultCache:
+    """
+    Persistent cache of the maximum profits of the cases, stored in a SQLite database.
+
+    A case is keyed by a hash of its normalized content: C, D1 and the machines available during the
+    restructuring (D2 <= D1) sorted by all their characteristics, so that the machine order of the input
+    and the machines discarded by the day filter do not matter. When the cache holds more than
+    <maximum_entries> results, the least recently used ones are evicted.
+    Several processes can share the database: writes are grouped in transactions, and SQLite locks
+    the file while they are committed.
+    """
+    # Number of insertions and lookups buffered before they are written to the database
+    FLUSH_SIZE = 4096
+
+    def __init__(self, filename, maximum_entries=10**6, timeout=30):
+        """
+        Opens (or creates) the cache
+        inputs:
+            <filename> :: String - path of the database
+            <maximum_entries> :: Int - number of results kept
+            <timeout> :: Float - seconds waited for another process to release the database
+        outputs:
+            None
+        """
+        self.filename = filename
+        self.maximum_entries = maximum_entries
+        self.connection = sqlite3.connect(filename, timeout=timeout)
+        with self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, result TEXT, last_used INTEGER)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+        # Results solved and keys used since the last flush
+        self.insertions = {}
+        self.lookups = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(case):
+        """
+        Hashes the normalized content of a case
+        inputs:
+            <case> :: Case - case to hash
+        outputs:
+            <out> :: Bytes - 16-byte key of the case
+        """
+        machines = np.stack((case.day, case.price, case.resell, case.profit), axis=1)
+        machines = machines[np.lexsort(machines.T[::-1])]
+        digest = blake2b(digest_size=16)
+        digest.update(np.array([case.cash_at_hand, case.number_of_restructuring_days], dtype="<i8").tobytes())
+        digest.update(machines.astype("<i8").tobytes())
+        return digest.digest()
+
+    def get(self, key):
+        """
+        Looks up the result of a case
+        inputs:
+            <key> :: Bytes - key of the case
+        outputs:
+            <out> :: Int - maximum profit of the case, None if not cached
+        """
+        result = self.insertions.get(key)
+        if result is None:
+            row = self.connection.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            result = None if row is None else int(row[0])
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.lookups[key] = time.time_ns()
+        self.flush_if_full()
+        return result
+
+    def put(self, key, result):
+        """
+        Stores the result of a case
+        inputs:
+            <key> :: Bytes - key of the case
+            <result> :: Int - maximum profit of the case
+        outputs:
+            <out> :: None
+        """
+        self.insertions[key] = result
+        self.flush_if_full()
+
+    def flush_if_full(self):
+        if len(self.insertions) + len(self.lookups) >= self.FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered results and uses to the database in one transaction, then evicts the
+        least recently used results beyond the size limit
+        inputs:
+            None
+        outputs:
+            <out> :: None
+        """
+        if not self.insertions and not self.lookups:
+            return
+        now = time.time_ns()
+        with self.connection:
+            # Results are stored as text: they can exceed the range of SQLite integers
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                [(key, str(result), now) for key, result in self.insertions.items()]
+            )
+            self.connection.executemany(
+                "UPDATE results SET last_used = max(last_used, ?) WHERE key = ?",
+                [(last_used, key) for key, last_used in self.lookups.items()]
+            )
+            excess = len(self) - self.maximum_entries
+            if excess > 0:
+                self.connection.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                    (excess,)
+                )
+        self.insertions.clear()
+        self.lookups.clear()
+
+    def statistics(self):
+        """
+        Counters of the lookups since the cache was opened
+        outputs:
+            <out> :: Dict - hits, misses and number of results stored
+        """
+        self.flush()
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self):
+        """
+        Flushes the buffered writes and closes the database
+        """
+        self.flush()
+        self.connection.close()
+
+    def __len__(self):
+        """
+        Number of results stored in the database
+        """
+        return self.connection.execute("SELECT count(*) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
@@ -0,0 +1,367 @@
+"""
+Solving service: keeps a warm process and a pool of workers answering cases sent over a socket.
+
+Usage:
+    $ python -m profit_maximizer.server --port 8765
+    $ python -m profit_maximizer.server --unix /tmp/profit_maximizer.sock --workers 4
+    $ nc -N localhost 8765 < tests/inputs/input.txt
+
+Each connection sends cases in the text format of the instructions, ended by a "0 0 0" line or by
+closing its side of the connection, and receives one "Case k: X" line per case, in case order, as
+soon as the case is solved. The connection is closed after the last result.
+"""
+from .case_prefilter import CasePrefilter
+from .case_reader import CaseReader
+from .profit_maximizer import CaseHandler, PARSING_ERROR, SOLVING_ERROR, batchable, solve_chunk
+from .solver_registry import choose_solver
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+
+TIMEOUT_ERROR = SOLVING_ERROR.format("timeout")
+
+def solve_micro_batch(cases):
+    """
+    Parses, pre-filters and solves a micro-batch of cases in a worker process (module-level so that
+    workers can unpickle it), with the rules of the CaseHandler: the pre-filter skips the small cases,
+    and the small cases whose cash amounts fit int64 are solved together (see solve_chunk)
+    inputs:
+        <cases> :: List<Tuple(List<Int>, List<Bytes>)> - context of each case (N, C, D1) and its machine lines
+    outputs:
+        <out> :: List<Int (maximum profit) or String (error message)> - result of each case
+    """
+    prefilter = CasePrefilter()
+    parsed, solvers = [], []
+    for case_context, machine_lines in cases:
+        case = CaseReader.parse_machines(case_context, machine_lines)
+        if case is not None and len(case) > CaseHandler.PREFILTER_MACHINES:
+            case, _ = prefilter.filter(case)
+        parsed.append(case)
+        solvers.append(None if case is None or batchable(case, CaseHandler.BATCH_MACHINES) else choose_solver(case))
+    return [result for result, _ in solve_chunk(parsed, solvers)]
+
+class ProfitServer:
+    """
+    asyncio server grouping the cases of concurrent connections into micro-batches solved by worker processes
+
+    Backpressure: cases wait in a bounded queue for the batcher, and each connection holds a bounded
+    number of cases not answered yet. When either is full, the server stops reading the connection
+    until results are written, so that TCP flow control slows the clients down.
+    """
+    # Longest line accepted, in bytes
+    LINE_LIMIT = 2**20
+
+    def __init__(self, workers=None, batch_size=256, batch_delay=0.002, timeout=10.0,
+                 maximum_pending_cases=4096, connection_window=1024):
+        """
+        Initializes the ProfitServer object
+        inputs:
+            <workers> :: Int - number of worker processes (None: number of processors)
+            <batch_size> :: Int - largest number of cases of a micro-batch
+            <batch_delay> :: Float - seconds waited after the first case of a micro-batch for more cases
+            <timeout> :: Float - seconds after which a case not solved yet is answered with an error
+            <maximum_pending_cases> :: Int - capacity of the queue of cases waiting for a micro-batch
+            <connection_window> :: Int - largest number of cases of a connection not answered yet
+        outputs:
+            None
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.timeout = timeout
+        self.maximum_pending_cases = maximum_pending_cases
+        self.connection_window = connection_window
+        # Cases received, micro-batches solved, and cases answered with a timeout or an error
+        self.counters = Counter()
+        self.executor = None
+        self.server = None
+
+    def new_executor(self):
+        """
+        Creates the pool of worker processes. Workers forked from the server would inherit the sockets
+        of the open connections and keep them open after the server closes them, so they are started
+        from a fork server (or spawned where fork is not available)
+        """
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(self.workers, mp_context=context)
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        Starts the worker processes, the batcher and the server
+        inputs:
+            <host> :: String - address listened to
+            <port> :: Int - TCP port (0: any free port, see <sockets>)
+            <path> :: String - path of a Unix socket, used instead of TCP if given
+        outputs:
+            <out> :: asyncio.Server
+        """
+        self.executor = self.new_executor()
+        self.queue = asyncio.Queue(self.maximum_pending_cases)
+        # One slot per micro-batch solved at the same time
+        self.slots = asyncio.Semaphore(2*(self.workers or os.cpu_count() or 1))
+        self.batches = set()
+        self.batcher = asyncio.create_task(self.batch_cases())
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_connection, path, limit=self.LINE_LIMIT)
+        else:
+            self.server = await asyncio.start_server(self.handle_connection, host, port, limit=self.LINE_LIMIT)
+        return self.server
+
+    @property
+    def sockets(self):
+        """
+        Sockets listened to, e.g. to find the port chosen by the system
+        """
+        return self.server.sockets
+
+    async def close(self):
+        """
+        Stops the server, the batcher and the worker processes
+        """
+        self.server.close()
+        await self.server.wait_closed()
+        self.batcher.cancel()
+        await asyncio.gather(self.batcher, *self.batches, return_exceptions=True)
+        self.executor.shutdown(cancel_futures=True)
+
+    async def read_line(self, reader):
+        """
+        Reads a line of a connection, skipping the rest of a line longer than LINE_LIMIT
+        inputs:
+            <reader> :: asyncio.StreamReader - input of the connection
+        outputs:
+            <out> :: Bytes - line read, empty at the end of the input, None if the line is too long
+        """
+        try:
+            return await reader.readuntil(b"\n")
+        except asyncio.IncompleteReadError as error:
+            return error.partial
+        except asyncio.LimitOverrunError as error:
+            consumed = error.consumed
+        # Drops the bytes of the long line up to its end
+        while True:
+            try:
+                await reader.readexactly(consumed)
+                await reader.readuntil(b"\n")
+                return None
+            except asyncio.IncompleteReadError:
+                return None
+            except asyncio.LimitOverrunError as error:
+                consumed = error.consumed
+
+    async def read_cases(self, reader):
+        """
+        Reads the cases of a connection as they arrive. Only the context lines are parsed here: the
+        machine lines are parsed by the worker processes.
+        inputs:
+            <reader> :: asyncio.StreamReader - input of the connection
+        outputs:
+            <out> :: Yields a Tuple(List<Int>, List<Bytes>) - context of the case (N, C, D1) and its
+            machine lines, None if the context is not parsed (or the case has a line longer than LINE_LIMIT)
+        """
+        while True:
+            line = await self.read_line(reader)
+            if line is None:
+                yield None
+                continue
+            if not line or line.rstrip(b"\r\n") == b"0 0 0":
+                return
+            case_context = CaseReader.parse_context(line.rstrip(b"\n"))
+            if case_context is None:
+                yield None
+                continue
+            machine_lines = []
+            too_long = False
+            while len(machine_lines) < case_context[0]:
+                line = await self.read_line(reader)
+                if line is None:
+                    too_long = True
+                    line = b"\n"
+                elif not line:
+                    break
+                machine_lines.append(line.rstrip(b"\n"))
+            yield None if too_long else (case_context, machine_lines)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Submits the cases of a connection and writes their results back in case order
+        inputs:
+            <reader> :: asyncio.StreamReader - input of the connection
+            <writer> :: asyncio.StreamWriter - output of the connection
+        outputs:
+            <out> :: None
+        """
+        loop = asyncio.get_running_loop()
+        # Results of the connection in case order: (future, deadline), None for a parsing error
+        results = asyncio.Queue(self.connection_window)
+        writing = asyncio.create_task(self.write_results(results, writer))
+        try:
+            async for case in self.read_cases(reader):
+                self.counters["cases"] += 1
+                if case is None:
+                    await results.put(None)
+                    continue
+                future = loop.create_future()
+                await results.put((future, loop.time() + self.timeout))
+                await self.queue.put((case, future))
+        except ConnectionError:
+            pass
+        finally:
+            await results.put(StopAsyncIteration)
+            await writing
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def write_results(self, results, writer):
+        """
+        Writes the results of a connection as they are solved, in case order. If the client is gone,
+        the results are still consumed so that the connection handler never waits on a full queue.
+        inputs:
+            <results> :: asyncio.Queue - futures of the results and their deadlines
+            <writer> :: asyncio.StreamWriter - output of the connection
+        outputs:
+            <out> :: None
+        """
+        loop = asyncio.get_running_loop()
+        case_number = 0
+        connected = True
+        while True:
+            item = await results.get()
+            if item is StopAsyncIteration:
+                return
+            case_number += 1
+            if item is None:
+                result = PARSING_ERROR
+            else:
+                future, deadline = item
+                try:
+                    # Shielded: the micro-batch of the case still completes its future
+                    result = await asyncio.wait_for(asyncio.shield(future), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    self.counters["timeouts"] += 1
+                    result = TIMEOUT_ERROR
+            if not connected:
+                continue
+            try:
+                writer.write(f"Case {case_number}: {result}\n".encode())
+                # Waits for the client to read when caught up with the cases received
+                if results.empty():
+                    await writer.drain()
+            except ConnectionError:
+                connected = False
+
+    async def batch_cases(self):
+        """
+        Groups the queued cases into micro-batches and solves them on the worker processes
+        inputs:
+            None
+        outputs:
+            <out> :: None
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.batch_size:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Waits for a micro-batch to finish when all the slots are taken: the queue then fills up
+            await self.slots.acquire()
+            task = asyncio.create_task(self.solve(batch))
+            self.batches.add(task)
+            task.add_done_callback(self.batches.discard)
+
+    async def solve(self, batch):
+        """
+        Solves a micro-batch on a worker process and sets the results of its cases. An error raised
+        while solving a case is the result of that case only. If a worker process dies, the pool is
+        restarted and the cases of the micro-batch are solved again one at a time, so that only the
+        case killing its worker is answered with an error.
+        inputs:
+            <batch> :: List<Tuple(Tuple(List<Int>, List<Bytes>), Future)> - cases read and the futures of their results
+        outputs:
+            <out> :: None
+        """
+        self.counters["batches"] += 1
+        cases = [case for case, _ in batch]
+        try:
+            try:
+                results = await self.run(cases)
+            except BrokenProcessPool:
+                results = []
+                for case in cases:
+                    try:
+                        results.extend(await self.run([case]))
+                    except BrokenProcessPool:
+                        results.append(SOLVING_ERROR.format("worker process died"))
+            except Exception as error:
+                results = [SOLVING_ERROR.format(repr(error))]*len(cases)
+        finally:
+            self.slots.release()
+        self.counters["errors"] += sum(isinstance(result, str) and result != PARSING_ERROR for result in results)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def run(self, cases):
+        """
+        Solves cases on the worker processes, restarting the pool if a worker process dies
+        inputs:
+            <cases> :: List<Tuple(List<Int>, List<Bytes>)> - cases read, see solve_micro_batch
+        outputs:
+            <out> :: List<Int (maximum profit) or String (error message)> - result of each case
+        """
+        executor = self.executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, solve_micro_batch, cases)
+        except BrokenProcessPool:
+            # Micro-batches solved at the same time fail together: the pool is restarted once
+            if self.executor is executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = self.new_executor()
+            raise
+
+async def serve(arguments):
+    """
+    Runs the server until interrupted
+    """
+    server = ProfitServer(arguments.workers, arguments.batch_size, arguments.batch_delay, arguments.timeout)
+    await server.start(arguments.host, arguments.port, arguments.unix)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="profit_maximizer.server", description="Solving service of the profit maximizer")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="path of a Unix socket listened to instead of TCP")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: number of processors)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--batch-delay", type=float, default=0.002, help="seconds waited to fill a micro-batch")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds after which a case is answered with an error")
+    try:
+        asyncio.run(serve(parser.parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Registry of the solvers of a single case, and the policy choosing one of them per case.
+
+Every registered solver shares the interface of the HullProfitSolver: it is built from a Case, solves
+it with its solver() method (given keyword options, if any) into its <maximum_profit> attribute, and
+counts its operations in its <counters> attribute when set.
+"""
+from .hull_profit_solver import HullProfitSolver
+from .li_chao_profit_solver import LiChaoProfitSolver
+from .monotone_profit_solver import MonotoneProfitSolver
+from .profit_solver import ProfitSolver
+from .quadratic_profit_solver import QuadraticProfitSolver
+from .recursive_profit_solver import RecursiveProfitSolver
+
+# Name of the policy choosing the solver of each case
+AUTO = "auto"
+# Largest number of machines of the cases given to the LiChaoProfitSolver by the auto policy: below it,
+# its lower overhead beats the O(N log N) solvers
+SMALL_CASE_MACHINES = 16
+
+SOLVERS = {
+    "ProfitSolver": ProfitSolver, # Exhaustive search, exponential time /!\
+    "RecursiveProfitSolver": RecursiveProfitSolver, # O(N**2) time
+    "QuadraticProfitSolver": QuadraticProfitSolver, # O(N**2) time, vectorized
+    "HullProfitSolver": HullProfitSolver, # O(N log N) time
+    "LiChaoProfitSolver": LiChaoProfitSolver, # O(N log D) time, machines pushed one at a time
+    "MonotoneProfitSolver": MonotoneProfitSolver, # O(N) time after sorting if the profits grow with the day
+}
+
+def register_solver(solver, name=None):
+    """
+    Adds a solver to the registry
+    inputs:
+        <solver> :: Class - solver of a single case following the common interface
+        <name> :: String - name of the solver (defaults to the name of the class)
+    outputs:
+        <out> :: Class - the solver, so that the function can decorate a class
+    """
+    SOLVERS[name or solver.__name__] = solver
+    return solver
+
+def resolve_solver(solver):
+    """
+    Looks up a solver given by name
+    inputs:
+        <solver> :: String or Class - name of a registered solver, "auto", or a solver class
+    outputs:
+        <out> :: Class or String - solver class, or "auto"
+    """
+    if isinstance(solver, type) or solver == AUTO:
+        return solver
+    if solver not in SOLVERS:
+        raise ValueError(f"unknown solver {solver!r}, expected {AUTO!r}, a solver class or one of {', '.join(SOLVERS)}")
+    return SOLVERS[solver]
+
+def choose_solver(case):
+    """
+    Auto policy: chooses the fastest suitable solver of a case from its (pre-filtered) number of
+    machines and the order of its daily profits
+        - up to SMALL_CASE_MACHINES machines: LiChaoProfitSolver
+        - daily profits never decreasing with the day: MonotoneProfitSolver
+        - otherwise: HullProfitSolver
+    All of them compute with Python integers, exact whatever the range of the values.
+    inputs:
+        <case> :: Case - case to solve
+    outputs:
+        <out> :: Class - solver of the case
+    """
+    if len(case) <= SMALL_CASE_MACHINES:
+        return LiChaoProfitSolver
+    if MonotoneProfitSolver(case).is_monotone():
+        return MonotoneProfitSolver
+    return HullProfitSolver
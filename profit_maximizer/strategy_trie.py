@@ -0,0 +1,133 @@
+from array import array
+from collections import OrderedDict
+
+class StrategyTrie:
+    """
+    Prefix trie of the strategies explored by the ProfitSolver, keyed by machine indices.
+
+    Each node is a strategy that can still be extended: its parent node (the strategy without its
+    last machine) and the index of its last machine are stored in int32 arrays, and its state
+    (day, resell price, cash at hand, profit) after the last acquisition is cached. Dead ends and
+    pruned strategies get no node, so their extensions are never generated.
+
+    At most <max_cached_states> states are cached: the oldest ones (the shorter strategies first) are
+    evicted, and an evicted state is recomputed from the path of the node when it is needed again.
+    Nodes are dropped by compact() once they are no longer a prefix of a strategy left open, so that
+    the trie holds the open strategies and their prefixes only: its memory follows the number of open
+    strategies of a length, which the breadth-first search by length has to keep, not the number of
+    strategies ever explored.
+    """
+    # Node of the empty strategy, where ACM owns no machine
+    ROOT = 0
+
+    def __init__(self, root_state, max_cached_states=None):
+        """
+        Initializes the StrategyTrie object
+        inputs:
+            <root_state> :: List<Int> - state of ACM at day 0, [0, 0, cash at hand, 0]
+            <max_cached_states> :: Int - largest number of states cached (None: no limit)
+        outputs:
+            None
+        """
+        self.parents = array("i", [-1])
+        self.machines = array("i", [-1])
+        self.root_state = root_state
+        # Cached states by node, in order of insertion (the root state is never evicted)
+        self.states = OrderedDict()
+        self.max_cached_states = max_cached_states
+        self.evictions = 0
+        self.dropped_nodes = 0
+
+    def __len__(self):
+        """
+        Number of nodes of the trie, the root included
+        """
+        return len(self.parents)
+
+    def add(self, parent, machine, state):
+        """
+        Adds a strategy extending a node by a machine
+        inputs:
+            <parent> :: Int - node extended
+            <machine> :: Int - index of the machine bought
+            <state> :: List<Int> - state after buying the machine
+        outputs:
+            <out> :: Int - node of the strategy
+        """
+        node = len(self.parents)
+        self.parents.append(parent)
+        self.machines.append(machine)
+        self.states[node] = state
+        if self.max_cached_states is not None and len(self.states) > self.max_cached_states:
+            self.states.popitem(last=False)
+            self.evictions += 1
+        return node
+
+    def path(self, node):
+        """
+        Machines of a strategy
+        inputs:
+            <node> :: Int - node of the strategy
+        outputs:
+            <out> :: List<Int> - indices of the machines bought, in order of acquisition
+        """
+        path = []
+        while node != self.ROOT:
+            path.append(self.machines[node])
+            node = self.parents[node]
+        path.reverse()
+        return path
+
+    def state(self, node, step):
+        """
+        State of a strategy, recomputed from its nearest ancestor with a cached state if it was evicted
+        inputs:
+            <node> :: Int - node of the strategy
+            <step> :: Callable - function of a state and a machine index returning the next state
+        outputs:
+            <out> :: Tuple(<0>, <1>)
+                <0> :: List<Int> - state after the last acquisition of the strategy
+                <1> :: Bool - True if the state was cached
+        """
+        if node == self.ROOT:
+            return self.root_state, True
+        state = self.states.get(node)
+        if state is not None:
+            return state, True
+        machines = []
+        while node != self.ROOT and node not in self.states:
+            machines.append(self.machines[node])
+            node = self.parents[node]
+        state = self.root_state if node == self.ROOT else self.states[node]
+        for machine in reversed(machines):
+            state = step(state, machine)
+        return state, False
+
+    def compact(self, nodes):
+        """
+        Drops the nodes that are neither in <nodes> nor ancestors of them, renumbering the others in
+        the same order (parents before children) and keeping the order of the cached states
+        inputs:
+            <nodes> :: List<Int> - nodes of the strategies left open
+        outputs:
+            <out> :: List<Int> - new numbers of <nodes>
+        """
+        parents, machines = self.parents, self.machines
+        kept = bytearray(len(parents))
+        kept[self.ROOT] = 1
+        for node in nodes:
+            while not kept[node]:
+                kept[node] = 1
+                node = parents[node]
+        renumbered = array("i", bytes(4*len(parents)))
+        self.parents, self.machines = array("i", [-1]), array("i", [-1])
+        for node in range(1, len(parents)):
+            if kept[node]:
+                renumbered[node] = len(self.parents)
+                self.parents.append(renumbered[parents[node]])
+                self.machines.append(machines[node])
+        self.dropped_nodes += len(parents) - len(self.parents)
+        self.states = OrderedDict(
+            (renumbered[node], state) for node, state in self.states.items() if kept[node]
+        )
+        return [renumbered[node] for node in nodes]
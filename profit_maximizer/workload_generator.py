@@ -0,0 +1,197 @@
+"""
+Synthetic workloads following the constraints of the instructions, generated in bulk from a seed.
+
+Usage:
+    $ python -m profit_maximizer.workload_generator cases.txt --cases 10 --machines 100000 --distribution uniform
+    $ python -m profit_maximizer.workload_generator cases.txt --distribution hull_worst_case --binary cases.bin
+
+Distributions:
+    - uniform: days, prices, resale prices and profits drawn uniformly
+    - clustered_days: machines sold on a few days only, with many machines per day
+    - all_affordable: every machine costs less than the cash at hand
+    - monotone_profit: the daily profit of the machines grows with their day
+    - hull_worst_case: every machine is affordable, one machine per day, profits growing with the
+      day and resale prices of P - 1, so that most lines stay on the upper envelope of the lines
+      of the earlier machines (largest hulls and Li Chao trees)
+"""
+from .binary_case_file import BinaryCaseFile
+from .case import Case
+
+import argparse
+import numpy as np
+
+# Bounds of the instructions: N <= 10**5, C, D, P, G <= 10**9
+MAXIMUM_MACHINES = 10**5
+MAXIMUM_VALUE = 10**9
+# Number of machine lines formatted at once when writing a text file
+WRITE_BLOCK = 2**16
+
+def uniform(generator, number_of_machines, restructuring_days, maximum_value):
+    """
+    Draws days, prices, resale prices and profits uniformly
+    """
+    price = generator.integers(2, maximum_value, number_of_machines, endpoint=True)
+    return (
+        generator.integers(1, restructuring_days, number_of_machines, endpoint=True),
+        price,
+        generator.integers(1, price),
+        generator.integers(1, maximum_value, number_of_machines, endpoint=True),
+    )
+
+def clustered_days(generator, number_of_machines, restructuring_days, maximum_value):
+    """
+    Draws the days around a few days of the restructuring, about 1000 machines each
+    """
+    _, price, resell, profit = uniform(generator, number_of_machines, restructuring_days, maximum_value)
+    centers = generator.integers(1, restructuring_days, max(number_of_machines//1000, 1), endpoint=True)
+    spread = max(restructuring_days//10**4, 1)
+    day = generator.choice(centers, number_of_machines) + generator.integers(-spread, spread, number_of_machines, endpoint=True)
+    return np.clip(day, 1, restructuring_days), price, resell, profit
+
+def all_affordable(generator, number_of_machines, restructuring_days, maximum_value):
+    """
+    Draws prices up to a thousandth of the largest value, below the cash at hand of the case
+    """
+    day, _, _, profit = uniform(generator, number_of_machines, restructuring_days, maximum_value)
+    price = generator.integers(2, max(maximum_value//1000, 2), number_of_machines, endpoint=True)
+    return day, price, generator.integers(1, price), profit
+
+def monotone_profit(generator, number_of_machines, restructuring_days, maximum_value):
+    """
+    Draws uniform machines, then gives the largest profits to the latest days
+    """
+    day, price, resell, profit = uniform(generator, number_of_machines, restructuring_days, maximum_value)
+    profit[np.argsort(day, kind="stable")] = np.sort(profit)
+    return day, price, resell, profit
+
+def hull_worst_case(generator, number_of_machines, restructuring_days, maximum_value):
+    """
+    One machine per day, evenly spaced, with profits growing with the day and the smallest resale loss
+    """
+    step = max(restructuring_days//max(number_of_machines, 1), 1)
+    day = np.minimum(1 + step*np.arange(number_of_machines, dtype=np.int64), restructuring_days)
+    price = generator.integers(2, max(maximum_value//1000, 2), number_of_machines, endpoint=True)
+    # Strictly increasing profits while the range allows it
+    spacing = max(maximum_value//max(number_of_machines, 1), 1)
+    profit = 1 + spacing*np.arange(number_of_machines, dtype=np.int64) + generator.integers(0, spacing, number_of_machines)
+    profit = np.minimum(profit, maximum_value)
+    return day, price, price - 1, profit
+
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "clustered_days": clustered_days,
+    "all_affordable": all_affordable,
+    "monotone_profit": monotone_profit,
+    "hull_worst_case": hull_worst_case,
+}
+
+def generate_case(generator, number_of_machines, distribution="uniform", restructuring_days=None, maximum_value=MAXIMUM_VALUE):
+    """
+    Generates a case following the constraints of the instructions
+    inputs:
+        <generator> :: np.random.Generator - seeded random generator
+        <number_of_machines> :: Int - number of machines N, at least 1
+        <distribution> :: String - name of the distribution, see DISTRIBUTIONS
+        <restructuring_days> :: Int - days of restructuring D (None: drawn up to <maximum_value>)
+        <maximum_value> :: Int - upper bound of C, D, P and G, at least 2
+    outputs:
+        <out> :: Tuple(List<Int>, np.ndarray<Int64>) - context of case (N, C, D) and the (N, 4) machines,
+        in random order
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"unknown distribution {distribution!r}, expected one of {', '.join(DISTRIBUTIONS)}")
+    if restructuring_days is None:
+        restructuring_days = int(generator.integers(1, maximum_value, endpoint=True))
+    machines = np.stack(DISTRIBUTIONS[distribution](generator, number_of_machines, restructuring_days, maximum_value), axis=1)
+    machines = machines[generator.permutation(number_of_machines)]
+    if distribution in ("all_affordable", "hull_worst_case"):
+        cash_at_hand = maximum_value
+    else:
+        cash_at_hand = int(generator.integers(1, maximum_value, endpoint=True))
+    return [number_of_machines, cash_at_hand, restructuring_days], machines
+
+def generate_cases(seed, number_of_cases, number_of_machines, distribution="uniform", restructuring_days=None, maximum_value=MAXIMUM_VALUE):
+    """
+    Generates cases one at a time, each from its own stream of the seed
+    inputs:
+        <seed> :: Int - seed of the workload
+        <number_of_cases> :: Int - number of cases
+        <number_of_machines> :: Int - number of machines of each case
+        <distribution>, <restructuring_days>, <maximum_value> - see generate_case
+    outputs:
+        <out> :: Yields a Tuple(List<Int>, np.ndarray<Int64>) - context of case (N, C, D) and machines
+    """
+    for case_number in range(number_of_cases):
+        generator = np.random.default_rng([seed, case_number])
+        yield generate_case(generator, number_of_machines, distribution, restructuring_days, maximum_value)
+
+def is_valid(case_context, machines):
+    """
+    Checks a case against the constraints of the instructions
+    inputs:
+        <case_context> :: List<Int> - context of case (N, C, D)
+        <machines> :: np.ndarray<Int64> - (N, 4) machines (D2, P, R, G)
+    outputs:
+        <out> :: Bool
+    """
+    number_of_machines, cash_at_hand, restructuring_days = case_context
+    day, price, resell, profit = np.asarray(machines, dtype=np.int64).reshape(-1, 4).T
+    return bool(
+        1 <= number_of_machines <= MAXIMUM_MACHINES and len(day) == number_of_machines
+        and 1 <= cash_at_hand <= MAXIMUM_VALUE and 1 <= restructuring_days <= MAXIMUM_VALUE
+        and np.all((1 <= day) & (day <= restructuring_days))
+        and np.all((1 <= resell) & (resell < price) & (price <= MAXIMUM_VALUE))
+        and np.all((1 <= profit) & (profit <= MAXIMUM_VALUE))
+    )
+
+def write_text(filename, cases):
+    """
+    Writes cases in the text format of the instructions, followed by the closing line. Machine lines
+    are formatted by blocks with a single string formatting each.
+    inputs:
+        <filename> :: String - path of the file
+        <cases> :: Iterable<Tuple(List<Int>, np.ndarray<Int64>)> - cases as returned by generate_case
+    outputs:
+        <out> :: Int - number of cases written
+    """
+    number_of_cases = 0
+    with open(filename, "w") as f:
+        for case_context, machines in cases:
+            f.write("%d %d %d\n" % tuple(case_context))
+            for start in range(0, len(machines), WRITE_BLOCK):
+                block = machines[start:start+WRITE_BLOCK]
+                f.write(("%d %d %d %d\n"*len(block)) % tuple(block.ravel().tolist()))
+            number_of_cases += 1
+        f.write("0 0 0\n")
+    return number_of_cases
+
+def write_binary(filename, cases):
+    """
+    Writes cases to a memory-mapped binary case file (see BinaryCaseFile)
+    inputs:
+        <filename> :: String - path of the file
+        <cases> :: Iterable<Tuple(List<Int>, np.ndarray<Int64>)> - cases as returned by generate_case
+    outputs:
+        <out> :: Int - number of cases written
+    """
+    return BinaryCaseFile.write(filename, (Case.from_values(case_context, machines.reshape(-1)) for case_context, machines in cases))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="profit_maximizer.workload_generator", description="Synthetic workloads of the profit maximizer")
+    parser.add_argument("output", help="path of the text file written")
+    parser.add_argument("--binary", help="path of a binary case file also written")
+    parser.add_argument("--cases", type=int, default=1)
+    parser.add_argument("--machines", type=int, default=MAXIMUM_MACHINES, help="number of machines per case")
+    parser.add_argument("--distribution", choices=list(DISTRIBUTIONS), default="uniform")
+    parser.add_argument("--days", type=int, help="days of restructuring of every case (default: drawn)")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args(argv)
+    def cases():
+        return generate_cases(arguments.seed, arguments.cases, arguments.machines, arguments.distribution, arguments.days)
+    write_text(arguments.output, cases())
+    if arguments.binary:
+        write_binary(arguments.binary, cases())
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,6 +13,10 @@ setup(
     url='',
     packages=find_packages(exclude=('tests', 'docs')),
     setup_requires=[],
+    install_requires=['numpy'],
+    entry_points={
+        'console_scripts': ['profit_maximizer=profit_maximizer.__main__:main'],
+    },
     license='None',
     classifiers=[
         'Intended Audience :: Recruiters',
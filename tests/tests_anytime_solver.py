@@ -0,0 +1,52 @@
+import unittest
+from profit_maximizer.differential import DifferentialFuzzer
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.profit_solver import ProfitSolver
+from collections import Counter
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the anytime mode and the branch-and-bound pruning of the ProfitSolver
+    """
+
+    def test_bounds(self):
+        """
+        Checks the best profit found and the upper bound enclose the maximum profit, whatever the budget
+        """
+        generator = np.random.default_rng(20)
+        fuzzer = DifferentialFuzzer(maximum_machines=8, maximum_value=25)
+        counters = Counter()
+        for _ in range(200):
+            case_context, machines = fuzzer.generate_case(generator)
+            expected = HullProfitSolver(case_context, machines)
+            expected.solver()
+            test_object = ProfitSolver(case_context, machines)
+            test_object.counters = counters
+            self.assertEqual(test_object.solver(), (expected.maximum_profit,)*2 + (True,))
+            for arguments in [{"max_states": 1}, {"max_states": 5}, {"maximum_number_of_acquisitions": 1}, {"time_budget": 0}]:
+                maximum_profit, upper_bound, optimal = ProfitSolver(case_context, machines).solver(**arguments)
+                self.assertLessEqual(maximum_profit, expected.maximum_profit)
+                self.assertGreaterEqual(upper_bound, expected.maximum_profit)
+                if optimal:
+                    self.assertEqual((maximum_profit, upper_bound), (expected.maximum_profit,)*2)
+        # Strategies that cannot beat the best profit found are not extended
+        self.assertGreater(counters["pruned"], 0)
+
+    def test_budget(self):
+        """
+        Checks the assignment's first case is stopped after a budget of states
+        """
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        self.assertEqual(ProfitSolver([6,10,20], machines).solver(), (44, 44, True))
+        test_object = ProfitSolver([6,10,20], machines)
+        test_object.counters = Counter()
+        maximum_profit, upper_bound, optimal = test_object.solver(max_states=3)
+        self.assertEqual(test_object.counters["strategies"], 3)
+        self.assertFalse(optimal)
+        self.assertLessEqual(maximum_profit, 44)
+        self.assertGreaterEqual(upper_bound, 44)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.batch_profit_solver import BatchProfitSolver
+from profit_maximizer.case import Case
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.workload_generator import generate_case
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases of the batched solver for small cases
+    """
+
+    def test_against_hull_solver(self):
+        """
+        Checks the batched solver against the HullProfitSolver on random cases of mixed sizes
+        """
+        generator = np.random.default_rng(0)
+        cases = []
+        for _ in range(300):
+            restructuring_days = int(generator.choice([generator.integers(1, 15, endpoint=True), 10**9]))
+            maximum_value = int(generator.choice([20, 10**9]))
+            cases.append(Case.from_machines(*generate_case(
+                generator, int(generator.integers(0, 30, endpoint=True)), "uniform", restructuring_days, maximum_value
+            )))
+        expected = []
+        for case in cases:
+            result = HullProfitSolver(case)
+            result.solver()
+            expected.append(result.maximum_profit)
+        self.assertEqual(BatchProfitSolver(cases, group_size=32).solver().tolist(), expected)
+
+    def test_routing(self):
+        """
+        Checks the results of the CaseHandler when small cases are batched around large cases and errors
+        """
+        test_object = CaseHandler("./tests/inputs/wrong_input_3.txt", True)
+        test_object.BATCH_MACHINES = 1
+        test_object.BATCH_SIZE = 2
+        self.assertEqual(
+            test_object.content_handler(),
+            ["Error in the case found while parsing the machine descriptions", 11, 12, 10, 39]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
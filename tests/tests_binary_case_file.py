@@ -0,0 +1,75 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.binary_case_file import BinaryCaseFile
+from profit_maximizer.case_reader import CaseReader
+
+import numpy as np
+import os
+import tempfile
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the memory-mapped binary case file
+    """
+
+    def test_conversion(self):
+        """
+        Checks the cases of converted text inputs, parsing errors included, and their zero-copy views
+        """
+        inputs = [
+            "./tests/inputs/input.txt",
+            "./tests/inputs/snapshot.txt",
+            "./tests/inputs/wrong_input_2.txt",
+            "./tests/inputs/end.txt",
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            for filename in inputs:
+                binary_filename = os.path.join(directory, "cases.bin")
+                expected = list(CaseReader(filename))
+                self.assertEqual(BinaryCaseFile.convert(filename, binary_filename), len(expected))
+                self.assertTrue(BinaryCaseFile.recognizes(binary_filename))
+                self.assertFalse(BinaryCaseFile.recognizes(filename))
+                cases = BinaryCaseFile(binary_filename)
+                self.assertEqual(len(cases), len(expected))
+                for case, expected_case in zip(cases, expected):
+                    if expected_case is None:
+                        self.assertIsNone(case)
+                        continue
+                    self.assertEqual(case.case_context, expected_case.case_context)
+                    self.assertEqual(case.machines(), expected_case.machines())
+                    if len(case):
+                        self.assertTrue(np.shares_memory(case.day, cases.data))
+                        self.assertFalse(case.profit.flags.writeable)
+
+    def test_case_handler(self):
+        """
+        Checks the CaseHandler solves a binary case file like the text file it was converted from
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for filename in ["./tests/inputs/snapshot.txt", "./tests/inputs/wrong_input_3.txt"]:
+                binary_filename = os.path.join(directory, "cases.bin")
+                BinaryCaseFile.convert(filename, binary_filename)
+                expected = CaseHandler(filename).content_handler()
+                test_object = CaseHandler(binary_filename)
+                self.assertTrue(test_object.check_filename())
+                self.assertEqual(test_object.content_handler(), expected)
+                self.assertEqual(test_object.content_handler(streaming=True), expected)
+
+    def test_invalid_file(self):
+        """
+        Checks text and truncated files are rejected
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            binary_filename = os.path.join(directory, "cases.bin")
+            BinaryCaseFile.convert("./tests/inputs/input.txt", binary_filename)
+            with open(binary_filename, "rb") as f:
+                content = f.read()
+            with open(binary_filename, "wb") as f:
+                f.write(content[:-8])
+            with self.assertRaises(ValueError):
+                BinaryCaseFile(binary_filename)
+        with self.assertRaises(ValueError):
+            BinaryCaseFile("./tests/inputs/input.txt")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from profit_maximizer.case import Case
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.recursive_profit_solver import RecursiveProfitSolver
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the structure-of-arrays Case
+    """
+
+    def test_from_machines(self):
+        """
+        Checks machines are filtered on the restructuring days and sorted by day, ties in input order
+        """
+        case = Case.from_machines([5, 10, 4], [[4,11,7,4],[1,9,1,2],[8,20,5,4],[1,10,9,1],[3,2,1,2]])
+        self.assertEqual(case.case_context, [5, 10, 4])
+        self.assertEqual(len(case), 4)
+        self.assertEqual(case.day.tolist(), [1, 1, 3, 4])
+        self.assertEqual(case.machines(), [[1,9,1,2],[1,10,9,1],[3,2,1,2],[4,11,7,4]])
+        self.assertEqual(case.day.dtype.name, "int64")
+        self.assertTrue(case.profit.flags["C_CONTIGUOUS"])
+
+    def test_empty(self):
+        """
+        Checks a case without machines
+        """
+        case = Case.build([0, 11, 30])
+        self.assertEqual(len(case), 0)
+        self.assertEqual(case.machines(), [])
+
+    def test_solver_arguments(self):
+        """
+        Checks a solver gives the same result from a Case and from a context and a list of machines
+        """
+        case_context = [6, 10, 20]
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        for arguments in [(case_context, machines), (Case.from_machines(case_context, machines),)]:
+            result = HullProfitSolver(*arguments)
+            result.solver()
+            self.assertEqual(result.maximum_profit, 44)
+
+    def test_dtype_resale_gains(self):
+        """
+        Checks the machines resold above their price count in the choice of the type of the cash amounts
+        """
+        case = Case.from_machines([60, 10, 200], [[2*i+1, 1, 2*10**17, 1] for i in range(60)])
+        self.assertEqual(case.dtype(), np.dtype(object))
+        results = []
+        for solver in (RecursiveProfitSolver, HullProfitSolver):
+            result = solver(case)
+            result.solver()
+            results.append(result.maximum_profit)
+        self.assertEqual(results[0], results[1])
+        self.assertGreater(results[0], 2**63)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.binary_case_file import BinaryCaseFile
+from profit_maximizer.case_index import CaseIndex
+from profit_maximizer.case_reader import CaseReader
+
+import os
+import shutil
+import tempfile
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the sidecar case-offset index
+    """
+
+    def test_cases(self):
+        """
+        Checks the indexed cases match the CaseReader, for chunks splitting lines anywhere
+        """
+        inputs = [
+            "./tests/inputs/input.txt",
+            "./tests/inputs/snapshot.txt",
+            "./tests/inputs/wrong_input_2.txt",
+            "./tests/inputs/wrong_input_3.txt",
+            "./tests/inputs/end.txt",
+            "./tests/inputs/empty.txt",
+        ]
+        for filename in inputs:
+            expected = [None if case is None else (case.case_context, case.machines()) for case in CaseReader(filename)]
+            for chunk_size in [1, 7, 2**24]:
+                index = CaseIndex.build(filename, chunk_size)
+                self.assertEqual(len(index), len(expected))
+                cases = [None if case is None else (case.case_context, case.machines()) for case in index.cases(range(len(index)))]
+                self.assertEqual(cases, expected)
+        index = CaseIndex.build("./tests/inputs/input.txt")
+        self.assertEqual(index.lines.tolist(), [1, 8, 9, 11, 13, 16])
+        self.assertEqual(index.counts.tolist(), [6, 0, 1, 1, 2, 0])
+        self.assertEqual(index.split(2), [range(0, 2), range(2, 5)])
+        self.assertEqual(index.byte_range(range(2, 5)), (76, 143))
+        with self.assertRaises(IndexError):
+            index[5]
+
+    def test_sidecar(self):
+        """
+        Checks the index is saved next to the input, then built again once the input changes
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "input.txt")
+            shutil.copy("./tests/inputs/input.txt", filename)
+            self.assertIsNone(CaseIndex.load(filename))
+            index = CaseIndex.open(filename)
+            self.assertTrue(os.path.exists(filename + CaseIndex.SUFFIX))
+            self.assertEqual(CaseIndex.load(filename).rows.tolist(), index.rows.tolist())
+            with open(filename, "w") as f:
+                f.write("1 10 10\n1 5 1 3\n")
+            self.assertIsNone(CaseIndex.load(filename))
+            self.assertEqual(len(CaseIndex.open(filename)), 1)
+            self.assertEqual(CaseHandler(filename).solve_case(1), 33)
+
+    def test_case_handler(self):
+        """
+        Checks the cases solved by number match the results of the whole file, for text and binary inputs
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "snapshot.txt")
+            shutil.copy("./tests/inputs/snapshot.txt", filename)
+            binary_filename = os.path.join(directory, "snapshot.bin")
+            BinaryCaseFile.convert(filename, binary_filename)
+            expected = CaseHandler(filename).content_handler()
+            for input_filename in [filename, binary_filename]:
+                test_object = CaseHandler(input_filename)
+                self.assertEqual(test_object.solve_case(2), expected[1])
+                self.assertEqual(list(test_object.iter_cases([14, 1, 5])), [expected[13], expected[0], expected[4]])
+                self.assertEqual(list(test_object.iter_cases(range(1, 15), streaming=True)), expected)
+                self.assertEqual(list(test_object.iter_cases(k for k in (2, 5))), [expected[1], expected[4]])
+                self.assertEqual(list(test_object.iter_cases(iter([1, 3]))), [expected[0], expected[2]])
+                with self.assertRaises(IndexError):
+                    test_object.solve_case(15)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.case import Case
+from profit_maximizer.case_prefilter import CasePrefilter
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the pre-filter of the unaffordable and dominated machines
+    """
+
+    def solve(self, case):
+        """
+        Solves a case with the HullProfitSolver
+        """
+        solver = HullProfitSolver(case)
+        solver.solver()
+        return solver.maximum_profit
+
+    def test_filter(self):
+        """
+        Checks the machines removed on a hand-made case
+        """
+        machines = [
+            [1,5,1,2],   # affordable
+            [1,6,1,1],   # dominated by the first machine
+            [1,5,1,2],   # duplicate of the first machine
+            [2,20,1,1],  # unaffordable: at most 10 on day 2
+            [4,13,1,1],  # affordable: at most 10 + 2*2 on day 4 (G of 2 on days 2 and 3)
+            [4,15,1,1],  # unaffordable
+        ]
+        case, removed = CasePrefilter().filter(Case.from_machines([6,10,10], machines))
+        self.assertEqual(removed, {"unaffordable": 2, "dominated": 2})
+        self.assertEqual(case.machines(), [[1,5,1,2],[4,13,1,1]])
+        self.assertEqual(case.case_context, [6,10,10])
+
+    def test_random_cases(self):
+        """
+        Checks the maximum profit is unchanged by the pre-filter on random cases
+        """
+        generator = np.random.default_rng(16)
+        prefilter = CasePrefilter()
+        for _ in range(300):
+            number_of_machines = int(generator.integers(0, 15))
+            price = generator.integers(2, 40, number_of_machines)
+            machines = np.stack((
+                generator.integers(1, 10, number_of_machines), price,
+                generator.integers(1, price), generator.integers(1, 6, number_of_machines)
+            ), axis=1)
+            case = Case.from_values([number_of_machines, int(generator.integers(1, 30)), int(generator.integers(1, 10))], machines.reshape(-1))
+            filtered_case, removed = prefilter.filter(case)
+            self.assertEqual(len(filtered_case), len(case) - sum(removed.values()))
+            self.assertEqual(self.solve(filtered_case), self.solve(case))
+        self.assertGreater(prefilter.removed["unaffordable"], 0)
+        self.assertGreater(prefilter.removed["dominated"], 0)
+
+    def test_case_handler(self):
+        """
+        Checks the results of the CaseHandler with and without pre-filter, and the machines removed it reports
+        """
+        for filename in ["./tests/inputs/input.txt", "./tests/inputs/snapshot.txt"]:
+            expected = CaseHandler(filename, prefilter=False).content_handler()
+            for prefilter_machines in [CaseHandler.PREFILTER_MACHINES, 0]:
+                test_object = CaseHandler(filename, instrument=True)
+                test_object.PREFILTER_MACHINES = prefilter_machines
+                self.assertEqual(test_object.content_handler(), expected)
+                self.assertEqual(
+                    sum(sum(record.get("removed_machines", {}).values()) for record in test_object.stats),
+                    sum(test_object.prefilter.removed.values())
+                )
+        self.assertEqual(test_object.stats[0]["removed_machines"], {"unaffordable": 0, "dominated": 0})
+        # Small cases skip the pre-filter by default
+        test_object = CaseHandler(filename, instrument=True)
+        test_object.content_handler()
+        self.assertNotIn("removed_machines", test_object.stats[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.case_reader import CaseReader
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the single-pass CaseReader
+    """
+
+    def read(self, filename, chunk_size=2**20):
+        """
+        Reads the cases of a file as (context, machines) pairs, ([], []) for a case not parsed
+        """
+        return [
+            ([], []) if case is None else (case.case_context, case.machines())
+            for case in CaseReader(filename, chunk_size)
+        ]
+
+    def test_reading(self):
+        """
+        Checks the cases read from the input files, including malformed cases, with machines sorted by day
+        """
+        cases = [
+            [
+                "./tests/inputs/input.txt",
+                [
+                    ([6,10,20], [[1,9,1,2],[2,10,9,1],[3,2,1,2],[4,11,7,4],[6,12,1,3],[8,20,5,4]]),
+                    ([0,11,30], []),
+                    ([1,12,30], [[30,10,5,3]]),
+                    ([1,10,2], [[1,10,2,1]]),
+                    ([2,10,11], [[1,10,4,3],[1,10,9,3]])
+                ]
+            ],
+            ["./tests/inputs/wrong_input_1.txt", [([6,10,3], [[1,9,1,2],[2,10,9,1],[3,2,1,2]])]],
+            [
+                "./tests/inputs/wrong_input_2.txt",
+                [([], [])]*7 + [([0,11,30], []), ([1,12,30], [[30,10,5,3]]), ([1,10,2], [[1,10,2,1]]), ([2,10,11], [[1,10,4,3],[1,10,9,3]])]
+            ],
+            ["./tests/inputs/wrong_input_3.txt", [([], []), ([0,11,30], []), ([1,12,30], [[30,10,5,3]]), ([1,10,2], [[1,10,2,1]]), ([2,10,11], [[1,10,4,3],[1,10,9,3]])]],
+            ["./tests/inputs/end.txt", []],
+            ["./tests/inputs/empty.txt", []]
+        ]
+        for case in cases:
+            self.assertEqual(self.read(case[0]), case[1])
+
+    def test_against_case_caching(self):
+        """
+        Checks the CaseReader yields the same cases as the line by line case_caching method once
+        sorted by day, whatever the size of the chunks read
+        """
+        cases = ["./tests/inputs/input.txt", "./tests/inputs/snapshot.txt", "./tests/inputs/wrong_input_2.txt"]
+        for case in cases:
+            test_object = CaseHandler(case, True)
+            expected, location_in_input = [], 1
+            while True:
+                go_to_next_case, location_in_input, case_context, machines = test_object.case_caching(location_in_input)
+                if not go_to_next_case:
+                    break
+                expected.append((case_context, sorted(machines, key=lambda x: x[0])))
+            for chunk_size in [1, 7, 2**20]:
+                self.assertEqual(self.read(case, chunk_size), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from profit_maximizer.__main__ import main
+
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the command-line entry point
+    """
+
+    def run_cli(self, arguments, stdin=b""):
+        """
+        Runs python -m profit_maximizer and returns its standard output
+        """
+        result = subprocess.run(
+            [sys.executable, "-m", "profit_maximizer", *arguments],
+            input=stdin, capture_output=True, check=True
+        )
+        return result.stdout.decode()
+
+    def test_stdin_and_path(self):
+        """
+        Checks the cases piped to the standard input or given as a path are solved alike
+        """
+        with open("./tests/inputs/input.txt", "rb") as f:
+            content = f.read()
+        expected = "".join(f"Case {k}: {x}\n" for k, x in enumerate([44, 11, 12, 10, 39], 1))
+        self.assertEqual(self.run_cli([], content), expected)
+        self.assertEqual(self.run_cli(["-"], content), expected)
+        self.assertEqual(self.run_cli(["./tests/inputs/input.txt"]), expected)
+
+    def test_compressed_jsonl(self):
+        """
+        Checks compressed inputs are recognized and the JSON lines output reports results and errors
+        """
+        with open("./tests/inputs/wrong_input_2.txt", "rb") as f:
+            content = gzip.compress(f.read())
+        records = [json.loads(line) for line in self.run_cli(["--jsonl"], content).splitlines()]
+        self.assertEqual([record["case"] for record in records], list(range(1, len(records)+1)))
+        self.assertEqual(sum("error" in record for record in records), 7)
+        self.assertEqual(sum("maximum_profit" in record for record in records), 4)
+
+    def test_output_file(self):
+        """
+        Checks the results written to an output file, and the missing input reported by the exit status
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "input.txt.gz")
+            with open("./tests/inputs/snapshot.txt", "rb") as f, gzip.open(filename, "wb") as g:
+                g.write(f.read())
+            output = os.path.join(directory, "output.txt")
+            self.assertEqual(main([filename, "--output", output, "--streaming"]), 0)
+            with open(output) as f:
+                profits = [int(line.split(": ")[1]) for line in f]
+            self.assertEqual(profits, [
+                44, 1116877054, 2353506445, 10, 5009, 9909, 10, 10, 11, 999999999999999999, 87, 200, 567, 87
+            ])
+            self.assertEqual(main([os.path.join(directory, "missing.txt"), "--output", output]), 1)
+
+    def test_stats(self):
+        """
+        Checks the statistics written by the command line hold the peak memories, with tracing stopped after the run
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output, stats = os.path.join(directory, "output.txt"), os.path.join(directory, "stats.jsonl")
+            self.assertEqual(main(["./tests/inputs/input.txt", "--output", output, "--stats", stats]), 0)
+            with open(stats) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual([record["solver"] for record in records], ["BatchProfitSolver"]*5)
+        for record in records:
+            self.assertIsNotNone(record["parse_peak_memory_bytes"])
+            self.assertIsNotNone(record["solve_peak_memory_bytes"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_plan(self):
+        """
+        Checks the plans written with the results, and a solver without plans refused
+        """
+        records = [json.loads(line) for line in self.run_cli(["./tests/inputs/input.txt", "--plan", "--jsonl"]).splitlines()]
+        self.assertEqual([record["maximum_profit"] for record in records], [44, 11, 12, 10, 39])
+        self.assertEqual(records[0]["plan"], [[3,2,1,2],[6,12,1,3]])
+        self.assertEqual(records[1]["plan"], [])
+        self.assertEqual(self.run_cli(["./tests/inputs/input.txt", "--plan"]).splitlines()[0], "Case 1: 44, plan: [[3, 2, 1, 2], [6, 12, 1, 3]]")
+        self.assertEqual(main(["./tests/inputs/input.txt", "--plan", "--solver", "QuadraticProfitSolver"]), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from profit_maximizer.differential import DifferentialFuzzer, ENGINES, brute_force
+from profit_maximizer.case import Case
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the differential verification of the solvers
+    """
+
+    def test_engines(self):
+        """
+        Checks every engine agrees with the brute-force oracle on seeded random cases
+        """
+        fuzzer = DifferentialFuzzer(seed=19, maximum_machines=5)
+        report = fuzzer.run(300)
+        self.assertEqual(report["mismatches"], {})
+        self.assertEqual(set(report["cases_per_second"]), {"oracle", *ENGINES})
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        self.assertEqual(brute_force(Case.from_machines([6,10,20], machines)), 44)
+
+    def test_shrink(self):
+        """
+        Checks a wrong engine is reported with a minimal failing case
+        """
+        def wrong_solve(case):
+            # Counts the daily profit of a machine on the day it is bought
+            return brute_force(Case(case.case_context, case.day-1, case.price, case.resell, case.profit))
+        fuzzer = DifferentialFuzzer({"wrong": wrong_solve}, seed=3)
+        report = fuzzer.run(50)
+        self.assertGreater(report["mismatches"]["wrong"], 0)
+        failure = report["failures"]["wrong"]
+        self.assertEqual((failure["case_context"], failure["machines"]), ([1, 2, 1], [[1, 2, 1, 2]]))
+        self.assertEqual((failure["expected"], failure["result"]), (2, 3))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.differential import DifferentialFuzzer
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.profit_solver import ProfitSolver
+from profit_maximizer.workload_generator import generate_case
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases of the divide-and-conquer convex hull solver
+    """
+
+    def test_snapshot(self):
+        """
+        Checks the solver against the known results of the snapshot input
+        """
+        test_object = CaseHandler("./tests/inputs/snapshot.txt", True)
+        self.assertEqual(
+            test_object.content_handler(),
+            [44, 1116877054, 2353506445, 10, 5009, 9909, 10, 10, 11, 999999999999999999, 87, 200, 567, 87]
+        )
+
+    def test_against_exhaustive_solver(self):
+        """
+        Checks the solver against the exhaustive ProfitSolver on small random cases
+        """
+        generator = np.random.default_rng(0)
+        fuzzer = DifferentialFuzzer(maximum_machines=6, maximum_value=20)
+        for _ in range(500):
+            case_context, machines = fuzzer.generate_case(generator)
+            expected = ProfitSolver(case_context, machines)
+            expected.solver()
+            result = HullProfitSolver(case_context, machines)
+            result.solver()
+            self.assertEqual(result.maximum_profit, expected.maximum_profit, (case_context, machines))
+
+    def test_large_case(self):
+        """
+        Checks the solver finishes on a case of 10**5 machines
+        """
+        case_context, machines = generate_case(np.random.default_rng(0), 10**5, restructuring_days=10**9)
+        result = HullProfitSolver(case_context, machines.tolist())
+        result.solver()
+        self.assertGreaterEqual(result.maximum_profit, case_context[1])
+
+if __name__ == '__main__':
+    unittest.main()
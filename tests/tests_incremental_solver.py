@@ -0,0 +1,66 @@
+import unittest
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.incremental_profit_solver import IncrementalProfitSolver
+from collections import Counter
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the IncrementalProfitSolver
+    """
+
+    def test_updates(self):
+        """
+        Checks the maximum profit after each insertion or removal against a solve from scratch
+        """
+        generator = np.random.default_rng(22)
+        for _ in range(100):
+            restructuring_days, cash_at_hand = int(generator.integers(1, 30)), int(generator.integers(1, 30))
+            test_object = IncrementalProfitSolver([0, cash_at_hand, restructuring_days])
+            machines = []
+            for _ in range(20):
+                if machines and generator.random() < 0.4:
+                    machine = machines.pop(int(generator.integers(len(machines))))
+                    maximum_profit = test_object.remove(machine)
+                else:
+                    price = int(generator.integers(2, 30))
+                    machine = [
+                        int(generator.integers(1, restructuring_days+2)), price,
+                        int(generator.integers(1, price)), int(generator.integers(1, 10)),
+                    ]
+                    maximum_profit = test_object.insert(machine)
+                    if machine[0] <= restructuring_days:
+                        machines.append(machine)
+                expected = HullProfitSolver([len(machines), cash_at_hand, restructuring_days], machines)
+                expected.solver()
+                self.assertEqual(maximum_profit, expected.maximum_profit)
+        with self.assertRaises(ValueError):
+            test_object.remove([1, 1000, 1, 1])
+
+    def test_late_update(self):
+        """
+        Checks an update on the last day of the assignment's first case only pushes the machines of that day
+        """
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        test_object = IncrementalProfitSolver([6,10,20], machines)
+        self.assertEqual(test_object.maximum_profit, 44)
+        test_object.counters = Counter()
+        self.assertEqual(test_object.insert([8,15,5,6]), 79)
+        self.assertEqual(test_object.counters["pushes"], 2)
+        self.assertEqual(test_object.remove([8,15,5,6]), 44)
+        self.assertEqual(test_object.remove([6,12,1,3]), 43)
+
+    def test_after_restructuring(self):
+        """
+        Checks the machines available after the restructuring are ignored alike on insertion and removal
+        """
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        test_object = IncrementalProfitSolver([6,10,20], machines)
+        self.assertEqual(test_object.insert([21,1,100,100]), 44)
+        self.assertEqual(test_object.remove([21,1,100,100]), 44)
+        self.assertEqual(test_object.remove([25,1,100,100]), 44)
+        self.assertEqual(len(test_object.machines), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+import unittest
+from profit_maximizer import CaseHandler
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the per-case statistics of an instrumented CaseHandler
+    """
+
+    def test_statistics(self):
+        """
+        Checks a record is collected per case, with the solver counters, whatever the solving mode
+        (without pre-filter, which leaves a single machine in the last case)
+        """
+        modes = [
+            ({}, {}, "BatchProfitSolver", "groups"),
+            ({}, {"streaming": True}, "LiChaoProfitSolver", "pushes"),
+            ({}, {"maximum_number_of_acquisitions": 2}, "ProfitSolver", "strategies"),
+            ({"solver": "HullProfitSolver"}, {"workers": 2}, "HullProfitSolver", "hull_lines"),
+        ]
+        for handler_arguments, arguments, solver, counter in modes:
+            test_object = CaseHandler("./tests/inputs/wrong_input_3.txt", True, instrument=True, prefilter=False, **handler_arguments)
+            test_object.content_handler(**arguments)
+            self.assertEqual(len(test_object.stats), 5)
+            self.assertEqual([record["machines"] for record in test_object.stats], [None, 0, 1, 1, 2])
+            self.assertNotIn("solver", test_object.stats[0])
+            self.assertEqual(test_object.stats[4]["solver"], solver)
+            self.assertGreater(test_object.stats.totals()["counters"][counter], 0)
+            self.assertGreaterEqual(test_object.stats[4]["solve_seconds"], 0)
+            self.assertGreaterEqual(test_object.stats[4]["parse_peak_memory_bytes"], 0)
+            self.assertEqual(test_object.stats.totals()["cases"], 5)
+
+    def test_export(self):
+        """
+        Checks the statistics are exported as one JSON record per line
+        """
+        test_object = CaseHandler("./tests/inputs/input.txt", True, instrument=True)
+        test_object.content_handler()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "stats.jsonl")
+            test_object.export_stats(filename)
+            with open(filename) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual([record["case"] for record in records], [1, 2, 3, 4, 5])
+
+    def test_disabled(self):
+        """
+        Checks nothing is collected without instrumentation
+        """
+        test_object = CaseHandler("./tests/inputs/input.txt", True)
+        test_object.content_handler()
+        self.assertEqual(len(test_object.stats), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.li_chao_profit_solver import LiChaoProfitSolver
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases of the online Li Chao tree solver
+    """
+
+    def test_push(self):
+        """
+        Checks the best cash at hand while the machines of the first example case are pushed in day order
+        """
+        solver = LiChaoProfitSolver([6, 10, 20])
+        cases = [
+            ([1, 9, 1, 2], 10),
+            ([2, 10, 9, 1], 10),
+            ([3, 2, 1, 2], 10),
+            ([4, 11, 7, 4], 10),
+            ([6, 12, 1, 3], 13),
+            ([8, 20, 5, 4], 17),
+        ]
+        for machine, cash_at_hand in cases:
+            self.assertEqual(solver.push(*machine), cash_at_hand)
+        self.assertEqual(solver.current_best(21), 44)
+        self.assertEqual(solver.maximum_profit, 44)
+
+    def test_day_order(self):
+        """
+        Checks that machines pushed out of day order are refused
+        """
+        solver = LiChaoProfitSolver([2, 10, 20])
+        solver.push(4, 11, 7, 4)
+        with self.assertRaises(ValueError):
+            solver.push(3, 2, 1, 2)
+        with self.assertRaises(ValueError):
+            solver.current_best(3)
+
+    def test_streaming(self):
+        """
+        Checks the streaming mode of the CaseHandler, with and without machines sorted by day
+        """
+        cases = [
+            ("./tests/inputs/input.txt", [44, 11, 12, 10, 39]),
+            ("./tests/inputs/snapshot.txt", [44, 1116877054, 2353506445, 10, 5009, 9909, 10, 10, 11,
+                                             999999999999999999, 87, 200, 567, 87]),
+            ("./tests/inputs/wrong_input_3.txt", ["Error in the case found while parsing the machine descriptions",
+                                                  11, 12, 10, 39])
+        ]
+        for case in cases:
+            test_object = CaseHandler(case[0], True)
+            self.assertEqual(test_object.content_handler(streaming=True), case[1])
+
+    def test_streaming_pipe(self):
+        """
+        Checks a streamed case is answered as soon as its last line is read, before the input ends,
+        and that cases out of day order are solved whole
+        """
+        read_end, write_end = os.pipe()
+        with os.fdopen(read_end, "rb") as reader, os.fdopen(write_end, "wb", buffering=0) as writer:
+            test_object = CaseHandler(reader)
+            results = test_object.solved_cases(streaming=True)
+            writer.write(b"2 10 20\n1 9 1 2\n2 10 9 1\n")
+            self.assertEqual(next(results), 40)
+            writer.write(b"2 10 20\n4 11 7 4\n3 2 1 2\n0 0 0\n")
+            self.assertEqual(next(results), 43)
+            self.assertEqual(list(results), [])
+        self.assertEqual(test_object.choices, {"LiChaoProfitSolver": 1, "HullProfitSolver": 1})
+
+if __name__ == '__main__':
+    unittest.main()
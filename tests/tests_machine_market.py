@@ -0,0 +1,52 @@
+import unittest
+from profit_maximizer.differential import DifferentialFuzzer
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.machine_market import MachineMarket
+from collections import Counter
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the MachineMarket answering many scenarios over the same machines
+    """
+
+    def solve(self, machines, cash_at_hand, restructuring_days):
+        """
+        Solves a single scenario from scratch with the HullProfitSolver
+        """
+        solver = HullProfitSolver([len(machines), cash_at_hand, restructuring_days], machines)
+        solver.solver()
+        return solver.maximum_profit
+
+    def test_query(self):
+        """
+        Checks the scenarios answered in batch against a solve per scenario, on random markets
+        """
+        generator = np.random.default_rng(14)
+        fuzzer = DifferentialFuzzer(maximum_machines=11, maximum_value=15)
+        for _ in range(50):
+            _, machines = fuzzer.generate_case(generator)
+            market = MachineMarket(machines)
+            market.counters = Counter()
+            scenarios = [(int(generator.integers(0, 60)), int(generator.integers(1, 16))) for _ in range(30)]
+            expected = [self.solve(machines, cash_at_hand, days) for cash_at_hand, days in scenarios]
+            self.assertEqual(market.query(scenarios), expected)
+            self.assertLessEqual(market.counters["passes"], len({cash_at_hand for cash_at_hand, _ in scenarios}))
+
+    def test_sweep(self):
+        """
+        Checks the profit-vs-cash curve of the assignment's first case
+        """
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        market = MachineMarket(machines)
+        cash_values = np.arange(0, 40)
+        expected = [self.solve(machines, int(cash_at_hand), 20) for cash_at_hand in cash_values]
+        self.assertEqual(market.sweep(cash_values, 20).tolist(), expected)
+        self.assertEqual(market.query([(10, 20)]), [44])
+        starts, gains = market.profit_curve(20)
+        self.assertEqual(gains, sorted(gains))
+        self.assertEqual(starts[0] + gains[0], self.solve(machines, 0, 20))
+
+if __name__ == '__main__':
+    unittest.main()
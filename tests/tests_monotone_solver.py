@@ -0,0 +1,51 @@
+import unittest
+from collections import Counter
+from profit_maximizer.case import Case
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.monotone_profit_solver import MonotoneProfitSolver
+from profit_maximizer.workload_generator import generate_case
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases of the deque solver of the cases with daily profits sorted by day
+    """
+
+    def test_monotone(self):
+        """
+        Checks the property is detected, machines of a same day being in any order
+        """
+        cases = [
+            ([3, 10, 20], [[1, 9, 1, 2], [2, 10, 9, 3], [2, 11, 7, 1]], False),
+            ([3, 10, 20], [[1, 9, 1, 2], [2, 10, 9, 4], [2, 11, 7, 2]], True),
+            ([3, 10, 20], [[1, 9, 1, 2], [1, 10, 9, 1], [3, 11, 7, 1]], False),
+            ([0, 10, 20], [], True),
+        ]
+        for case_context, machines, monotone in cases:
+            self.assertEqual(MonotoneProfitSolver(case_context, machines).is_monotone(), monotone)
+        solver = MonotoneProfitSolver([6, 10, 20], [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]])
+        solver.solver()
+        self.assertFalse(solver.monotone)
+        self.assertEqual(solver.maximum_profit, 44)
+
+    def test_against_hull_solver(self):
+        """
+        Checks the maximum profits match the HullProfitSolver, on monotone and fallback cases
+        """
+        generator = np.random.default_rng(24)
+        for distribution in ["monotone_profit", "hull_worst_case", "uniform"]:
+            for number_of_machines, restructuring_days, maximum_value in [(5, 10, 20), (200, 50, 100), (2000, None, 10**9)]:
+                case_context, machines = generate_case(generator, number_of_machines, distribution, restructuring_days, maximum_value)
+                case = Case.from_values(case_context, machines.reshape(-1))
+                solver, reference = MonotoneProfitSolver(case), HullProfitSolver(case)
+                solver.counters = Counter()
+                solver.solver()
+                reference.solver()
+                if distribution != "uniform":
+                    self.assertTrue(solver.monotone)
+                self.assertEqual(solver.maximum_profit, reference.maximum_profit)
+                self.assertGreater(solver.counters["queries"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+
+class FaultySolver(HullProfitSolver):
+    """
+    HullProfitSolver raising an error on the cases with 11 of cash at hand, and killing its worker
+    process on the cases with 12 of cash at hand
+    """
+    def solver(self):
+        if self.cash_at_hand == 11:
+            raise ValueError("faulty case")
+        if self.cash_at_hand == 12:
+            os._exit(1)
+        super().solver()
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on solving cases with worker processes
+    """
+
+    def test_case_order(self):
+        """
+        Checks the results of worker processes are returned in case order, parsing errors included
+        """
+        cases = [
+            "./tests/inputs/snapshot.txt",
+            "./tests/inputs/wrong_input_2.txt",
+            "./tests/inputs/wrong_input_3.txt"
+        ]
+        for case in cases:
+            test_object = CaseHandler(case, True)
+            expected = test_object.content_handler()
+            for workers in [1, 3]:
+                self.assertEqual(test_object.content_handler(workers=workers), expected)
+
+    def test_chunks(self):
+        """
+        Checks the results are in case order whatever the size of the chunks sent to the workers
+        """
+        test_object = CaseHandler("./tests/inputs/snapshot.txt", True, instrument=True)
+        expected = test_object.content_handler()
+        for chunk_size in [1, 4]:
+            test_object.CHUNK_SIZE = chunk_size
+            self.assertEqual(test_object.content_handler(workers=2), expected)
+            self.assertEqual(sum(test_object.choices.values()), len(expected))
+            self.assertEqual(len(test_object.stats), len(expected))
+
+    def test_faulty_cases(self):
+        """
+        Checks an error or the death of a worker process only affects the result of its own case,
+        and that the pool is rebuilt for the next cases
+        """
+        test_object = CaseHandler("./tests/inputs/input.txt", True, solver=FaultySolver)
+        self.assertEqual(test_object.content_handler(workers=2), [
+            44,
+            "Error in the case found while solving: ValueError('faulty case')",
+            "Error in the case found while solving: worker process died",
+            10,
+            39,
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.case_reader import CaseReader
+from profit_maximizer.differential import DifferentialFuzzer
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.li_chao_profit_solver import LiChaoProfitSolver
+from profit_maximizer.monotone_profit_solver import MonotoneProfitSolver
+from profit_maximizer.profit_solver import ProfitSolver
+from profit_maximizer.quadratic_profit_solver import QuadraticProfitSolver
+from profit_maximizer.recursive_profit_solver import RecursiveProfitSolver
+
+import numpy as np
+
+# Solvers recording the plan of a case
+SOLVERS = [ProfitSolver, RecursiveProfitSolver, HullProfitSolver, LiChaoProfitSolver, MonotoneProfitSolver]
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the plans recorded by the solvers and the CaseHandler
+    """
+
+    def replay(self, cash_at_hand, restructuring_days, plan):
+        """
+        Follows a plan day by day, checking each acquisition, and returns the cash at the end of the restructuring
+        """
+        owned = None
+        for machine in plan:
+            if owned is not None:
+                self.assertLess(owned[0], machine[0])
+                cash_at_hand += owned[2] + (machine[0]-owned[0]-1)*owned[3]
+            self.assertGreaterEqual(cash_at_hand, machine[1])
+            cash_at_hand -= machine[1]
+            owned = machine
+        if owned is not None:
+            cash_at_hand += owned[2] + (restructuring_days-owned[0])*owned[3]
+        return cash_at_hand
+
+    def test_assignment_input(self):
+        """
+        Checks the plan of the first case of the assignment
+        """
+        machines = [[6,12,1,3],[1,9,1,2],[3,2,1,2],[8,20,5,4],[4,11,7,4],[2,10,9,1]]
+        for solver in SOLVERS:
+            test_object = solver([6,10,20], machines, record_plan=True)
+            test_object.solver()
+            self.assertEqual(test_object.plan(), [[3,2,1,2],[6,12,1,3]])
+            self.assertEqual(self.replay(10, 20, test_object.plan()), 44)
+            self.assertIsNone(solver([6,10,20], machines).plan())
+
+    def test_random_cases(self):
+        """
+        Checks the plans reach the maximum profit of the HullProfitSolver on random cases
+        """
+        generator = np.random.default_rng(15)
+        fuzzer = DifferentialFuzzer(maximum_machines=6, maximum_value=12)
+        for _ in range(300):
+            case_context, machines = fuzzer.generate_case(generator)
+            _, cash_at_hand, restructuring_days = case_context
+            expected = HullProfitSolver(case_context, machines)
+            expected.solver()
+            for solver in SOLVERS:
+                test_object = solver(case_context, machines, record_plan=True)
+                test_object.solver()
+                self.assertEqual(test_object.maximum_profit, expected.maximum_profit)
+                self.assertEqual(self.replay(cash_at_hand, restructuring_days, test_object.plan()), expected.maximum_profit)
+
+    def test_case_handler(self):
+        """
+        Checks the plans recorded by the CaseHandler reach the result of each case, whatever the way the cases are solved
+        """
+        cases = list(CaseReader("./tests/inputs/snapshot.txt"))
+        for arguments in [{}, {"streaming": True}, {"workers": 1}]:
+            test_object = CaseHandler("./tests/inputs/snapshot.txt", plan=True)
+            results = list(test_object.solved_cases(**arguments))
+            self.assertEqual(len(test_object.plans), len(results))
+            for case, result, plan in zip(cases, results, test_object.plans):
+                self.assertEqual(self.replay(case.cash_at_hand, case.number_of_restructuring_days, plan), result)
+        with self.assertRaises(ValueError):
+            CaseHandler("./tests/inputs/snapshot.txt", solver=QuadraticProfitSolver, plan=True)
+
+if __name__ == '__main__':
+    unittest.main()
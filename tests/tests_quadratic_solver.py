@@ -0,0 +1,45 @@
+import unittest
+from profit_maximizer.case import Case
+from profit_maximizer.differential import DifferentialFuzzer
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.profit_solver import ProfitSolver
+from profit_maximizer.quadratic_profit_solver import QuadraticProfitSolver
+from profit_maximizer.workload_generator import generate_case
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases of the O(N**2) reference solver
+    """
+
+    def test_against_exhaustive_solver(self):
+        """
+        Checks the solver against the exhaustive ProfitSolver on small random cases
+        """
+        generator = np.random.default_rng(1)
+        fuzzer = DifferentialFuzzer(maximum_machines=6, maximum_value=20)
+        for _ in range(300):
+            case = Case.from_machines(*fuzzer.generate_case(generator))
+            expected = ProfitSolver(case)
+            expected.solver()
+            result = QuadraticProfitSolver(case)
+            result.solver()
+            self.assertEqual(result.maximum_profit, expected.maximum_profit)
+
+    def test_against_hull_solver(self):
+        """
+        Checks the solver against the HullProfitSolver on mid-size cases, including values
+        beyond the bounds of the instructions that do not fit int64 arithmetic
+        """
+        generator = np.random.default_rng(2)
+        for restructuring_days, maximum_value in [(10**9, 10**9), (100, 10**9), (10**12, 10**15)]:
+            case = Case.from_machines(*generate_case(generator, 2000, "uniform", restructuring_days, maximum_value))
+            expected = HullProfitSolver(case)
+            expected.solver()
+            result = QuadraticProfitSolver(case)
+            result.solver()
+            self.assertEqual(result.maximum_profit, expected.maximum_profit)
+
+if __name__ == '__main__':
+    unittest.main()
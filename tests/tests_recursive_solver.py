@@ -0,0 +1,45 @@
+import unittest
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.recursive_profit_solver import RecursiveProfitSolver
+from profit_maximizer.workload_generator import generate_case
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases of the iterative RecursiveProfitSolver
+    """
+
+    def test_against_hull_solver(self):
+        """
+        Checks the solver against the HullProfitSolver on random cases
+        """
+        generator = np.random.default_rng(3)
+        for _ in range(300):
+            restructuring_days = int(generator.choice([generator.integers(1, 15, endpoint=True), 10**9]))
+            maximum_value = int(generator.choice([20, 10**9]))
+            case_context, machines = generate_case(
+                generator, int(generator.integers(0, 40, endpoint=True)), "uniform", restructuring_days, maximum_value
+            )
+            machines = machines.tolist()
+            expected = HullProfitSolver(case_context, machines)
+            expected.solver()
+            result = RecursiveProfitSolver(case_context, machines)
+            result.solver()
+            self.assertEqual(result.maximum_profit, expected.maximum_profit, (case_context, machines))
+
+    def test_deep_chain(self):
+        """
+        Checks the solver on machines reached through chains of up to 10**4 switches, beyond the recursion limit
+        """
+        # Each machine is paid by the previous one after a single day of operation
+        machines = [[2*k-1, k, 1, k] for k in range(1, 10**4+1)]
+        case_context = [len(machines), 2, 2*10**4]
+        expected = HullProfitSolver(case_context, machines)
+        expected.solver()
+        result = RecursiveProfitSolver(case_context, machines)
+        result.solver()
+        self.assertEqual(result.maximum_profit, expected.maximum_profit)
+
+if __name__ == '__main__':
+    unittest.main()
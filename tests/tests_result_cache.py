@@ -0,0 +1,89 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.case import Case
+from profit_maximizer.result_cache import ResultCache
+from concurrent.futures import ProcessPoolExecutor
+
+import os
+import tempfile
+
+def fill_cache(filename, first, last):
+    """
+    Stores results from another process
+    """
+    with ResultCache(filename) as cache:
+        for i in range(first, last):
+            cache.put(i.to_bytes(16, "little"), i)
+            cache.flush()
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the persistent result cache
+    """
+
+    def test_key(self):
+        """
+        Checks cases differing only by their machine order or machines filtered by day share their key
+        """
+        machines = [[1,9,1,2],[2,10,9,1],[3,2,1,2],[3,11,7,4],[6,12,1,3],[8,20,5,4]]
+        key = ResultCache.key(Case.from_machines([6,10,20], machines))
+        self.assertEqual(ResultCache.key(Case.from_machines([6,10,20], machines[::-1])), key)
+        self.assertEqual(ResultCache.key(Case.from_machines([7,10,20], machines + [[21,1,0,1]])), key)
+        self.assertNotEqual(ResultCache.key(Case.from_machines([6,11,20], machines)), key)
+        self.assertNotEqual(ResultCache.key(Case.from_machines([6,10,20], machines[1:])), key)
+
+    def test_case_handler(self):
+        """
+        Checks repeated runs take the results from the cache, parsing errors and restricted solves excluded
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "cache.db")
+            for input_filename in ["./tests/inputs/snapshot.txt", "./tests/inputs/wrong_input_2.txt"]:
+                expected = CaseHandler(input_filename).content_handler()
+                solved = sum(not isinstance(result, str) for result in expected)
+                for hits in [0, solved]:
+                    with ResultCache(filename) as cache:
+                        test_object = CaseHandler(input_filename, cache=cache)
+                        self.assertEqual(test_object.content_handler(), expected)
+                        self.assertEqual(cache.statistics()["hits"], hits)
+                        self.assertEqual(cache.statistics()["misses"], solved - hits)
+                        test_object.content_handler(maximum_number_of_acquisitions=1)
+                        self.assertEqual(cache.statistics()["hits"], hits)
+            with ResultCache(filename) as cache:
+                test_object = CaseHandler("./tests/inputs/snapshot.txt", cache=cache, instrument=True)
+                self.assertEqual(test_object.content_handler(workers=2), CaseHandler("./tests/inputs/snapshot.txt").content_handler())
+                self.assertEqual({record["solver"] for record in test_object.stats}, {"ResultCache"})
+
+    def test_eviction(self):
+        """
+        Checks the least recently used results are evicted beyond the size limit, and large results kept exact
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with ResultCache(os.path.join(directory, "cache.db"), maximum_entries=2) as cache:
+                cache.put(b"a", 1)
+                cache.put(b"b", 2**70)
+                cache.flush()
+                self.assertEqual(cache.get(b"b"), 2**70)
+                cache.flush()
+                cache.put(b"c", 3)
+                cache.flush()
+                self.assertEqual(len(cache), 2)
+                self.assertIsNone(cache.get(b"a"))
+                self.assertEqual(cache.get(b"c"), 3)
+                self.assertEqual(cache.statistics(), {"hits": 2, "misses": 1, "entries": 2})
+
+    def test_concurrent_processes(self):
+        """
+        Checks processes writing to the same cache at the same time
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "cache.db")
+            ResultCache(filename).close()
+            with ProcessPoolExecutor(2) as executor:
+                list(executor.map(fill_cache, [filename]*4, [0, 50, 100, 150], [50, 100, 150, 200]))
+            with ResultCache(filename) as cache:
+                self.assertEqual(len(cache), 200)
+                self.assertEqual(cache.get((123).to_bytes(16, "little")), 123)
+
+if __name__ == '__main__':
+    unittest.main()
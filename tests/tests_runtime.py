@@ -1,7 +1,8 @@
 from contextlib import contextmanager
 from profit_maximizer import CaseHandler 
+from profit_maximizer.workload_generator import generate_case, write_text
 
-import random as rd
+import numpy as np
 import time
 import unittest
 
@@ -23,7 +24,7 @@ class TestSuite(unittest.TestCase):
     def generate_case(self, magnitude_order_machines):
         """
         Generates a test case in a .txt file with:
-            - 10**<magnitude_order_machines> randomly generated machines
+            - 1 to 10**<magnitude_order_machines> randomly generated machines
             - cash at hand randomly picked from 1 to 10**9
             - number of restructuring days randomly picked from 1 to 10**9
         inputs:
@@ -31,22 +32,9 @@ class TestSuite(unittest.TestCase):
         output:
             <out> :: None
         """
-        machine_number = rd.randint(0,10**magnitude_order_machines)
-        cash_at_hand = rd.randint(0,10**9)
-        restructuring_days = rd.randint(0,10**9)
-
-        with open("./tests/inputs/generated_input.txt", "w+") as f:
-            # Writes the context line
-            f.write(" ".join(list(map(str, [machine_number, cash_at_hand, restructuring_days, "\n"]))))  
-            # Writes <machine_number> randomly generated machines      
-            for _ in range(machine_number):
-                price = rd.randint(1, 10**9)
-                resell = rd.randint(1, price)
-                availability = rd.randint(1, restructuring_days)
-                profit = rd.randint(1, restructuring_days)
-                f.write(" ".join(list(map(str, [availability, price, resell, profit, "\n"]))))
-            # Writes the case closing line
-            f.write("0 0 0")
+        generator = np.random.default_rng()
+        machine_number = int(generator.integers(1, 10**magnitude_order_machines, endpoint=True))
+        write_text("./tests/inputs/generated_input.txt", [generate_case(generator, machine_number)])
 
     def test_generated_input(self):
         """
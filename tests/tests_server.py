@@ -0,0 +1,115 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.profit_maximizer import PARSING_ERROR
+from profit_maximizer.server import ProfitServer, TIMEOUT_ERROR, solve_micro_batch
+from profit_maximizer.workload_generator import generate_case
+
+import numpy as np
+
+class TestSuite(unittest.IsolatedAsyncioTestCase):
+    """
+    Test cases on the asyncio solving service
+    """
+
+    async def request(self, content, port=None, path=None):
+        """
+        Sends an input to the server and returns its answer
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(content)
+        writer.write_eof()
+        answer = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return answer.decode()
+
+    async def test_concurrent_connections(self):
+        """
+        Checks concurrent connections over TCP receive their results in case order, parsing errors included
+        """
+        server = ProfitServer(workers=1)
+        await server.start()
+        try:
+            port = server.sockets[0].getsockname()[1]
+            inputs = {}
+            for filename in ["./tests/inputs/input.txt", "./tests/inputs/snapshot.txt", "./tests/inputs/wrong_input_3.txt"]:
+                with open(filename, "rb") as f:
+                    inputs[filename] = f.read()
+            expected = {
+                "./tests/inputs/input.txt": [44, 11, 12, 10, 39],
+                "./tests/inputs/snapshot.txt": [44, 1116877054, 2353506445, 10, 5009, 9909, 10, 10, 11, 999999999999999999, 87, 200, 567, 87],
+                "./tests/inputs/wrong_input_3.txt": ["Error in the case found while parsing the machine descriptions", 11, 12, 10, 39],
+            }
+            filenames = list(inputs)*10
+            answers = await asyncio.gather(*(self.request(inputs[filename], port) for filename in filenames))
+            for filename, answer in zip(filenames, answers):
+                self.assertEqual(answer, "".join(f"Case {k}: {x}\n" for k, x in enumerate(expected[filename], 1)))
+            self.assertEqual(server.counters["cases"], 10*(5+14+5))
+            self.assertLess(server.counters["batches"], server.counters["cases"])
+        finally:
+            await server.close()
+
+    async def test_unix_socket_timeout(self):
+        """
+        Checks a Unix socket server, and the cases not solved before the timeout
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "server.sock")
+            server = ProfitServer(workers=1, timeout=0)
+            await server.start(path=path)
+            try:
+                answer = await self.request(b"1 10 10\n1 5 1 3\n0 0 0\n", path=path)
+                self.assertEqual(answer, f"Case 1: {TIMEOUT_ERROR}\n")
+                server.timeout = 10
+                answer = await self.request(b"1 10 10\n1 5 1 3\n", path=path)
+                self.assertEqual(answer, "Case 1: 33\n")
+            finally:
+                await server.close()
+
+    async def test_large_values_long_lines(self):
+        """
+        Checks small cases beyond the int64 range are solved exactly, and lines longer than the line
+        limit are answered with an error without closing the connection
+        """
+        server = ProfitServer(workers=1)
+        server.LINE_LIMIT = 64
+        await server.start()
+        try:
+            port = server.sockets[0].getsockname()[1]
+            content = (
+                b"1 10 1000000000\n1 5 3 10000000000\n"
+                + b"1"*200 + b"\n"
+                + b"2 10 10\n" + b"9"*300 + b"\n1 5 1 3\n"
+                + b"1 10 10\n1 5 1 3\n"
+            )
+            answer = await self.request(content, port)
+            expected = [9999999990000000008, PARSING_ERROR, PARSING_ERROR, 33]
+            self.assertEqual(answer, "".join(f"Case {k}: {x}\n" for k, x in enumerate(expected, 1)))
+        finally:
+            await server.close()
+
+    def test_micro_batch(self):
+        """
+        Checks the cases of a micro-batch are parsed and solved in the worker, each with its own result
+        """
+        case_context, machines = generate_case(np.random.default_rng(17), 200, "uniform", 10**6)
+        expected = HullProfitSolver(case_context, machines.tolist())
+        expected.solver()
+        cases = [
+            ([6, 10, 20], [b"6 12 1 3", b"1 9 1 2", b"3 2 1 2", b"8 20 5 4", b"4 11 7 4", b"2 10 9 1"]),
+            ([1, 10, 10], [b"1 5 -1 3"]),
+            (case_context, [" ".join(map(str, machine)).encode() for machine in machines.tolist()]),
+            ([1, 10, 1000000000], [b"1 5 3 10000000000"]),
+        ]
+        self.assertEqual(
+            solve_micro_batch(cases), [44, PARSING_ERROR, expected.maximum_profit, 9999999990000000008]
+        )
+
+if __name__ == '__main__':
+    unittest.main()
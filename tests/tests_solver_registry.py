@@ -0,0 +1,68 @@
+import unittest
+from profit_maximizer import CaseHandler
+from profit_maximizer.case import Case
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.li_chao_profit_solver import LiChaoProfitSolver
+from profit_maximizer.solver_registry import SOLVERS, choose_solver, register_solver, resolve_solver
+from profit_maximizer.workload_generator import generate_case, write_text
+
+import numpy as np
+import os
+import tempfile
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the solver registry and the auto policy of the CaseHandler
+    """
+
+    def test_registry(self):
+        """
+        Checks every registered solver, given by name or by class, solves the assignment input
+        """
+        for name, solver in SOLVERS.items():
+            for given in [name, solver]:
+                test_object = CaseHandler("./tests/inputs/input.txt", True, solver=given)
+                self.assertEqual(test_object.content_handler(), [44, 11, 12, 10, 39])
+                self.assertEqual(test_object.choices, {name: 5})
+        self.assertEqual(resolve_solver("auto"), "auto")
+        with self.assertRaises(ValueError):
+            CaseHandler("./tests/inputs/input.txt", solver="FastestSolver")
+
+        class FastestSolver(HullProfitSolver):
+            pass
+        register_solver(FastestSolver)
+        try:
+            test_object = CaseHandler("./tests/inputs/input.txt", True, solver="FastestSolver")
+            self.assertEqual(test_object.content_handler(), [44, 11, 12, 10, 39])
+        finally:
+            del SOLVERS["FastestSolver"]
+
+    def test_auto(self):
+        """
+        Checks the auto policy gives small, monotone and other cases of a same file to different solvers,
+        which all find the results of the HullProfitSolver, and records each choice
+        """
+        generator = np.random.default_rng(25)
+        self.assertIs(choose_solver(Case.build([1, 10, 10], [[1, 5, 1, 3]])), LiChaoProfitSolver)
+        cases = [
+            generate_case(generator, 10, "uniform", 100, 1000),
+            generate_case(generator, 40, "uniform", 100, 1000),
+            generate_case(generator, 500, "monotone_profit"),
+            generate_case(generator, 500, "uniform"),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "cases.txt")
+            write_text(filename, cases)
+            expected = CaseHandler(filename, solver="HullProfitSolver").content_handler()
+            test_object = CaseHandler(filename, True, instrument=True, prefilter=False)
+            self.assertEqual(test_object.content_handler(), expected)
+            self.assertEqual(test_object.choices, {"BatchProfitSolver": 2, "MonotoneProfitSolver": 1, "HullProfitSolver": 1})
+            self.assertEqual(
+                [record["solver"] for record in test_object.stats],
+                ["BatchProfitSolver", "BatchProfitSolver", "MonotoneProfitSolver", "HullProfitSolver"]
+            )
+            self.assertEqual(test_object.content_handler(workers=2), expected)
+            self.assertEqual(test_object.choices, {"BatchProfitSolver": 2, "MonotoneProfitSolver": 1, "HullProfitSolver": 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+from profit_maximizer.differential import DifferentialFuzzer
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.profit_solver import ProfitSolver
+from profit_maximizer.strategy_trie import StrategyTrie
+from collections import Counter
+
+import numpy as np
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the prefix trie of the strategies explored by the ProfitSolver
+    """
+
+    def test_eviction(self):
+        """
+        Checks evicted states are recomputed from their path
+        """
+        def step(state, machine):
+            return [state[0]+1, 0, state[2]+machine, 0]
+        trie = StrategyTrie([0, 0, 10, 0], max_cached_states=2)
+        first = trie.add(StrategyTrie.ROOT, 3, [1, 0, 13, 0])
+        second = trie.add(first, 5, [2, 0, 18, 0])
+        third = trie.add(second, 1, [3, 0, 19, 0])
+        self.assertEqual((len(trie), trie.evictions), (4, 1))
+        self.assertEqual(trie.path(third), [3, 5, 1])
+        self.assertEqual(trie.state(third, step), ([3, 0, 19, 0], True))
+        self.assertEqual(trie.state(first, step), ([1, 0, 13, 0], False))
+
+    def test_compact(self):
+        """
+        Checks the nodes that are not prefixes of the strategies left open are dropped, the others renumbered
+        """
+        def step(state, machine):
+            return [state[0]+1, 0, state[2]+machine, 0]
+        trie = StrategyTrie([0, 0, 10, 0], max_cached_states=3)
+        first = trie.add(StrategyTrie.ROOT, 3, [1, 0, 13, 0])
+        second = trie.add(StrategyTrie.ROOT, 4, [1, 0, 14, 0])
+        third = trie.add(first, 5, [2, 0, 18, 0])
+        fourth = trie.add(second, 1, [2, 0, 15, 0])
+        fifth = trie.add(first, 2, [2, 0, 15, 0])
+        nodes = trie.compact([third, fifth])
+        self.assertEqual((len(trie), trie.dropped_nodes), (4, 2))
+        self.assertEqual([trie.path(node) for node in nodes], [[3, 5], [3, 2]])
+        self.assertEqual([trie.state(node, step) for node in nodes], [([2, 0, 18, 0], True), ([2, 0, 15, 0], True)])
+        self.assertEqual(list(trie.states), [2, 3])
+
+    def test_state_budget(self):
+        """
+        Checks the ProfitSolver finds the maximum profit and its plan whatever its budget of cached states
+        """
+        generator = np.random.default_rng(21)
+        fuzzer = DifferentialFuzzer(maximum_machines=9, maximum_value=30)
+        counters = Counter()
+        dropped_nodes = 0
+        for _ in range(100):
+            case_context, machines = fuzzer.generate_case(generator)
+            expected = HullProfitSolver(case_context, machines)
+            expected.solver()
+            for max_cached_states in [None, 1, 4]:
+                test_object = ProfitSolver(case_context, machines, record_plan=True, max_cached_states=max_cached_states)
+                test_object.counters = counters
+                test_object.solver()
+                self.assertEqual(test_object.maximum_profit, expected.maximum_profit)
+                if max_cached_states is not None:
+                    self.assertLessEqual(len(test_object.memory.states), max_cached_states)
+                dropped_nodes += test_object.memory.dropped_nodes
+        self.assertGreater(counters["recomputed_states"], 0)
+        self.assertGreater(dropped_nodes, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from profit_maximizer.binary_case_file import BinaryCaseFile
+from profit_maximizer.case_reader import CaseReader
+from profit_maximizer.hull_profit_solver import HullProfitSolver
+from profit_maximizer.workload_generator import DISTRIBUTIONS, generate_case, generate_cases, is_valid, write_binary, write_text
+
+import numpy as np
+import os
+import tempfile
+
+class TestSuite(unittest.TestCase):
+    """
+    Test cases on the synthetic workload generator
+    """
+
+    def test_distributions(self):
+        """
+        Checks every distribution follows the constraints of the instructions, for small and large values
+        """
+        generator = np.random.default_rng(23)
+        for distribution in DISTRIBUTIONS:
+            for number_of_machines, restructuring_days, maximum_value in [(1, 1, 2), (50, 3, 10), (10**4, None, 10**9)]:
+                case_context, machines = generate_case(generator, number_of_machines, distribution, restructuring_days, maximum_value)
+                self.assertEqual(machines.shape, (number_of_machines, 4))
+                self.assertTrue(is_valid(case_context, machines), distribution)
+        # The profits of the monotone distribution grow with the day
+        _, machines = generate_case(generator, 1000, "monotone_profit")
+        machines = machines[np.lexsort((machines[:, 3], machines[:, 0]))]
+        self.assertTrue(np.all(np.diff(machines[:, 3]) >= 0))
+        self.assertFalse(is_valid([2, 10, 10], [[1, 5, 5, 1], [1, 5, 4, 1]]))
+        with self.assertRaises(ValueError):
+            generate_case(generator, 10, "unknown")
+
+    def test_write(self):
+        """
+        Checks the text and binary files written read back as the generated cases, identical for a seed
+        """
+        cases = list(generate_cases(5, 3, 200, "clustered_days"))
+        again = list(generate_cases(5, 3, 200, "clustered_days"))
+        self.assertTrue(all(np.array_equal(a[1], b[1]) and a[0] == b[0] for a, b in zip(cases, again)))
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "cases.txt")
+            binary_filename = os.path.join(directory, "cases.bin")
+            self.assertEqual(write_text(filename, cases), 3)
+            self.assertEqual(write_binary(binary_filename, cases), 3)
+            read_cases = list(CaseReader(filename))
+            self.assertEqual([case.case_context for case in read_cases], [case_context for case_context, _ in cases])
+            for case, (_, machines) in zip(read_cases, cases):
+                self.assertEqual(sorted(case.machines()), sorted(machines.tolist()))
+            binary_cases = list(BinaryCaseFile(binary_filename))
+            for case, binary_case in zip(read_cases, binary_cases):
+                self.assertEqual(case.case_context, binary_case.case_context)
+                self.assertEqual(sorted(case.machines()), sorted(binary_case.machines()))
+                text_solver, binary_solver = HullProfitSolver(case), HullProfitSolver(binary_case)
+                text_solver.solver()
+                binary_solver.solver()
+                self.assertEqual(text_solver.maximum_profit, binary_solver.maximum_profit)
+
+if __name__ == '__main__':
+    unittest.main()